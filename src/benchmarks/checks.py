@@ -0,0 +1,146 @@
+import os
+import tempfile
+import pandas as pd
+from typing import Dict
+
+from benchmarks.corpus import location_coordinates
+from benchmarks.stubs import StubGeolocator, StubNominatimServer
+from job_match.geocoding_client import ConcurrentGeocoder
+from job_match.job_gps_coordinates import GpsFinder
+from utils import tracing
+
+
+def check_geocoding_client(
+    rate_limit: float = 20.0,
+    max_workers: int = 4,
+    latency: float = 0.05,
+    n_locations: int = 40,
+    tolerance: float = 0.1,
+) -> Dict[str, float]:
+    """
+    Checks ConcurrentGeocoder against the stub geocoder: requests never exceed
+    the token-bucket rate nor the number of workers, and slow requests overlap.
+
+    Args:
+        rate_limit (float): Requests per second allowed by the client.
+        max_workers (int): Concurrent requests allowed by the client.
+        latency (float): Duration of each stub request, in seconds.
+        n_locations (int): Number of distinct locations resolved.
+        tolerance (float): Relative excess over the rate limit tolerated (timer jitter).
+
+    Returns:
+        Dict[str, float]: Observed request rate and maximum concurrency.
+    """
+    locations = [f"Location {i}" for i in range(n_locations)]
+    geolocator = StubGeolocator(
+        {location: (float(i), float(i)) for i, location in enumerate(locations)},
+        latency=latency,
+    )
+    client = ConcurrentGeocoder(
+        geolocator.geocode,
+        max_workers=max_workers,
+        rate_limit=rate_limit,
+        time_budget=60.0,
+    )
+    results = client.resolve(locations)
+
+    assert len(results) == n_locations, f"{len(results)}/{n_locations} resolved"
+    assert geolocator.requests == n_locations, f"{geolocator.requests} requests"
+    times = sorted(geolocator.request_times)
+    # The bucket starts with one token: n requests need (n - 1) refills.
+    rate = (n_locations - 1) / (times[-1] - times[0])
+    assert rate <= rate_limit * (1 + tolerance), f"{rate:.1f} requests/s"
+    assert geolocator.max_in_flight <= max_workers, geolocator.max_in_flight
+    # At 20 requests/s, 50 ms requests overlap: the workers are used.
+    assert geolocator.max_in_flight > 1, "requests were not concurrent"
+    return {"requests_per_s": rate, "max_in_flight": geolocator.max_in_flight}
+
+
+def check_geocoding_cache(data: pd.DataFrame) -> Dict[str, float]:
+    """
+    Checks that GpsFinder geocodes each unique location once, and answers a
+    second run entirely from its persistent cache.
+
+    Args:
+        data (pd.DataFrame): Listings from generate_corpus.
+
+    Returns:
+        Dict[str, float]: Requests of the cold run and cache hits of the warm run.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        cache_path = os.path.join(directory, "geocoding.sqlite")
+        geolocator = StubGeolocator(location_coordinates())
+        hits = []
+        for _ in ("cold", "warm"):
+            tracing.tracer.reset()
+            finder = GpsFinder(
+                data.copy(),
+                cache_path=cache_path,
+                rate_limit=1000.0,
+                geolocator=geolocator,
+            )
+            finder.get_job_with_coordinates()
+            finder.cache.close()
+            hits.append(tracing.tracer.counters.get("geocode_cache_hits", 0))
+        tracing.tracer.reset()
+
+    n_unique = GpsFinder.clean_locations(data["job_location"]).nunique()
+    assert geolocator.requests == n_unique, f"{geolocator.requests} requests"
+    assert hits == [0, n_unique], f"cache hits per run: {hits}"
+    return {"cold_requests": geolocator.requests, "warm_cache_hits": hits[1]}
+
+
+def check_http_geocoder() -> Dict[str, float]:
+    """
+    Checks GpsFinder's Nominatim client against a local HTTP geocoder, through
+    geocoder_domain and geocoder_scheme: transient errors (503) are retried,
+    invalid queries (400) are not, and unknown locations are cached as not found.
+
+    Returns:
+        Dict[str, float]: Requests received per location.
+    """
+    coordinates = {"Paris": (48.8566, 2.3522), "Lyon": (45.764, 4.8357)}
+    failures = {"Lyon": [503], "Invalid": [400]}
+    with StubNominatimServer(coordinates, failures) as server:
+        tracing.tracer.reset()
+        finder = GpsFinder(
+            pd.DataFrame(),
+            rate_limit=1000.0,
+            geocoder_domain=server.domain,
+            geocoder_scheme="http",
+        )
+        results = finder.resolve_locations(["Paris", "Lyon", "Invalid", "Atlantis"])
+        cached = finder.cache.get_many(["Atlantis", "Invalid"])
+        finder.cache.close()
+        tracing.tracer.reset()
+
+    assert results == {
+        "Paris": coordinates["Paris"],
+        "Lyon": coordinates["Lyon"],
+        "Atlantis": None,
+    }, f"results: {results}"
+    assert server.requests == {
+        "Paris": 1,
+        "Lyon": 2,
+        "Invalid": 1,
+        "Atlantis": 1,
+    }, f"requests: {server.requests}"
+    assert cached == {"Atlantis": None}, f"cached: {cached}"
+    return {f"{query}_requests": count for query, count in server.requests.items()}
+
+
+def run_checks(data: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+    """
+    Runs every check, raising AssertionError on the first failure.
+
+    Args:
+        data (pd.DataFrame): Listings from generate_corpus.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Measurements per check.
+    """
+    return {
+        "geocoding_client": check_geocoding_client(),
+        "geocoding_cache": check_geocoding_cache(data),
+        "http_geocoder": check_http_geocoder(),
+    }
@@ -0,0 +1,202 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from utils.job_dataset import JobDataset
+
+# Search location, job locations as LinkedIn writes them, and their coordinates.
+LOCATIONS: List[Tuple[str, str, float, float]] = [
+    ("France", "Paris, Île-de-France, France", 48.8566, 2.3522),
+    ("France", "Lyon, Auvergne-Rhône-Alpes, France", 45.7640, 4.8357),
+    ("France", "Toulouse, Occitanie, France", 43.6047, 1.4442),
+    ("France", "Greater Paris Metropolitan Region", 48.8566, 2.3522),
+    ("Germany", "Berlin, Berlin, Germany", 52.5200, 13.4050),
+    ("Germany", "München, Bayern, Deutschland", 48.1351, 11.5820),
+    ("Germany", "Hamburg, Germany", 53.5511, 9.9937),
+    ("Switzerland", "Zürich, Zurich, Switzerland", 47.3769, 8.5417),
+    ("Switzerland", "Geneva, Switzerland", 46.2044, 6.1432),
+    ("Italy", "Milano, Lombardia, Italia", 45.4642, 9.1900),
+    ("Italy", "Rome, Latium, Italy", 41.9028, 12.4964),
+    ("Belgium", "Brussels, Brussels Region, Belgium", 50.8503, 4.3517),
+    ("Luxembourg", "Luxembourg, Luxembourg", 49.6116, 6.1319),
+    ("Spain", "Madrid, Community of Madrid, Spain", 40.4168, -3.7038),
+]
+
+# Suffixes LinkedIn appends to locations, removed before geocoding.
+WORKPLACE_SUFFIXES = ["", "", "", " (Hybrid)", " (On-site)", " (Remote)"]
+
+TITLES = [
+    "Data Scientist",
+    "Senior Data Scientist",
+    "Machine Learning Engineer",
+    "Data Engineer",
+    "Data Analyst",
+    "MLOps Engineer",
+    "Quantitative Analyst",
+    "Business Intelligence Developer",
+    "Software Engineer",
+    "AI Research Scientist",
+]
+
+COMPANY_PREFIXES = ["Data", "Quant", "Neo", "Blue", "Alpha", "Euro", "Smart", "Open"]
+COMPANY_SUFFIXES = ["Labs", "Analytics", "Systems", "Bank", "Insurance", "AI", "Group"]
+
+# Sentence pools per language; descriptions mix several sentences of one language.
+SENTENCES: Dict[str, List[str]] = {
+    "en": [
+        "We are looking for a {title} to join our growing team.",
+        "You will build machine learning models and deploy them to production.",
+        "Strong skills in Python, SQL and statistics are required.",
+        "Experience with PyTorch, TensorFlow or Scikit-learn is a plus.",
+        "You will work closely with product managers and engineers.",
+        "We offer a hybrid work model and a competitive salary.",
+        "At least {years} years of experience in a similar role.",
+        "Knowledge of cloud platforms such as AWS or GCP is appreciated.",
+    ],
+    "fr": [
+        "Nous recherchons un {title} pour rejoindre notre équipe.",
+        "Vous développerez des modèles de machine learning et les mettrez en production.",
+        "Une bonne maîtrise de Python, SQL et des statistiques est indispensable.",
+        "Une expérience avec PyTorch, TensorFlow ou Scikit-learn est un plus.",
+        "Vous travaillerez en étroite collaboration avec les équipes produit.",
+        "Nous proposons le télétravail partiel et une rémunération attractive.",
+        "Vous justifiez d'au moins {years} ans d'expérience sur un poste similaire.",
+        "La connaissance des plateformes cloud comme AWS ou GCP est appréciée.",
+    ],
+    "de": [
+        "Wir suchen einen {title} zur Verstärkung unseres Teams.",
+        "Sie entwickeln Machine-Learning-Modelle und bringen sie in Produktion.",
+        "Sehr gute Kenntnisse in Python, SQL und Statistik sind erforderlich.",
+        "Erfahrung mit PyTorch, TensorFlow oder Scikit-learn ist von Vorteil.",
+        "Sie arbeiten eng mit Produktmanagern und Entwicklern zusammen.",
+        "Wir bieten flexible Arbeitszeiten und ein attraktives Gehalt.",
+        "Mindestens {years} Jahre Berufserfahrung in einer vergleichbaren Position.",
+        "Kenntnisse von Cloud-Plattformen wie AWS oder GCP sind wünschenswert.",
+    ],
+    "it": [
+        "Cerchiamo un {title} da inserire nel nostro team.",
+        "Svilupperai modelli di machine learning e li porterai in produzione.",
+        "È richiesta una solida conoscenza di Python, SQL e statistica.",
+        "L'esperienza con PyTorch, TensorFlow o Scikit-learn è un plus.",
+        "Lavorerai a stretto contatto con i product manager e gli sviluppatori.",
+        "Offriamo lavoro ibrido e una retribuzione competitiva.",
+        "Almeno {years} anni di esperienza in un ruolo simile.",
+        "La conoscenza di piattaforme cloud come AWS o GCP è gradita.",
+    ],
+    "es": [
+        "Buscamos un {title} para unirse a nuestro equipo.",
+        "Desarrollarás modelos de machine learning y los pondrás en producción.",
+        "Se requieren conocimientos sólidos de Python, SQL y estadística.",
+        "La experiencia con PyTorch, TensorFlow o Scikit-learn es un plus.",
+        "Trabajarás estrechamente con los equipos de producto e ingeniería.",
+        "Ofrecemos trabajo híbrido y un salario competitivo.",
+        "Al menos {years} años de experiencia en un puesto similar.",
+        "Se valorará el conocimiento de plataformas cloud como AWS o GCP.",
+    ],
+}
+
+# Share of postings per language, roughly as scraped for the default searches.
+LANGUAGE_WEIGHTS = {"en": 0.55, "fr": 0.2, "de": 0.12, "it": 0.08, "es": 0.05}
+
+
+def location_coordinates() -> Dict[str, Tuple[float, float]]:
+    """
+    Coordinates of the generated job locations, as returned by a geocoder.
+
+    Returns:
+        Dict[str, Tuple[float, float]]: (latitude, longitude) per cleaned job location.
+    """
+    return {location: (lat, lon) for _, location, lat, lon in LOCATIONS}
+
+
+def generate_corpus(
+    n_rows: int,
+    seed: int = 0,
+    sentences_per_job: int = 5,
+    duplicate_share: float = 0.05,
+) -> pd.DataFrame:
+    """
+    Generate synthetic multilingual job listings in the scraped schema.
+
+    The corpus is deterministic for a given seed. A share of the postings are
+    exact reposts of earlier ones (same title, company and description under
+    another job ID), as found when several searches return the same job.
+
+    Args:
+        n_rows (int): Number of job listings.
+        seed (int): Seed of the random generator.
+        sentences_per_job (int): Number of sentences of each job description.
+        duplicate_share (float): Share of listings reposting an earlier listing.
+
+    Returns:
+        pd.DataFrame: Listings with the columns written by the scraper, and their "search_location".
+    """
+    rng = np.random.default_rng(seed)
+    languages = list(LANGUAGE_WEIGHTS)
+    language_ids = rng.choice(
+        len(languages), size=n_rows, p=list(LANGUAGE_WEIGHTS.values())
+    )
+    title_ids = rng.integers(len(TITLES), size=n_rows)
+    location_ids = rng.integers(len(LOCATIONS), size=n_rows)
+    suffix_ids = rng.integers(len(WORKPLACE_SUFFIXES), size=n_rows)
+    company_ids = rng.integers(
+        len(COMPANY_PREFIXES) * len(COMPANY_SUFFIXES), size=n_rows
+    )
+    years = rng.integers(1, 8, size=n_rows)
+    sentence_ids = rng.integers(len(SENTENCES["en"]), size=(n_rows, sentences_per_job))
+
+    titles = [TITLES[i] for i in title_ids]
+    descriptions = [
+        " ".join(SENTENCES[languages[language]][i] for i in sentence_ids[row]).format(
+            title=titles[row], years=years[row]
+        )
+        for row, language in enumerate(language_ids)
+    ]
+    companies = [
+        f"{COMPANY_PREFIXES[i % len(COMPANY_PREFIXES)]} "
+        f"{COMPANY_SUFFIXES[i // len(COMPANY_PREFIXES)]}"
+        for i in company_ids
+    ]
+    data = pd.DataFrame(
+        {
+            "job_title": titles,
+            "company_name": companies,
+            "job_location": [
+                LOCATIONS[i][1] + WORKPLACE_SUFFIXES[j]
+                for i, j in zip(location_ids, suffix_ids)
+            ],
+            "job_url": [
+                f"https://www.linkedin.com/jobs/view/{4_000_000_000 + i}/"
+                for i in range(n_rows)
+            ],
+            "job_description": descriptions,
+            "search_location": [LOCATIONS[i][0] for i in location_ids],
+        }
+    )
+
+    reposts = np.flatnonzero(rng.random(n_rows) < duplicate_share)
+    reposts = reposts[reposts > 0]
+    if len(reposts):
+        originals = (rng.random(len(reposts)) * reposts).astype(int)
+        columns = ["job_title", "company_name", "job_description"]
+        data.loc[reposts, columns] = data.loc[originals, columns].to_numpy()
+    return data
+
+
+def write_corpus(
+    data: pd.DataFrame, dataset_root: str, written_at: Optional[datetime] = None
+) -> List[str]:
+    """
+    Write generated listings to a job dataset, one file per search location, as
+    a scraping run would.
+
+    Args:
+        data (pd.DataFrame): Listings from generate_corpus.
+        dataset_root (str): Root directory of the job dataset.
+        written_at (Optional[datetime]): Time of the simulated scrape (default: now).
+
+    Returns:
+        List[str]: Paths of the written files.
+    """
+    return JobDataset(dataset_root).write(data, written_at=written_at)
@@ -0,0 +1,204 @@
+import json
+import threading
+import time
+import zlib
+import numpy as np
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+class HashingEncoder:
+    def __init__(self, dim: int = 64, seed: int = 0):
+        """
+        Small offline stand-in for a SentenceTransformer: a text embedding is the
+        sum of fixed random vectors of its lowercased words, hashed into a table.
+
+        Texts sharing words get similar embeddings, so rankings stay meaningful,
+        and no model is downloaded.
+
+        Args:
+            dim (int): Embedding dimension.
+            seed (int): Seed of the word vectors.
+        """
+        self.dim = dim
+        self.table = (
+            np.random.default_rng(seed)
+            .standard_normal((1 << 16, dim))
+            .astype(np.float32)
+        )
+        self._word_rows: Dict[str, int] = {}
+        self.texts_encoded = 0
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dim
+
+    def _row(self, word: str) -> int:
+        row = self._word_rows.get(word)
+        if row is None:
+            row = zlib.crc32(word.encode("utf-8")) & 0xFFFF
+            self._word_rows[word] = row
+        return row
+
+    def encode(self, texts: List[str], batch_size: int = 32, **kwargs) -> np.ndarray:
+        """
+        Encode texts, with SentenceTransformer.encode's calling convention.
+
+        Args:
+            texts (List[str]): Texts to encode.
+            batch_size (int): Ignored, texts are encoded at once.
+
+        Returns:
+            np.ndarray: Embeddings, one row per text.
+        """
+        rows, starts = [], []
+        for text in texts:
+            starts.append(len(rows))
+            rows.extend(self._row(word) for word in str(text).lower().split())
+            # Empty texts still get a (constant) vector.
+            rows.append(0)
+        self.texts_encoded += len(texts)
+        if not texts:
+            return np.empty((0, self.dim), dtype=np.float32)
+        return np.add.reduceat(self.table[rows], starts, axis=0)
+
+
+class StubLocation(NamedTuple):
+    latitude: float
+    longitude: float
+
+
+class StubGeolocator:
+    def __init__(
+        self, coordinates: Dict[str, Tuple[float, float]], latency: float = 0.0
+    ):
+        """
+        Offline geocoder answering from a fixed table, with a simulated request
+        latency. It records when each request starts and how many run at once,
+        to check the rate limit and the concurrency of its clients.
+
+        Args:
+            coordinates (Dict[str, Tuple[float, float]]): (latitude, longitude) per known location.
+            latency (float): Duration of each request, in seconds.
+        """
+        self.coordinates = coordinates
+        self.latency = latency
+        self.requests = 0
+        self.request_times: List[float] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def geocode(
+        self, query: str, timeout: Optional[float] = None
+    ) -> Optional[StubLocation]:
+        """
+        Geocode a location, with geopy's calling convention.
+
+        Args:
+            query (str): The location.
+            timeout (Optional[float]): Ignored.
+
+        Returns:
+            Optional[StubLocation]: The coordinates, None for unknown locations.
+        """
+        with self._lock:
+            self.requests += 1
+            self.request_times.append(time.monotonic())
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        coordinates = self.coordinates.get(query)
+        return StubLocation(*coordinates) if coordinates else None
+
+
+class StubNominatimServer:
+    def __init__(
+        self,
+        coordinates: Dict[str, Tuple[float, float]],
+        failures: Optional[Dict[str, List[int]]] = None,
+    ):
+        """
+        Local HTTP geocoder answering Nominatim's /search endpoint from a fixed
+        table, so that geopy's Nominatim client can be pointed at it with
+        domain="127.0.0.1:<port>" and scheme="http".
+
+        Args:
+            coordinates (Dict[str, Tuple[float, float]]): (latitude, longitude) per known location.
+            failures (Optional[Dict[str, List[int]]]): HTTP error statuses answered, in order, to the first requests of a location (e.g. {"Paris": [503]}).
+        """
+        self.coordinates = coordinates
+        self.failures = {
+            query: list(codes) for query, codes in (failures or {}).items()
+        }
+        self.requests: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def domain(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def _answer(self, query: str) -> Tuple[int, list]:
+        with self._lock:
+            self.requests[query] = self.requests.get(query, 0) + 1
+            codes = self.failures.get(query)
+            if codes:
+                return codes.pop(0), []
+        coordinates = self.coordinates.get(query)
+        if coordinates is None:
+            return 200, []
+        latitude, longitude = coordinates
+        return 200, [
+            {
+                "place_id": 1,
+                "lat": str(latitude),
+                "lon": str(longitude),
+                "display_name": query,
+            }
+        ]
+
+    def start(self) -> "StubNominatimServer":
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path != "/search":
+                    self.send_error(404)
+                    return
+                query = parse_qs(url.query).get("q", [""])[0]
+                status, body = stub._answer(query)
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StubNominatimServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,305 @@
+import os
+import platform
+import statistics
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.corpus import generate_corpus, location_coordinates
+from benchmarks.stubs import HashingEncoder, StubGeolocator
+from job_match.job_gps_coordinates import GpsFinder
+from job_match.job_match import JobsMatcherCV
+from job_match import utils as language_utils
+from streamlit_dashboard.utils.page_data import (
+    SIMILARITY_COLUMNS,
+    map_markers,
+    table_html,
+)
+from streamlit_dashboard.utils.utils_filter import (
+    apply_normalization,
+    create_filters,
+    filter_data,
+)
+from utils import tracing
+
+CV_TEXT = (
+    "Data Scientist with 3 years of experience in machine learning, statistical "
+    "modeling and finance. Python, SQL, PyTorch and Streamlit dashboards."
+)
+PREFERENCES = {
+    "skills": "Python, SQL, PyTorch, Scikit-learn, AWS",
+    "title": "Data Scientist, Machine Learning Engineer",
+    "location": "France, Germany, Switzerland",
+    "language": "French, English",
+    "experience": "2-3 years experience, Junior",
+}
+
+
+class PhaseTimer:
+    def __init__(self):
+        """
+        Collects the durations of the named phases of a benchmark, over its runs.
+        """
+        self.durations: Dict[str, List[float]] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Times the block as one run of a phase.
+
+        Args:
+            name (str): Name of the phase.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, duration: float) -> None:
+        """
+        Records one run of a phase timed elsewhere (e.g. by a tracing span).
+
+        Args:
+            name (str): Name of the phase.
+            duration (float): Duration of the run, in seconds.
+        """
+        self.durations.setdefault(name, []).append(duration)
+
+
+def run_benchmark(
+    run_once: Callable[[PhaseTimer], None], rows: int, repeat: int = 3
+) -> Dict[str, Dict]:
+    """
+    Runs a benchmark several times and summarizes each of its phases.
+
+    Args:
+        run_once (Callable[[PhaseTimer], None]): One run, timing its phases with the timer.
+        rows (int): Number of job listings processed per run.
+        repeat (int): Number of runs.
+
+    Returns:
+        Dict[str, Dict]: Per phase, the median and minimum duration (s) and the throughput (rows/s).
+    """
+    timer = PhaseTimer()
+    for _ in range(repeat):
+        run_once(timer)
+    summary = {}
+    for name, durations in timer.durations.items():
+        median = statistics.median(durations)
+        summary[name] = {
+            "median_s": median,
+            "min_s": min(durations),
+            "runs": len(durations),
+            "rows": rows,
+            "rows_per_s": rows / median if median > 0 else None,
+        }
+    return summary
+
+
+# Phases of JobsMatcherCV.rank_jobs and the tracing spans timing them. Spans
+# nest: encode_jobs includes loading and language detection.
+RANK_JOBS_PHASES = {
+    "load": "matcher.load",
+    "detect_languages": "matcher.detect_languages",
+    "encode_jobs": "matcher.encode_jobs",
+    "encode_queries": "matcher.encode_queries",
+    "score": "matcher.score",
+    "select": "matcher.select",
+}
+
+
+def bench_rank_jobs(data: pd.DataFrame, dim: int = 64, top_n: int = 1000):
+    """
+    JobsMatcherCV.rank_jobs with the offline hashing encoder and no embedding
+    cache: a cold ranking on a new matcher, broken down into phases by the
+    tracing spans of rank_jobs itself, and a complete ranking on the warm
+    matcher. Every run starts with an empty language memo.
+    """
+
+    def run_once(timer: PhaseTimer) -> None:
+        matcher = JobsMatcherCV(
+            data, model_name=f"stub-hashing-{dim}", encoder=HashingEncoder(dim)
+        )
+        language_utils.clear_language_memo()
+        tracing.tracer.reset()
+        with timer.phase("rank_jobs_cold"):
+            matcher.rank_jobs(CV_TEXT, PREFERENCES, top_n=top_n)
+        spans = tracing.tracer.report()["spans"]
+        for phase, span_name in RANK_JOBS_PHASES.items():
+            timer.record(
+                phase, spans[span_name]["wall_s"] if span_name in spans else 0.0
+            )
+        tracing.tracer.reset()
+        with timer.phase("rank_jobs_warm"):
+            matcher.rank_jobs(CV_TEXT, PREFERENCES, top_n=top_n)
+
+    return run_once
+
+
+def bench_gps_finder(data: pd.DataFrame, latency: float = 0.001):
+    """
+    GpsFinder against the stub geocoder: a cold run geocodes every unique
+    location, a warm run answers them from the persistent cache.
+    """
+
+    def run_once(timer: PhaseTimer) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache_path = os.path.join(directory, "geocoding.sqlite")
+            geolocator = StubGeolocator(location_coordinates(), latency=latency)
+            for phase in ("cold", "warm"):
+                finder = GpsFinder(
+                    data.copy(),
+                    cache_path=cache_path,
+                    rate_limit=1000.0,
+                    geolocator=geolocator,
+                )
+                with timer.phase(phase):
+                    finder.get_job_with_coordinates()
+                finder.cache.close()
+
+    return run_once
+
+
+def ranked_jobs_frame(data: pd.DataFrame, seed: int = 0) -> pd.DataFrame:
+    """
+    Dashboard data for the given listings: random similarity scores in [-1, 1]
+    and the coordinates of their location.
+
+    Args:
+        data (pd.DataFrame): Listings from generate_corpus.
+        seed (int): Seed of the scores.
+
+    Returns:
+        pd.DataFrame: Listings as written to data_streamlit.parquet.
+    """
+    rng = np.random.default_rng(seed)
+    ranked = data.copy()
+    for column in SIMILARITY_COLUMNS:
+        ranked[column] = rng.uniform(-1, 1, size=len(ranked))
+    locations = GpsFinder.clean_locations(ranked["job_location"])
+    coordinates = location_coordinates()
+    ranked["latitude"] = locations.map(lambda location: coordinates[location][0])
+    ranked["longitude"] = locations.map(lambda location: coordinates[location][1])
+    return ranked
+
+
+def bench_dashboard(ranked: pd.DataFrame):
+    """
+    Data preparation of the Streamlit pages: score normalization, slider bounds,
+    filter_data with a typical sidebar input, and the map and table rendering prep.
+    """
+
+    def run_once(timer: PhaseTimer) -> None:
+        with timer.phase("normalize"):
+            data = apply_normalization(ranked.copy(), SIMILARITY_COLUMNS)
+        with timer.phase("slider_bounds"):
+            min_max_values = create_filters(data, SIMILARITY_COLUMNS)
+        # Sliders narrowed to the middle 80% of every score.
+        filters = {
+            column: (low + 0.1 * (high - low), high - 0.1 * (high - low))
+            for column, (low, high) in min_max_values.items()
+        }
+        with timer.phase("filter_data"):
+            filtered = filter_data(
+                data.copy(), filters, "data", "", "france", "overall_similarity"
+            )
+        with timer.phase("map_markers"):
+            map_markers(filtered)
+        with timer.phase("table_html"):
+            table_html(filtered)
+
+    return run_once
+
+
+def run_suite(
+    sizes: List[int],
+    repeat: int = 3,
+    seed: int = 0,
+    benchmarks: Optional[List[str]] = None,
+) -> Dict:
+    """
+    Runs the benchmarks on synthetic corpora of several sizes.
+
+    Args:
+        sizes (List[int]): Numbers of job listings of the corpora.
+        repeat (int): Number of runs per benchmark.
+        seed (int): Seed of the corpora.
+        benchmarks (Optional[List[str]]): Benchmarks to run among "rank_jobs", "gps_finder" and "dashboard", all if None.
+
+    Returns:
+        Dict: Run metadata ("meta") and results keyed by "<rows>/<benchmark>/<phase>" ("results").
+    """
+    benchmarks = benchmarks or ["rank_jobs", "gps_finder", "dashboard"]
+    results = {}
+    for size in sizes:
+        data = generate_corpus(size, seed=seed)
+        runs = {
+            "rank_jobs": lambda: bench_rank_jobs(data),
+            "gps_finder": lambda: bench_gps_finder(data),
+            "dashboard": lambda: bench_dashboard(ranked_jobs_frame(data, seed)),
+        }
+        for name in benchmarks:
+            print(f"Benchmark {name} on {size} rows")
+            summary = run_benchmark(runs[name](), rows=size, repeat=repeat)
+            for phase, stats in summary.items():
+                results[f"{size}/{name}/{phase}"] = stats
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "sizes": sizes,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict, baseline: Dict, tolerance: float = 0.2, min_delta: float = 0.005
+) -> List[Dict]:
+    """
+    Compares the median durations of two suite runs.
+
+    A phase regressed when it is both ``tolerance`` slower relatively and
+    ``min_delta`` seconds slower absolutely, so that noise on very short phases
+    is not reported.
+
+    Args:
+        current (Dict): Output of run_suite.
+        baseline (Dict): Output of an earlier run_suite.
+        tolerance (float): Relative slowdown tolerated.
+        min_delta (float): Absolute slowdown tolerated, in seconds.
+
+    Returns:
+        List[Dict]: Per phase measured in both runs, the durations, their ratio and a status ("regression", "improvement" or "ok").
+    """
+    rows = []
+    for key, stats in current["results"].items():
+        if key not in baseline["results"]:
+            continue
+        before, after = baseline["results"][key]["median_s"], stats["median_s"]
+        ratio = after / before if before > 0 else float("inf")
+        status = "ok"
+        if ratio > 1 + tolerance and after - before > min_delta:
+            status = "regression"
+        elif ratio < 1 / (1 + tolerance) and before - after > min_delta:
+            status = "improvement"
+        rows.append(
+            {
+                "key": key,
+                "baseline_s": before,
+                "current_s": after,
+                "ratio": ratio,
+                "status": status,
+            }
+        )
+    return rows
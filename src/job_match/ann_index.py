@@ -0,0 +1,179 @@
+import json
+import os
+import numpy as np
+from typing import Optional
+from job_match.scoring import l2_normalize, select_top_k
+
+
+class IVFIndex:
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        list_offsets: np.ndarray,
+        list_ids: np.ndarray,
+        vectors: np.ndarray,
+        fingerprint: str = "",
+    ):
+        """
+        Inverted-file (IVF) index for approximate cosine search over job embeddings.
+
+        Vectors are grouped by their nearest centroid and stored contiguously per list,
+        so a query only scans the lists of its ``n_probe`` closest centroids.
+
+        Args:
+        - centroids (np.ndarray): L2-normalized centroids, one row per list.
+        - list_offsets (np.ndarray): Start of each list in list_ids/vectors (CSR layout).
+        - list_ids (np.ndarray): Row position of every stored vector, grouped by list.
+        - vectors (np.ndarray): L2-normalized vectors, in the order of list_ids.
+        - fingerprint (str): Identifier of the data the index was built from.
+        """
+        self.centroids = centroids
+        self.list_offsets = list_offsets
+        self.list_ids = list_ids
+        self.vectors = vectors
+        self.fingerprint = fingerprint
+
+    def __len__(self) -> int:
+        return len(self.list_ids)
+
+    @classmethod
+    def build(
+        cls,
+        embeddings: np.ndarray,
+        n_lists: Optional[int] = None,
+        n_iter: int = 10,
+        sample_size: int = 50_000,
+        fingerprint: str = "",
+        seed: int = 0,
+    ) -> "IVFIndex":
+        """
+        Builds the index with spherical k-means over the embeddings.
+
+        Args:
+        - embeddings (np.ndarray): Job embeddings, one row per job.
+        - n_lists (Optional[int]): Number of inverted lists (default: 4 * sqrt(n)).
+        - n_iter (int): Number of k-means iterations.
+        - sample_size (int): Maximum number of rows used to train the centroids.
+        - fingerprint (str): Identifier of the data the index is built from.
+        - seed (int): Random seed for the centroid initialization.
+
+        Returns:
+        - IVFIndex: The built index.
+        """
+        vectors = l2_normalize(embeddings)
+        n_rows = len(vectors)
+        if n_rows == 0:
+            # No job yet: an index without lists, whose searches return no row.
+            return cls(
+                centroids=vectors,
+                list_offsets=np.zeros(1, dtype=np.int64),
+                list_ids=np.empty(0, dtype=np.int64),
+                vectors=vectors,
+                fingerprint=fingerprint,
+            )
+        if n_lists is None:
+            n_lists = int(4 * np.sqrt(n_rows))
+        n_lists = max(1, min(n_lists, n_rows))
+
+        rng = np.random.default_rng(seed)
+        sample = vectors[
+            rng.choice(n_rows, size=min(sample_size, n_rows), replace=False)
+        ]
+        centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)]
+        for _ in range(n_iter):
+            assignments = cls._assign(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            empty = np.flatnonzero(np.bincount(assignments, minlength=n_lists) == 0)
+            sums[empty] = sample[rng.choice(len(sample), size=len(empty))]
+            centroids = l2_normalize(sums)
+
+        assignments = cls._assign(vectors, centroids)
+        order = np.argsort(assignments, kind="stable")
+        list_offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignments, minlength=n_lists), out=list_offsets[1:])
+        return cls(centroids, list_offsets, order, vectors[order], fingerprint)
+
+    @staticmethod
+    def _assign(
+        vectors: np.ndarray, centroids: np.ndarray, chunk_size: int = 65_536
+    ) -> np.ndarray:
+        """
+        Assigns every vector to its most similar centroid.
+
+        Args:
+        - vectors (np.ndarray): L2-normalized vectors.
+        - centroids (np.ndarray): L2-normalized centroids.
+        - chunk_size (int): Number of vectors scored at once, bounds memory use.
+
+        Returns:
+        - np.ndarray: Centroid index per vector.
+        """
+        return np.concatenate(
+            [
+                np.argmax(vectors[start : start + chunk_size] @ centroids.T, axis=1)
+                for start in range(0, len(vectors), chunk_size)
+            ]
+        )
+
+    def search(self, query: np.ndarray, k: int, n_probe: int = 16) -> np.ndarray:
+        """
+        Retrieves the approximate k nearest jobs of a query.
+
+        Args:
+        - query (np.ndarray): L2-normalized query embedding.
+        - k (int): Number of jobs to retrieve.
+        - n_probe (int): Number of inverted lists scanned; more lists, better recall.
+
+        Returns:
+        - np.ndarray: Row positions of the retrieved jobs, best first.
+        """
+        probe_order = select_top_k(self.centroids @ query, len(self.centroids))
+        n_probe = min(n_probe, len(probe_order))
+        # Keep probing lists until at least k candidates are available.
+        sizes = np.diff(self.list_offsets)[probe_order]
+        n_probe = max(n_probe, int(np.searchsorted(np.cumsum(sizes), k)) + 1)
+        slices = [
+            np.arange(self.list_offsets[c], self.list_offsets[c + 1])
+            for c in probe_order[:n_probe]
+        ]
+        rows = np.concatenate(slices) if slices else np.empty(0, dtype=np.int64)
+        scores = self.vectors[rows] @ query
+        return self.list_ids[rows[select_top_k(scores, k)]]
+
+    def save(self, index_dir: str) -> None:
+        """
+        Persists the index as .npy arrays plus a metadata file.
+
+        Args:
+        - index_dir (str): Directory where the index is written.
+        """
+        os.makedirs(index_dir, exist_ok=True)
+        for name in ("centroids", "list_offsets", "list_ids", "vectors"):
+            np.save(os.path.join(index_dir, f"{name}.npy"), getattr(self, name))
+        tmp_path = os.path.join(index_dir, "meta.json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({"fingerprint": self.fingerprint}, file)
+        os.replace(tmp_path, os.path.join(index_dir, "meta.json"))
+
+    @classmethod
+    def load(cls, index_dir: str) -> Optional["IVFIndex"]:
+        """
+        Loads a persisted index, memory-mapping its arrays.
+
+        Args:
+        - index_dir (str): Directory written by ``save``.
+
+        Returns:
+        - Optional[IVFIndex]: The index, or None if no index is found.
+        """
+        meta_path = os.path.join(index_dir, "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, "r", encoding="utf-8") as file:
+            meta = json.load(file)
+        arrays = {
+            name: np.load(os.path.join(index_dir, f"{name}.npy"), mmap_mode="r")
+            for name in ("centroids", "list_offsets", "list_ids", "vectors")
+        }
+        return cls(fingerprint=meta["fingerprint"], **arrays)
@@ -0,0 +1,255 @@
+import json
+import logging
+import os
+import threading
+import time
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+
+# Minimum cosine agreement of an ONNX backend with the torch backend.
+PARITY_THRESHOLD = 0.99
+
+# Job-posting-like texts used to check an ONNX backend before its first use.
+PARITY_TEXTS = [
+    "Data Scientist with experience in machine learning and Python.",
+    "We are looking for a Machine Learning Engineer to join our team in Paris.",
+    "Nous recherchons un Data Engineer maîtrisant SQL, Spark et AWS.",
+    "Wir suchen einen Data Analyst mit Kenntnissen in Python und Tableau.",
+    "Cerchiamo uno sviluppatore backend con esperienza in Java e Kubernetes.",
+    "Buscamos un analista de datos con experiencia en finanzas.",
+    "Python, SQL, PyTorch, Scikit-learn, AWS",
+    "2-3 years experience, Junior",
+    "Zürich, Switzerland",
+    "Senior Quantitative Analyst",
+]
+
+# Models loaded in this process, reused by every later matcher.
+_resident_models: Dict[Tuple[str, str, Optional[str]], object] = {}
+# Serializes loads, so that threads asking for the same model load it once.
+_resident_models_lock = threading.Lock()
+
+
+def load_sentence_transformer(
+    model_name: str,
+    backend: str = "torch",
+    onnx_dir: Optional[str] = None,
+    quantization_config: str = "avx2",
+    device: Optional[str] = None,
+):
+    """
+    Loads a SentenceTransformer with the requested inference backend.
+
+    The "onnx-int8" backend exports the model to ONNX, applies dynamic int8
+    quantization once and reuses the exported graph on later loads.
+
+    Args:
+    - model_name (str): Name of the SentenceTransformer model.
+    - backend (str): "torch", "onnx" or "onnx-int8".
+    - onnx_dir (Optional[str]): Directory holding the exported model (default: ~/.cache/fast_job_search/onnx/<model>).
+    - quantization_config (str): ONNX Runtime quantization target ("arm64", "avx2", "avx512", "avx512_vnni").
+    - device (Optional[str]): Torch device of the "torch" backend, picked automatically if None.
+
+    Returns:
+    - SentenceTransformer: The loaded model.
+    """
+    start = time.perf_counter()
+    from sentence_transformers import SentenceTransformer
+
+    logging.info(
+        f"Imported sentence_transformers in {time.perf_counter() - start:.2f}s"
+    )
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}")
+    if backend == "torch":
+        return SentenceTransformer(model_name, device=device)
+    if backend == "onnx":
+        return SentenceTransformer(model_name, backend="onnx")
+
+    from sentence_transformers import export_dynamic_quantized_onnx_model
+
+    if onnx_dir is None:
+        onnx_dir = os.path.join(
+            os.path.expanduser("~/.cache/fast_job_search/onnx"),
+            model_name.replace("/", "__"),
+        )
+    file_name = f"onnx/model_qint8_{quantization_config}.onnx"
+    if not os.path.exists(os.path.join(onnx_dir, file_name)):
+        model = SentenceTransformer(model_name, backend="onnx")
+        model.save(onnx_dir)
+        export_dynamic_quantized_onnx_model(model, quantization_config, onnx_dir)
+    return SentenceTransformer(
+        onnx_dir, backend="onnx", model_kwargs={"file_name": file_name}
+    )
+
+
+def get_sentence_transformer(
+    model_name: str, backend: str = "torch", device: Optional[str] = None
+):
+    """
+    Returns the resident model of this process, loading it on first use.
+
+    Args:
+    - model_name (str): Name of the SentenceTransformer model.
+    - backend (str): "torch", "onnx" or "onnx-int8".
+    - device (Optional[str]): Torch device of the "torch" backend, picked automatically if None.
+
+    Returns:
+    - SentenceTransformer: The loaded model.
+    """
+    key = (model_name, backend, device)
+    model = _resident_models.get(key)
+    if model is not None:
+        return model
+    with _resident_models_lock:
+        if key not in _resident_models:
+            start = time.perf_counter()
+            model = load_sentence_transformer(model_name, backend, device=device)
+            if backend != "torch":
+                ensure_backend_parity(model_name, backend, model)
+            _resident_models[key] = model
+            logging.info(
+                f"Loaded {model_name} ({backend}) in {time.perf_counter() - start:.2f}s"
+            )
+        return _resident_models[key]
+
+
+def check_backend_parity(
+    reference, candidate, texts: List[str], threshold: float = 0.99
+) -> Dict[str, float]:
+    """
+    Compares the embeddings of two models on the same texts.
+
+    Args:
+    - reference: Reference SentenceTransformer (usually the torch backend).
+    - candidate: SentenceTransformer under test.
+    - texts (List[str]): Sample texts.
+    - threshold (float): Minimum cosine agreement required for every text.
+
+    Returns:
+    - Dict[str, float]: Minimum and mean cosine agreement, and whether the check passed.
+    """
+    reference_embeddings = reference.encode(texts, normalize_embeddings=True)
+    candidate_embeddings = candidate.encode(texts, normalize_embeddings=True)
+    agreement = np.sum(reference_embeddings * candidate_embeddings, axis=1)
+    return {
+        "min_cosine": float(agreement.min()),
+        "mean_cosine": float(agreement.mean()),
+        "passed": bool(agreement.min() >= threshold),
+    }
+
+
+def ensure_backend_parity(
+    model_name: str,
+    backend: str,
+    model=None,
+    threshold: float = PARITY_THRESHOLD,
+    results_path: Optional[str] = None,
+) -> Dict[str, float]:
+    """
+    Refuses an ONNX backend whose embeddings drift from the torch backend's.
+
+    The check runs once per model and backend on PARITY_TEXTS; its result is
+    kept in a JSON file so later runs do not load the torch model again.
+
+    Args:
+    - model_name (str): Name of the SentenceTransformer model.
+    - backend (str): Backend of ``model``.
+    - model: The loaded model under test, loaded only if the check has to run when None.
+    - threshold (float): Minimum cosine agreement required for every text.
+    - results_path (Optional[str]): JSON file of past results (default: ~/.cache/fast_job_search/backend_parity.json).
+
+    Returns:
+    - Dict[str, float]: Minimum and mean cosine agreement, and whether the check passed.
+    """
+    if results_path is None:
+        results_path = os.path.expanduser(
+            "~/.cache/fast_job_search/backend_parity.json"
+        )
+    results = {}
+    if os.path.exists(results_path):
+        with open(results_path, "r", encoding="utf-8") as file:
+            results = json.load(file)
+    key = f"{model_name}#{backend}"
+    result = results.get(key)
+    if result is None or result.get("threshold") != threshold:
+        if model is None:
+            model = load_sentence_transformer(model_name, backend)
+        reference = load_sentence_transformer(model_name, "torch", device="cpu")
+        result = {
+            **check_backend_parity(reference, model, PARITY_TEXTS, threshold),
+            "threshold": threshold,
+        }
+        results[key] = result
+        os.makedirs(os.path.dirname(results_path), exist_ok=True)
+        with open(results_path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        os.replace(results_path + ".tmp", results_path)
+    if not result["passed"]:
+        raise RuntimeError(
+            f"The {backend} backend of {model_name} agrees with torch down to a "
+            f"cosine of {result['min_cosine']:.4f} (< {threshold}); use the torch backend"
+        )
+    return result
+
+
+def benchmark_backends(
+    models: Dict[str, object], texts: List[str], repeats: int = 3, batch_size: int = 32
+) -> Dict[str, Dict[str, float]]:
+    """
+    Measures the encoding throughput of several models on the same texts.
+
+    Args:
+    - models (Dict[str, object]): SentenceTransformers by backend name.
+    - texts (List[str]): Sample texts.
+    - repeats (int): Number of timed runs per model, the best one is kept.
+    - batch_size (int): Encoder batch size.
+
+    Returns:
+    - Dict[str, Dict[str, float]]: Best wall time and texts per second per backend.
+    """
+    results = {}
+    for name, model in models.items():
+        model.encode(texts[:batch_size], batch_size=batch_size)  # warm-up
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            model.encode(texts, batch_size=batch_size)
+            timings.append(time.perf_counter() - start)
+        results[name] = {
+            "seconds": min(timings),
+            "texts_per_second": len(texts) / min(timings),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(
+        description="Check parity and benchmark the torch and ONNX int8 backends."
+    )
+    parser.add_argument("path_data", help="Parquet file of scraped jobs")
+    parser.add_argument(
+        "--model-name",
+        default="sentence-transformers/distiluse-base-multilingual-cased-v1",
+    )
+    parser.add_argument("--n-texts", type=int, default=256)
+    parser.add_argument("--threshold", type=float, default=PARITY_THRESHOLD)
+    args = parser.parse_args()
+
+    df = pd.read_parquet(args.path_data).head(args.n_texts)
+    sample_texts = (df["job_title"] + " " + df["job_description"]).tolist()
+    torch_model = load_sentence_transformer(args.model_name, "torch")
+    onnx_model = load_sentence_transformer(args.model_name, "onnx-int8")
+    parity = check_backend_parity(torch_model, onnx_model, sample_texts, args.threshold)
+    print(parity)
+    print(
+        benchmark_backends(
+            {"torch": torch_model, "onnx-int8": onnx_model}, sample_texts
+        )
+    )
+    if not parity["passed"]:
+        raise SystemExit(1)
@@ -0,0 +1,212 @@
+import hashlib
+import json
+import os
+import numpy as np
+from typing import Dict, List, Optional
+
+
+class EmbeddingCache:
+    def __init__(self, cache_dir: str, max_items: int = 500_000):
+        """
+        On-disk, content-addressed store of sentence embeddings.
+
+        Vectors, keys and access clocks are kept in memory-mapped ``.npy`` files so a
+        cache of several hundred thousand embeddings opens instantly and only the
+        touched rows are paged in. When the cache is full, the least recently used
+        entries are evicted.
+
+        Args:
+        - cache_dir (str): Directory holding the cache files (created if missing).
+        - max_items (int): Maximum number of embeddings kept on disk.
+        """
+        self.cache_dir = cache_dir
+        self.max_items = max_items
+        self._vectors: Optional[np.memmap] = None
+        self._keys: Optional[np.memmap] = None
+        self._last_used: Optional[np.memmap] = None
+        self._slots: Dict[bytes, int] = {}
+        self._free: List[int] = []
+        self._clock = 0
+        self.dim: Optional[int] = None
+        os.makedirs(cache_dir, exist_ok=True)
+        self._open()
+
+    @property
+    def _meta_path(self) -> str:
+        return os.path.join(self.cache_dir, "meta.json")
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.cache_dir, f"{name}.npy")
+
+    def _open(self) -> None:
+        """
+        Opens an existing cache directory, or leaves the cache empty until the
+        embedding dimension is known from the first insert.
+        """
+        if not os.path.exists(self._meta_path):
+            return
+        with open(self._meta_path, "r", encoding="utf-8") as file:
+            meta = json.load(file)
+        if meta["max_items"] != self.max_items:
+            # Capacity changed: start over rather than reshaping the arrays.
+            return
+        self.dim = meta["dim"]
+        self._clock = meta["clock"]
+        self._vectors = np.load(self._path("vectors"), mmap_mode="r+")
+        self._keys = np.load(self._path("keys"), mmap_mode="r+")
+        self._last_used = np.load(self._path("last_used"), mmap_mode="r+")
+        used = self._keys != b""
+        occupied = np.flatnonzero(used)
+        self._slots = dict(zip(self._keys[occupied].tolist(), occupied.tolist()))
+        self._free = np.flatnonzero(~used).tolist()
+
+    def _create(self, dim: int) -> None:
+        """
+        Allocates the memory-mapped arrays for a fresh cache.
+
+        Args:
+        - dim (int): Embedding dimension.
+        """
+        self.dim = dim
+        self._vectors = np.lib.format.open_memmap(
+            self._path("vectors"),
+            mode="w+",
+            dtype=np.float32,
+            shape=(self.max_items, dim),
+        )
+        self._keys = np.lib.format.open_memmap(
+            self._path("keys"), mode="w+", dtype="S40", shape=(self.max_items,)
+        )
+        self._last_used = np.lib.format.open_memmap(
+            self._path("last_used"), mode="w+", dtype=np.int64, shape=(self.max_items,)
+        )
+        self._slots = {}
+        self._free = list(range(self.max_items))
+        self._clock = 0
+
+    @staticmethod
+    def make_key(model_name: str, kind: str, text: str) -> bytes:
+        """
+        Builds the content address of a text for a given model and text kind.
+
+        Args:
+        - model_name (str): Name of the encoder model.
+        - kind (str): Kind of text (e.g. "description", "title", "location").
+        - text (str): Raw text; whitespace is normalized before hashing.
+
+        Returns:
+        - bytes: Hex-encoded SHA-1 digest.
+        """
+        normalized = " ".join(str(text).split())
+        payload = "\x00".join([model_name, kind, normalized])
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest().encode("ascii")
+
+    def check_dim(self, dim: int) -> bool:
+        """
+        Compares the dimension of the stored embeddings with the encoder's, and
+        empties the cache on a mismatch (e.g. another model under the same name).
+
+        Args:
+        - dim (int): Embedding dimension of the encoder.
+
+        Returns:
+        - bool: True if the cache was reset.
+        """
+        if self.dim is None or self.dim == dim:
+            return False
+        print(
+            f"Embedding cache {self.cache_dir} holds {self.dim}-d embeddings but the "
+            f"encoder returns {dim}-d ones: resetting the cache"
+        )
+        self._create(dim)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def lookup(self, keys: List[bytes]) -> np.ndarray:
+        """
+        Resolves keys to cache slots and marks the hits as recently used.
+
+        Args:
+        - keys (List[bytes]): Keys built with ``make_key``.
+
+        Returns:
+        - np.ndarray: Slot index per key, -1 for misses.
+        """
+        slots = np.fromiter(
+            (self._slots.get(key, -1) for key in keys), dtype=np.int64, count=len(keys)
+        )
+        hits = slots[slots >= 0]
+        if len(hits):
+            self._clock += 1
+            self._last_used[hits] = self._clock
+        return slots
+
+    def get(self, slots: np.ndarray) -> np.ndarray:
+        """
+        Reads vectors from the cache.
+
+        Args:
+        - slots (np.ndarray): Slot indices returned by ``lookup`` (all >= 0).
+
+        Returns:
+        - np.ndarray: Matrix of embeddings, in the order of ``slots``.
+        """
+        return np.asarray(self._vectors[slots], dtype=np.float32)
+
+    def _evict(self, n: int) -> None:
+        """
+        Frees at least ``n`` slots by dropping the least recently used entries.
+
+        Args:
+        - n (int): Number of slots needed.
+        """
+        missing = n - len(self._free)
+        if missing <= 0:
+            return
+        used = np.flatnonzero(self._keys != b"")
+        oldest = used[np.argsort(self._last_used[used], kind="stable")[:missing]]
+        for slot in oldest:
+            del self._slots[self._keys[slot].tobytes()]
+        self._keys[oldest] = b""
+        self._free.extend(oldest.tolist())
+
+    def put(self, keys: List[bytes], vectors: np.ndarray) -> None:
+        """
+        Stores new embeddings, evicting old entries if the cache is full.
+
+        Args:
+        - keys (List[bytes]): Keys built with ``make_key``.
+        - vectors (np.ndarray): Matrix of embeddings aligned with ``keys``.
+        """
+        if len(keys) == 0:
+            return
+        if self._vectors is None:
+            self._create(vectors.shape[1])
+        else:
+            self.check_dim(vectors.shape[1])
+        keys, vectors = keys[: self.max_items], vectors[: self.max_items]
+        self._evict(len(keys))
+        slots = np.array([self._free.pop() for _ in keys], dtype=np.int64)
+        self._clock += 1
+        self._vectors[slots] = vectors
+        self._keys[slots] = keys
+        self._last_used[slots] = self._clock
+        self._slots.update(zip(keys, slots.tolist()))
+
+    def flush(self) -> None:
+        """
+        Persists the memory-mapped arrays and the cache metadata.
+        """
+        if self._vectors is None:
+            return
+        for array in (self._vectors, self._keys, self._last_used):
+            array.flush()
+        tmp_path = self._meta_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"dim": self.dim, "max_items": self.max_items, "clock": self._clock},
+                file,
+            )
+        os.replace(tmp_path, self._meta_path)
@@ -0,0 +1,303 @@
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+_worker_model = None
+
+
+def set_encoder_threads(threads: Optional[int]) -> None:
+    """
+    Sets the number of torch threads of the current process.
+
+    Args:
+    - threads (Optional[int]): Number of threads, torch's default is kept if None.
+    """
+    if threads is not None:
+        import torch
+
+        torch.set_num_threads(threads)
+
+
+@contextmanager
+def encoder_threads(threads: Optional[int]):
+    """
+    Sets the number of torch threads of the current process for the duration of
+    the block, and restores the previous number afterwards.
+
+    Args:
+    - threads (Optional[int]): Number of threads, torch's default is kept if None.
+    """
+    if threads is None:
+        yield
+        return
+    import torch
+
+    previous = torch.get_num_threads()
+    torch.set_num_threads(threads)
+    try:
+        yield
+    finally:
+        torch.set_num_threads(previous)
+
+
+def _init_worker(
+    model_name: str,
+    backend: str,
+    threads_per_worker: Optional[int],
+    device: Optional[str],
+) -> None:
+    """
+    Loads the sentence-transformer once per worker process.
+
+    Args:
+    - model_name (str): Name of the SentenceTransformer model.
+    - backend (str): Inference backend, see ``job_match.backends``.
+    - threads_per_worker (Optional[int]): Number of torch threads used by each worker.
+    - device (Optional[str]): Torch device of the model.
+    """
+    global _worker_model
+    from job_match.backends import load_sentence_transformer
+
+    set_encoder_threads(threads_per_worker)
+    _worker_model = load_sentence_transformer(model_name, backend, device=device)
+
+
+def _encode_chunk(texts: List[str], batch_size: int) -> np.ndarray:
+    return _worker_model.encode(texts, batch_size=batch_size, convert_to_numpy=True)
+
+
+def encode_in_chunks(
+    model, texts: List[str], chunk_size: int, batch_size: int
+) -> np.ndarray:
+    """
+    Encodes texts chunk by chunk in the current process.
+
+    The chunking matches ``EncodingPool.encode`` so that both paths encode the
+    same batches and return the same embeddings.
+
+    Args:
+    - model: Loaded SentenceTransformer.
+    - texts (List[str]): List of text inputs to encode.
+    - chunk_size (int): Number of texts per chunk.
+    - batch_size (int): Encoder batch size inside a chunk.
+
+    Returns:
+    - np.ndarray: Matrix of embeddings.
+    """
+    return np.concatenate(
+        [
+            model.encode(
+                texts[start : start + chunk_size],
+                batch_size=batch_size,
+                convert_to_numpy=True,
+            )
+            for start in range(0, len(texts), chunk_size)
+        ]
+    )
+
+
+class EncodingPool:
+    def __init__(
+        self,
+        model_name: str,
+        n_workers: int,
+        chunk_size: int = 1024,
+        batch_size: int = 32,
+        threads_per_worker: Optional[int] = 1,
+        backend: str = "torch",
+        device: Optional[str] = "cpu",
+    ):
+        """
+        Pool of CPU worker processes, each holding its own copy of the encoder.
+
+        Workers load the model like the in-process path given the same device and
+        threads, so both return the same embeddings (see check_pool_parity).
+
+        Args:
+        - model_name (str): Name of the SentenceTransformer model.
+        - n_workers (int): Number of worker processes.
+        - chunk_size (int): Number of texts sent to a worker at once.
+        - batch_size (int): Encoder batch size inside a chunk.
+        - threads_per_worker (Optional[int]): Number of torch threads used by each worker, torch's default if None.
+        - backend (str): Inference backend, see ``job_match.backends``.
+        - device (Optional[str]): Torch device of the workers' model.
+        """
+        self.model_name = model_name
+        self.n_workers = n_workers
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self.threads_per_worker = threads_per_worker
+        self.backend = backend
+        self.device = device
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self) -> "EncodingPool":
+        """
+        Starts the workers; each one loads the model before taking work.
+
+        An ONNX backend is checked against torch here, once, since the workers
+        load their model without the check of ``get_sentence_transformer``.
+
+        Returns:
+        - EncodingPool: The started pool.
+        """
+        if self._executor is None:
+            if self.backend != "torch":
+                from job_match.backends import ensure_backend_parity
+
+                ensure_backend_parity(self.model_name, self.backend)
+            # Spawned workers avoid forking a process that already runs torch threads.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(
+                    self.model_name,
+                    self.backend,
+                    self.threads_per_worker,
+                    self.device,
+                ),
+            )
+        return self
+
+    def close(self) -> None:
+        """
+        Stops the workers.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "EncodingPool":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Encodes texts across the workers, preserving the input order.
+
+        Args:
+        - texts (List[str]): List of text inputs to encode.
+
+        Returns:
+        - np.ndarray: Matrix of embeddings.
+        """
+        self.start()
+        chunks = [
+            texts[start : start + self.chunk_size]
+            for start in range(0, len(texts), self.chunk_size)
+        ]
+        return np.concatenate(
+            list(
+                self._executor.map(
+                    _encode_chunk, chunks, [self.batch_size] * len(chunks)
+                )
+            )
+        )
+
+
+def check_pool_parity(
+    model_name: str,
+    texts: List[str],
+    n_workers: int = 2,
+    chunk_size: int = 1024,
+    batch_size: int = 32,
+    threads: Optional[int] = 1,
+    backend: str = "torch",
+    device: Optional[str] = "cpu",
+    atol: float = 0.0,
+) -> Dict:
+    """
+    Compares the embeddings of the in-process path (encode_workers=1) and of an
+    encoding pool (encode_workers>1) loaded with the same options. Both encode
+    the same chunks with the same model, so they must agree element-wise, not
+    only in direction: a difference in truncation or batching fails the check.
+
+    Args:
+    - model_name (str): Name of the SentenceTransformer model.
+    - texts (List[str]): Sample texts.
+    - n_workers (int): Number of worker processes of the pool.
+    - chunk_size (int): Number of texts per chunk.
+    - batch_size (int): Encoder batch size inside a chunk.
+    - threads (Optional[int]): Number of torch threads of every process.
+    - backend (str): Inference backend, see ``job_match.backends``.
+    - device (Optional[str]): Torch device of the model.
+    - atol (float): Largest absolute difference tolerated per coordinate, 0 for bit-identical embeddings.
+
+    Returns:
+    - Dict: Largest absolute difference, shapes of both outputs, and whether the check passed.
+    """
+    from job_match.backends import get_sentence_transformer
+
+    model = get_sentence_transformer(model_name, backend, device)
+    with encoder_threads(threads):
+        in_process = encode_in_chunks(model, texts, chunk_size, batch_size)
+    with EncodingPool(
+        model_name,
+        n_workers,
+        chunk_size=chunk_size,
+        batch_size=batch_size,
+        threads_per_worker=threads,
+        backend=backend,
+        device=device,
+    ) as pool:
+        pooled = pool.encode(texts)
+
+    same_shape = in_process.shape == pooled.shape
+    max_abs_diff = (
+        float(np.abs(in_process - pooled).max()) if same_shape else float("inf")
+    )
+    return {
+        "max_abs_diff": max_abs_diff,
+        "in_process_shape": in_process.shape,
+        "pool_shape": pooled.shape,
+        "passed": bool(
+            same_shape and np.allclose(in_process, pooled, rtol=0.0, atol=atol)
+        ),
+    }
+
+
+if __name__ == "__main__":
+    # Run as `python src/job_match/encoding_pool.py`, sys.path[0] is src/job_match:
+    # put src first so that this process and the spawned workers (which inherit
+    # sys.path) can import the job_match package.
+    import os
+    import sys
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    import argparse
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(
+        description="Check that the encoding pool and in-process encoding agree."
+    )
+    parser.add_argument("path_data", help="Parquet file of scraped jobs")
+    parser.add_argument(
+        "--model-name",
+        default="sentence-transformers/distiluse-base-multilingual-cased-v1",
+    )
+    parser.add_argument("--n-texts", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--backend", default="torch")
+    parser.add_argument("--atol", type=float, default=0.0)
+    args = parser.parse_args()
+
+    df = pd.read_parquet(args.path_data).head(args.n_texts)
+    sample_texts = (df["job_title"] + " " + df["job_description"]).tolist()
+    parity = check_pool_parity(
+        args.model_name,
+        sample_texts,
+        n_workers=args.workers,
+        chunk_size=args.chunk_size,
+        backend=args.backend,
+        atol=args.atol,
+    )
+    print(parity)
+    if not parity["passed"]:
+        raise SystemExit(1)
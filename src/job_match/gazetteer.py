@@ -0,0 +1,288 @@
+import csv
+import re
+import unicodedata
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+Coordinates = Optional[Tuple[float, float]]
+
+# LinkedIn wording around metropolitan areas, e.g. "Greater Paris Metropolitan Region".
+_AREA_PATTERN = re.compile(
+    r"^(greater|grand|grande|gross|groß)\s+|\s+(metropolitan|metro)?\s*(region|area)$"
+)
+
+
+class Place(NamedTuple):
+    name: str
+    latitude: float
+    longitude: float
+    country_code: str
+    population: int
+
+
+def normalize_name(text: str) -> str:
+    """
+    Normalize a place name for lookups: lowercase, no accents, no punctuation.
+
+    Args:
+        text (str): Place name.
+
+    Returns:
+        str: Normalized name.
+    """
+    text = unicodedata.normalize("NFKD", str(text))
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    text = re.sub(r"[^\w]+", " ", text.lower().replace("ß", "ss"))
+    return " ".join(text.split())
+
+
+@lru_cache(maxsize=None)
+def _country_code(name: str) -> Optional[str]:
+    """
+    ISO alpha-2 code of a normalized country name, None if it is not a country.
+
+    Args:
+        name (str): Normalized country name or code.
+
+    Returns:
+        Optional[str]: Country code.
+    """
+    import pycountry
+
+    try:
+        return pycountry.countries.lookup(name).alpha_2
+    except LookupError:
+        return None
+
+
+def _trigrams(name: str) -> Set[str]:
+    """
+    Character trigrams of a normalized name, padded with spaces.
+
+    Args:
+        name (str): Normalized name.
+
+    Returns:
+        Set[str]: Trigrams.
+    """
+    padded = f"  {name} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class Gazetteer:
+    def __init__(self, places: Iterable[Place], fuzzy_threshold: float = 0.7):
+        """
+        In-memory gazetteer resolving place names to coordinates without network calls.
+
+        Names are indexed by their normalized form in a hash table; unknown names
+        fall back to a trigram index (Jaccard similarity).
+
+        Args:
+            places (Iterable[Place]): Places to index.
+            fuzzy_threshold (float): Minimum trigram similarity of a fuzzy match, 1 disables fuzzy matching.
+        """
+        self.fuzzy_threshold = fuzzy_threshold
+        self._index: Dict[str, List[Place]] = defaultdict(list)
+        for place in places:
+            key = normalize_name(place.name)
+            if key:
+                self._index[key].append(place)
+        for candidates in self._index.values():
+            candidates.sort(key=lambda place: -place.population)
+        self._index = dict(self._index)
+        self._names = list(self._index)
+        self._trigram_counts = []
+        self._trigram_index: Dict[str, List[int]] = defaultdict(list)
+        for position, name in enumerate(self._names):
+            trigrams = _trigrams(name)
+            self._trigram_counts.append(len(trigrams))
+            for trigram in trigrams:
+                self._trigram_index[trigram].append(position)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @classmethod
+    def from_geonames(
+        cls,
+        path: str,
+        min_population: int = 0,
+        alternate_names: bool = True,
+        fuzzy_threshold: float = 0.7,
+    ) -> "Gazetteer":
+        """
+        Load a GeoNames dump (e.g. cities15000.txt, tab-separated, no header).
+
+        Args:
+            path (str): Path of the GeoNames file.
+            min_population (int): Places with a smaller population are skipped.
+            alternate_names (bool): Whether to index the alternate names (translations) too.
+            fuzzy_threshold (float): Minimum trigram similarity of a fuzzy match.
+
+        Returns:
+            Gazetteer: The loaded gazetteer.
+        """
+        places = []
+        with open(path, "r", encoding="utf-8") as file:
+            for row in csv.reader(file, delimiter="\t", quoting=csv.QUOTE_NONE):
+                if len(row) < 15:
+                    continue
+                population = int(row[14] or 0)
+                if population < min_population:
+                    continue
+                latitude, longitude, country_code = float(row[4]), float(row[5]), row[8]
+                names = {row[1], row[2]}
+                if alternate_names and row[3]:
+                    names.update(row[3].split(","))
+                for name in names:
+                    places.append(
+                        Place(name, latitude, longitude, country_code, population)
+                    )
+        return cls(places, fuzzy_threshold=fuzzy_threshold)
+
+    @classmethod
+    def from_csv(cls, path: str, fuzzy_threshold: float = 0.7) -> "Gazetteer":
+        """
+        Load a CSV file with columns name, latitude, longitude and optionally
+        country_code and population.
+
+        Args:
+            path (str): Path of the CSV file.
+            fuzzy_threshold (float): Minimum trigram similarity of a fuzzy match.
+
+        Returns:
+            Gazetteer: The loaded gazetteer.
+        """
+        with open(path, "r", encoding="utf-8", newline="") as file:
+            places = [
+                Place(
+                    row["name"],
+                    float(row["latitude"]),
+                    float(row["longitude"]),
+                    (row.get("country_code") or "").upper(),
+                    int(row.get("population") or 0),
+                )
+                for row in csv.DictReader(file)
+            ]
+        return cls(places, fuzzy_threshold=fuzzy_threshold)
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "Gazetteer":
+        """
+        Load a gazetteer file, as CSV if its extension is .csv and as a GeoNames dump otherwise.
+
+        Args:
+            path (str): Path of the gazetteer file.
+
+        Returns:
+            Gazetteer: The loaded gazetteer.
+        """
+        if path.lower().endswith(".csv"):
+            return cls.from_csv(path, **kwargs)
+        return cls.from_geonames(path, **kwargs)
+
+    def _fuzzy_match(self, name: str) -> Optional[str]:
+        """
+        Closest indexed name by trigram similarity.
+
+        Args:
+            name (str): Normalized name.
+
+        Returns:
+            Optional[str]: Indexed name above the similarity threshold, if any.
+        """
+        if self.fuzzy_threshold >= 1:
+            return None
+        trigrams = _trigrams(name)
+        shared: Dict[int, int] = defaultdict(int)
+        for trigram in trigrams:
+            for position in self._trigram_index.get(trigram, ()):
+                shared[position] += 1
+        best, best_score = None, self.fuzzy_threshold
+        for position, count in shared.items():
+            union = len(trigrams) + self._trigram_counts[position] - count
+            if count / union >= best_score:
+                best, best_score = self._names[position], count / union
+        return best
+
+    def _candidates(self, name: str, fuzzy: bool) -> List[Place]:
+        """
+        Places matching a name exactly, or approximately if fuzzy.
+
+        Args:
+            name (str): Normalized name.
+            fuzzy (bool): Whether to use the trigram fallback.
+
+        Returns:
+            List[Place]: Matching places, most populated first.
+        """
+        candidates = self._index.get(name)
+        if candidates is None and fuzzy:
+            match = self._fuzzy_match(name)
+            candidates = self._index[match] if match else None
+        return candidates or []
+
+    def lookup(self, location: str) -> Coordinates:
+        """
+        Resolve a LinkedIn-style location such as "Munich, Bavaria, Germany" or
+        "Greater Paris Metropolitan Region".
+
+        Components are tried from the most precise (first) to the broadest; a
+        country as last component, when present, disambiguates homonyms.
+
+        Args:
+            location (str): The location as a text string.
+
+        Returns:
+            Coordinates: (latitude, longitude) if found, else None.
+        """
+        components = [normalize_name(part) for part in str(location).split(",")]
+        components = [_AREA_PATTERN.sub("", part) for part in components if part]
+        if not components:
+            return None
+        # Only the last component can be a country: earlier ones are regions or
+        # US states ("Atlanta, GA" is not in Gabon). Short codes are only read as
+        # countries when they are the whole location.
+        last = components[-1]
+        country = None
+        if len(last) > 3 or len(components) == 1:
+            country = _country_code(last)
+
+        passes = [(False, country), (True, country)]
+        if country is not None:
+            # The country may be a homonym ("Atlanta, Georgia"): exact names
+            # outside the country are accepted when nothing matches inside it.
+            passes.append((False, None))
+        for fuzzy, country_filter in passes:
+            for position, component in enumerate(components):
+                is_country = country is not None and position == len(components) - 1
+                # Country names are only matched exactly, never approximated.
+                candidates = self._candidates(component, fuzzy and not is_country)
+                if country_filter is not None:
+                    candidates = [
+                        place
+                        for place in candidates
+                        if not place.country_code
+                        or place.country_code == country_filter
+                    ]
+                if candidates:
+                    return candidates[0].latitude, candidates[0].longitude
+        return None
+
+    def lookup_many(self, locations: List[str]) -> Dict[str, Coordinates]:
+        """
+        Resolve locations, leaving out the ones the gazetteer does not know.
+
+        Args:
+            locations (List[str]): Location strings.
+
+        Returns:
+            Dict[str, Coordinates]: Coordinates per resolved location.
+        """
+        results = {}
+        for location in locations:
+            coordinates = self.lookup(location)
+            if coordinates is not None:
+                results[location] = coordinates
+        return results
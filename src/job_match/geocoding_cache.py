@@ -0,0 +1,91 @@
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+
+Coordinates = Optional[Tuple[float, float]]
+
+
+class GeocodingCache:
+    def __init__(
+        self, path: str, ttl_days: float = 90.0, negative_ttl_days: float = 7.0
+    ):
+        """
+        Persistent location -> coordinates cache backed by SQLite.
+
+        Locations the geocoder could not find are cached too (negative results),
+        with a shorter time-to-live so they are retried from time to time.
+
+        Args:
+            path (str): Path of the SQLite database file.
+            ttl_days (float): Time-to-live of found coordinates, in days.
+            negative_ttl_days (float): Time-to-live of not-found results, in days.
+        """
+        self.path = path
+        self.ttl = ttl_days * 86400
+        self.negative_ttl = negative_ttl_days * 86400
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS locations ("
+            "location TEXT PRIMARY KEY, latitude REAL, longitude REAL, "
+            "found INTEGER NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._connection.commit()
+
+    def get_many(self, locations: List[str]) -> Dict[str, Coordinates]:
+        """
+        Look up locations, ignoring expired entries.
+
+        Args:
+            locations (List[str]): Cleaned location strings.
+
+        Returns:
+            Dict[str, Coordinates]: Cached result per location found in the cache (None for cached not-found results).
+        """
+        now = time.time()
+        results = {}
+        chunk_size = 500  # stays below SQLite's limit of bound parameters
+        for start in range(0, len(locations), chunk_size):
+            chunk = locations[start : start + chunk_size]
+            rows = self._connection.execute(
+                "SELECT location, latitude, longitude, found, updated_at "
+                f"FROM locations WHERE location IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for location, latitude, longitude, found, updated_at in rows:
+                ttl = self.ttl if found else self.negative_ttl
+                if now - updated_at <= ttl:
+                    results[location] = (latitude, longitude) if found else None
+        return results
+
+    def put_many(self, results: Dict[str, Coordinates]) -> None:
+        """
+        Store geocoding results, None meaning the location was not found.
+
+        Args:
+            results (Dict[str, Coordinates]): Result per location.
+        """
+        now = time.time()
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO locations VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    location,
+                    coordinates[0] if coordinates else None,
+                    coordinates[1] if coordinates else None,
+                    int(coordinates is not None),
+                    now,
+                )
+                for location, coordinates in results.items()
+            ],
+        )
+        self._connection.commit()
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self._connection.close()
@@ -0,0 +1,148 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+Coordinates = Optional[Tuple[float, float]]
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int = 1):
+        """
+        Thread-safe token bucket limiting the request rate.
+
+        Args:
+            rate (float): Tokens added per second (requests per second).
+            capacity (int): Maximum number of tokens, i.e. the allowed burst.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, deadline: Optional[float] = None) -> bool:
+        """
+        Wait for a token.
+
+        Args:
+            deadline (Optional[float]): time.monotonic() value after which waiting stops.
+
+        Returns:
+            bool: True if a token was taken, False if the deadline passed first.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class ConcurrentGeocoder:
+    def __init__(
+        self,
+        geocode: Callable[[str, float], Coordinates],
+        max_workers: int = 4,
+        rate_limit: float = 1.0,
+        burst: int = 1,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        request_timeout: float = 10.0,
+        time_budget: float = 300.0,
+        retry_on: Tuple[type, ...] = (Exception,),
+        give_up_on: Tuple[type, ...] = (),
+    ):
+        """
+        Resolves locations concurrently under a global rate limit, with retries and a
+        time budget for the whole run.
+
+        Args:
+            geocode (Callable[[str, float], Coordinates]): Function geocoding one location with a request timeout.
+            max_workers (int): Maximum number of concurrent requests.
+            rate_limit (float): Maximum number of requests per second, across workers.
+            burst (int): Number of requests allowed at once before the rate applies.
+            max_retries (int): Number of retries of a failed request.
+            backoff_base (float): Delay before the first retry, doubled on each retry.
+            backoff_max (float): Maximum delay between retries.
+            request_timeout (float): Timeout of a single request, in seconds.
+            time_budget (float): Maximum duration of a resolve() call, in seconds.
+            retry_on (Tuple[type, ...]): Exception types that trigger a retry.
+            give_up_on (Tuple[type, ...]): Exception types failing the lookup at once, checked before retry_on (e.g. permanent subclasses of a retried error).
+        """
+        self.geocode = geocode
+        self.max_workers = max_workers
+        self.bucket = TokenBucket(rate_limit, burst)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.request_timeout = request_timeout
+        self.time_budget = time_budget
+        self.retry_on = retry_on
+        self.give_up_on = give_up_on
+
+    def _resolve_one(self, location: str, deadline: float) -> Tuple[bool, Coordinates]:
+        """
+        Geocode one location, retrying with exponential backoff until the deadline.
+
+        Args:
+            location (str): The location as a text string.
+            deadline (float): time.monotonic() value at which the run budget ends.
+
+        Returns:
+            Tuple[bool, Coordinates]: Whether the lookup succeeded, and its result.
+        """
+        for attempt in range(self.max_retries + 1):
+            if not self.bucket.acquire(deadline):
+                return False, None
+            timeout = min(self.request_timeout, deadline - time.monotonic())
+            if timeout <= 0:
+                return False, None
+            try:
+                return True, self.geocode(location, timeout)
+            except self.give_up_on as e:
+                print(f"Geocoding failed for {location}: {e}")
+                return False, None
+            except self.retry_on as e:
+                if attempt == self.max_retries:
+                    print(f"Geocoding failed for {location}: {e}")
+                    return False, None
+                delay = min(self.backoff_max, self.backoff_base * 2**attempt)
+                delay *= random.uniform(0.5, 1.0)
+                if time.monotonic() + delay >= deadline:
+                    return False, None
+                time.sleep(delay)
+        return False, None
+
+    def resolve(self, locations: List[str]) -> Dict[str, Coordinates]:
+        """
+        Geocode locations concurrently.
+
+        Args:
+            locations (List[str]): Unique location strings.
+
+        Returns:
+            Dict[str, Coordinates]: Result of every successful lookup (None when not found). Failed or unfinished lookups are left out.
+        """
+        if not locations:
+            return {}
+        deadline = time.monotonic() + self.time_budget
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            outcomes = executor.map(
+                lambda location: self._resolve_one(location, deadline), locations
+            )
+            return {
+                location: coordinates
+                for location, (succeeded, coordinates) in zip(locations, outcomes)
+                if succeeded
+            }
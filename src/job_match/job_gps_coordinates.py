@@ -1,20 +1,67 @@
-from typing import Optional, Tuple
-from geopy.geocoders import Nominatim
-from geopy.exc import GeocoderTimedOut
+import logging
 import pandas as pd
-from typing import Optional, Tuple
-import re
+from typing import Dict, List, Optional, Tuple, Union
+from job_match.geocoding_cache import GeocodingCache
+from job_match.geocoding_client import ConcurrentGeocoder
+from job_match.gazetteer import Gazetteer
+from utils import tracing
 
 
 class GpsFinder:
-    def __init__(self, data_jobs: pd.DataFrame):
+    def __init__(
+        self,
+        data_jobs: pd.DataFrame,
+        cache_path: Optional[str] = None,
+        ttl_days: float = 90.0,
+        negative_ttl_days: float = 7.0,
+        max_workers: int = 4,
+        rate_limit: float = 1.0,
+        max_retries: int = 3,
+        request_timeout: float = 10.0,
+        time_budget: float = 300.0,
+        geocoder_domain: Optional[str] = None,
+        geocoder_scheme: Optional[str] = None,
+        gazetteer: Optional[Union[str, Gazetteer]] = None,
+        use_online_geocoder: bool = True,
+        geolocator=None,
+    ):
         """
         Initialize the GpsFinder class with the path to job data.
 
         Args:
             job dataframe (pd.DataFrame): Job dataframe after job matching.
+            cache_path (Optional[str]): SQLite file of the persistent geocoding cache, in-memory only if None.
+            ttl_days (float): Time-to-live of cached coordinates, in days.
+            negative_ttl_days (float): Time-to-live of cached not-found locations, in days.
+            max_workers (int): Maximum number of concurrent geocoding requests.
+            rate_limit (float): Maximum number of geocoding requests per second (Nominatim allows 1).
+            max_retries (int): Number of retries of a failed request, with exponential backoff.
+            request_timeout (float): Timeout of a single request, in seconds.
+            time_budget (float): Maximum time spent geocoding per run, in seconds; unresolved locations are retried next run.
+            geocoder_domain (Optional[str]): Nominatim host, e.g. "localhost:8080" for a local geocoder (default: the public service).
+            geocoder_scheme (Optional[str]): "http" or "https" (default: geopy's default).
+            gazetteer (Optional[Union[str, Gazetteer]]): Offline gazetteer, or the path of a GeoNames/CSV file, tried before the cache and the online geocoder.
+            use_online_geocoder (bool): Whether locations unknown to the gazetteer and the cache are geocoded online.
+            geolocator: Geocoder with geopy's geocode(query, timeout=...) method, used instead of Nominatim (e.g. a stub geocoder for benchmarks).
         """
         self.data_jobs = data_jobs
+        self.cache = GeocodingCache(
+            cache_path or ":memory:",
+            ttl_days=ttl_days,
+            negative_ttl_days=negative_ttl_days,
+        )
+        self._geolocator = geolocator
+        self.geocoder_domain = geocoder_domain
+        self.geocoder_scheme = geocoder_scheme
+        self.max_workers = max_workers
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+        self.request_timeout = request_timeout
+        self.time_budget = time_budget
+        if isinstance(gazetteer, str):
+            gazetteer = Gazetteer.from_file(gazetteer)
+        self.gazetteer = gazetteer
+        self.use_online_geocoder = use_online_geocoder
 
     def remove_job_type_data(self) -> pd.DataFrame:
         """
@@ -23,21 +70,56 @@ class GpsFinder:
         Returns:
             pd.DataFrame: A pandas DataFrame containing job data.
         """
-        self.data_jobs["job_location"] = self.data_jobs["job_location"].apply(
-            self._remove_text_in_parentheses
+        self.data_jobs["job_location"] = self.clean_locations(
+            self.data_jobs["job_location"]
         )
 
-    def _remove_text_in_parentheses(self, text: str) -> str:
+    @staticmethod
+    def clean_locations(locations: pd.Series) -> pd.Series:
         """
-        Remove all text inside parentheses (including the parentheses) from a given string.
+        Remove text in parentheses, like (remote working), from job locations.
 
         Args:
-            text (str): The input string from which text inside parentheses needs to be removed.
+            locations (pd.Series): Raw job locations.
 
         Returns:
-            str: The modified string with text inside parentheses removed.
+            pd.Series: Cleaned job locations, as looked up by resolve_locations.
+        """
+        return locations.str.replace(r"\s?\(.*?\)", "", regex=True).str.strip()
+
+    @property
+    def geolocator(self):
+        """
+        Geocoder client (Nominatim unless injected), created once and reused for every lookup.
         """
-        return re.sub(r"\s?\(.*?\)", "", text)
+        if self._geolocator is None:
+            from geopy.geocoders import Nominatim
+
+            options = {}
+            if self.geocoder_domain is not None:
+                options["domain"] = self.geocoder_domain
+            if self.geocoder_scheme is not None:
+                options["scheme"] = self.geocoder_scheme
+            self._geolocator = Nominatim(user_agent="geo_locator", **options)
+        return self._geolocator
+
+    def _geocode(
+        self, location: str, timeout: float = 30
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Geocode a location, letting geocoder errors propagate.
+
+        Args:
+            location (str): The location as a text string.
+            timeout (float): Request timeout, in seconds.
+
+        Returns:
+            Optional[Tuple[float, float]]: A tuple with (latitude, longitude) if found, else None.
+        """
+        location_data = self.geolocator.geocode(location, timeout=timeout)
+        if location_data:
+            return location_data.latitude, location_data.longitude
+        return None
 
     def get_gps_coordinates(self, location: str) -> Optional[Tuple[float, float]]:
         """
@@ -49,31 +131,110 @@ class GpsFinder:
         Returns:
             Optional[Tuple[float, float]]: A tuple with (latitude, longitude) if found, else None.
         """
-        geolocator = Nominatim(user_agent="geo_locator")
+        from geopy.exc import GeocoderTimedOut
 
         try:
-            location_data = geolocator.geocode(location, timeout=30)
-            if location_data:
-                return location_data.latitude, location_data.longitude
+            return self._geocode(location)
         except GeocoderTimedOut:
             print("Geocoding request timed out. Try again.")
         return None
 
+    def resolve_locations(
+        self, locations: List[str]
+    ) -> Dict[str, Optional[Tuple[float, float]]]:
+        """
+        Resolve unique locations, from the offline gazetteer first, then from the
+        cache, and from the online geocoder for the remaining misses.
+
+        Gazetteer results are not cached, they are cheaper to recompute. Misses are
+        geocoded concurrently under the rate limit and time budget. Not-found
+        locations are cached as negative results; locations whose lookup failed
+        (timeout, service error, budget exhausted) are not cached and retried on
+        the next run. Only transient errors are retried within a run. Counts per source are reported to the tracer and logged.
+
+        Args:
+            locations (List[str]): Unique cleaned location strings.
+
+        Returns:
+            Dict[str, Optional[Tuple[float, float]]]: Coordinates per location, None if unresolved.
+        """
+        from geopy.exc import (
+            GeocoderAuthenticationFailure,
+            GeocoderInsufficientPrivileges,
+            GeocoderQueryError,
+            GeocoderServiceError,
+            GeocoderTimedOut,
+            GeocoderUnavailable,
+        )
+
+        known = {}
+        if self.gazetteer is not None:
+            with tracing.span("geocoding.gazetteer") as span:
+                known = self.gazetteer.lookup_many(locations)
+                span.add_items(len(locations))
+            locations = [location for location in locations if location not in known]
+        results = self.cache.get_many(locations)
+        misses = [location for location in locations if location not in results]
+        tracing.count("geocode_gazetteer_matches", len(known))
+        tracing.count("geocode_cache_hits", len(results))
+        tracing.count("geocode_cache_misses", len(misses))
+        if not self.use_online_geocoder:
+            misses = []
+        geocoder = ConcurrentGeocoder(
+            self._geocode,
+            max_workers=self.max_workers,
+            rate_limit=self.rate_limit,
+            max_retries=self.max_retries,
+            request_timeout=self.request_timeout,
+            time_budget=self.time_budget,
+            # Invalid queries and refused credentials fail the same way on retry,
+            # although geopy derives them from GeocoderServiceError.
+            retry_on=(GeocoderTimedOut, GeocoderUnavailable, GeocoderServiceError),
+            give_up_on=(
+                GeocoderQueryError,
+                GeocoderAuthenticationFailure,
+                GeocoderInsufficientPrivileges,
+            ),
+        )
+        with tracing.span("geocoding.fetch") as span:
+            fetched = geocoder.resolve(misses)
+            span.add_items(len(misses))
+        self.cache.put_many(fetched)
+        unresolved = len(locations) - len(results) - len(fetched)
+        tracing.count("geocode_fetched", len(fetched))
+        tracing.count("geocode_unresolved", unresolved)
+        logging.info(
+            f"Geocoding: {len(known) + len(locations)} unique locations, "
+            f"{len(known)} from gazetteer, {len(results)} from cache, "
+            f"{len(fetched)} fetched, {unresolved} unresolved."
+        )
+        results.update(fetched)
+        results.update(known)
+        return results
+
     def process_job_locations(self) -> pd.DataFrame:
         """
         Process job locations and add GPS coordinates to the job data.
 
+        Each unique location is geocoded once and the coordinates are joined back
+        to every job.
+
         Returns:
             pd.DataFrame: DataFrame with added latitude and longitude columns.
         """
         self.remove_job_type_data()
-        self.data_jobs["coordinates"] = self.data_jobs["job_location"].apply(
-            self.get_gps_coordinates
+        locations = self.data_jobs["job_location"]
+        with tracing.span("geocoding.resolve") as span:
+            unique_locations = locations.dropna().unique().tolist()
+            coordinates = self.resolve_locations(unique_locations)
+            span.add_items(len(unique_locations))
+        found = {location: xy for location, xy in coordinates.items() if xy}
+        self.data_jobs["latitude"] = locations.map(
+            {location: xy[0] for location, xy in found.items()}
         )
-        self.data_jobs[["latitude", "longitude"]] = pd.DataFrame(
-            self.data_jobs["coordinates"].tolist(), index=self.data_jobs.index
+        self.data_jobs["longitude"] = locations.map(
+            {location: xy[1] for location, xy in found.items()}
         )
-        self.data_jobs.drop(columns=["coordinates"], inplace=True)
         return self.data_jobs
 
     def get_job_with_coordinates(self) -> pd.DataFrame:
@@ -1,27 +1,146 @@
+import copy
+import hashlib
+import os
 import pandas as pd
 import numpy as np
+from contextlib import contextmanager
 from functools import lru_cache
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
-from typing import List, Dict
-from job_match.utils import get_language_name
+from typing import List, Dict, Optional, Tuple, Union
+from job_match.utils import get_language_names
+from job_match.ann_index import IVFIndex
+from job_match.backends import get_sentence_transformer
+from job_match.embedding_cache import EmbeddingCache
+from job_match.encoding_pool import (
+    EncodingPool,
+    encode_in_chunks,
+    encoder_threads,
+)
+from job_match.near_duplicates import find_near_duplicates
+from job_match.quantization import QuantizedEmbeddings
+from job_match.ranked_jobs import RankedJobs
+from job_match.scoring import (
+    DEDUPLICATED_VIEWS,
+    JOB_VIEWS,
+    l2_normalize,
+    score_queries,
+    select_top_k,
+    view_for_category,
+)
+from utils import tracing
+from utils.utils import POSTING_CONTENT_COLUMNS, clean_job_titles
 
 
 class JobsMatcherCV:
     def __init__(
         self,
-        path_data: str,
+        path_data: Union[str, pd.DataFrame],
         model_name: str = "sentence-transformers/distiluse-base-multilingual-cased-v1",
+        cache_dir: Optional[str] = None,
+        cache_max_items: int = 500_000,
+        index_dir: Optional[str] = None,
+        n_probe: int = 16,
+        storage: str = "float32",
+        pca_components: Optional[int] = None,
+        encode_workers: int = 1,
+        encode_chunk_size: int = 1024,
+        encode_batch_size: int = 32,
+        pool_lifetime: str = "call",
+        backend: str = "torch",
+        near_duplicate_threshold: Optional[float] = None,
+        encoder=None,
+        device: Optional[str] = None,
+        encode_threads: Optional[int] = None,
+        drop_duplicate_postings: bool = True,
     ):
         """
         Initializes the job matcher with a dataset and an NLP model.
 
         Args:
-        - path_data (str): Path to the job listings dataset (Parquet file).
+        - path_data (Union[str, pd.DataFrame]): Path to the job listings dataset (Parquet file), or the job listings themselves.
         - model_name (str): Name of the SentenceTransformer model (default: all-MiniLM-L6-v2).
+        - cache_dir (Optional[str]): Directory of the persistent embedding cache, disabled if None.
+        - cache_max_items (int): Maximum number of embeddings kept in the cache.
+        - index_dir (Optional[str]): Directory of the persisted ANN index over job descriptions, brute force if None.
+        - n_probe (int): Number of index lists scanned per query.
+        - storage (str): Storage of the first-pass description embeddings, "float32", "float16" or "int8". Compact storage shortlists jobs approximately and rescores them at full precision.
+        - pca_components (Optional[int]): Number of PCA directions kept in compact storage, no projection if None.
+        - encode_workers (int): Number of CPU processes used to encode texts, in-process encoding if 1.
+        - encode_chunk_size (int): Number of texts encoded per chunk (and sent to a worker at once).
+        - encode_batch_size (int): Encoder batch size inside a chunk.
+        - pool_lifetime (str): "call" starts the encoding pool for each ranking call, "matcher" keeps it until close().
+        - backend (str): Inference backend, "torch" (default), "onnx" or "onnx-int8" (ONNX Runtime with dynamic int8 quantization).
+        - near_duplicate_threshold (Optional[float]): Estimated Jaccard similarity above which job descriptions are embedded once per cluster, disabled if None.
+        - encoder: Loaded model with SentenceTransformer's encode() and get_sentence_embedding_dimension(), used in-process instead of loading model_name (e.g. a stub encoder for benchmarks). model_name still identifies its embeddings in the cache.
+        - device (Optional[str]): Torch device of the encoder, picked automatically if None; "cpu" if None and encode_workers > 1.
+        - encode_threads (Optional[int]): Number of torch threads of each encoding process, torch's default if None; 1 if None and encode_workers > 1.
+        - drop_duplicate_postings (bool): Drop listings with the same title, company and description; if False every listing is scored, e.g. to re-score published postings one by one.
         """
         self.path_data = path_data
-        self.model = SentenceTransformer(model_name)
+        self.model_name = model_name
+        self.backend = backend
+        # Embeddings of other backends differ slightly, so they are cached apart.
+        self.encoder_id = (
+            model_name if backend == "torch" else f"{model_name}#{backend}"
+        )
+        self.embedding_cache = (
+            EmbeddingCache(cache_dir, max_items=cache_max_items) if cache_dir else None
+        )
+        self.index_dir = index_dir
+        self.n_probe = n_probe
+        self._ann_index: Optional[IVFIndex] = None
+        self._fingerprint: Optional[str] = None
+        self._job_views: Optional[
+            Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]
+        ] = None
+        self.storage = storage
+        self.pca_components = pca_components
+        self._compact_embeddings: Optional[QuantizedEmbeddings] = None
+        self.encode_workers = encode_workers
+        # The pool and the in-process path (queries, small batches) load the model
+        # alike, so that job views and queries are encoded the same way.
+        self.device = device or ("cpu" if encode_workers > 1 else None)
+        self.encode_threads = encode_threads or (1 if encode_workers > 1 else None)
+        self.encode_chunk_size = encode_chunk_size
+        self.encode_batch_size = encode_batch_size
+        self.pool_lifetime = pool_lifetime
+        self._encoding_pool: Optional[EncodingPool] = None
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self._representatives: Optional[np.ndarray] = None
+        self.encoder = encoder
+        self.drop_duplicate_postings = drop_duplicate_postings
+
+    def with_data(self, path_data: Union[str, pd.DataFrame]) -> "JobsMatcherCV":
+        """
+        Returns a matcher of other job listings sharing this matcher's model,
+        options, embedding cache and encoding pool, e.g. to encode scraped pages
+        one at a time without reopening the cache.
+
+        Args:
+        - path_data (Union[str, pd.DataFrame]): Path to the job listings dataset (Parquet file), or the job listings themselves.
+
+        Returns:
+        - JobsMatcherCV: The matcher of the new job listings.
+        """
+        matcher = copy.copy(self)
+        matcher.path_data = path_data
+        matcher._ann_index = None
+        matcher._fingerprint = None
+        matcher._job_views = None
+        matcher._compact_embeddings = None
+        matcher._representatives = None
+        return matcher
+
+    @property
+    def model(self):
+        """
+        Encoder model, loaded on first use and shared by every matcher of the process.
+
+        Returns:
+        - SentenceTransformer: The loaded model.
+        """
+        if self.encoder is not None:
+            return self.encoder
+        return get_sentence_transformer(self.model_name, self.backend, self.device)
 
     @property
     @lru_cache(maxsize=1)
@@ -33,59 +152,386 @@ class JobsMatcherCV:
         - pd.DataFrame: DataFrame containing unique job listings.
         """
         try:
-            df = pd.read_parquet(self.path_data)
-            df = df.drop_duplicates(
-                subset=["job_title", "company_name", "job_description"]
-            )
-            df["job_title"] = df["job_title"].str.replace(
-                r"\swith verification", "", regex=True
-            )
+            with tracing.span("matcher.load") as span:
+                if isinstance(self.path_data, pd.DataFrame):
+                    df = self.path_data.copy()
+                else:
+                    df = pd.read_parquet(self.path_data)
+                if self.drop_duplicate_postings:
+                    df = df.drop_duplicates(subset=POSTING_CONTENT_COLUMNS)
+                df["job_title"] = clean_job_titles(df["job_title"])
+                span.add_items(len(df))
             return df
         except Exception as e:
             raise ValueError(f"Error loading job data: {e}")
 
-    def get_job_descriptions(self) -> List[str]:
+    def _rows(self, positions: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Returns the job listings, restricted to the given row positions if any.
+
+        Args:
+        - positions (Optional[np.ndarray]): Row positions to keep, all rows if None.
+
+        Returns:
+        - pd.DataFrame: Job listings.
+        """
+        return self.data if positions is None else self.data.iloc[positions]
+
+    def get_job_descriptions(self, positions: Optional[np.ndarray] = None) -> List[str]:
         """
         Retrieves the job descriptions by combining job title and job description.
 
+        Args:
+        - positions (Optional[np.ndarray]): Row positions to keep, all rows if None.
+
         Returns:
         - List[str]: List of jobs descriptions.
         """
-        return (self.data["job_title"] + " " + self.data["job_description"]).tolist()
+        data = self._rows(positions)
+        return (data["job_title"] + " " + data["job_description"]).tolist()
 
-    def get_job_locations(self) -> List[str]:
+    def get_job_locations(self, positions: Optional[np.ndarray] = None) -> List[str]:
         """
         Retrieves the jobs locations.
 
+        Args:
+        - positions (Optional[np.ndarray]): Row positions to keep, all rows if None.
+
         Returns:
         - List[str]: List of job location.
         """
-        return (self.data["job_location"]).tolist()
+        return (self._rows(positions)["job_location"]).tolist()
 
-    def get_job_title(self) -> List[str]:
+    def get_job_title(self, positions: Optional[np.ndarray] = None) -> List[str]:
         """
         Retrieves the job title.
 
+        Args:
+        - positions (Optional[np.ndarray]): Row positions to keep, all rows if None.
+
         Returns:
         - List[str]: List of job location.
         """
-        return (self.data["job_title"]).tolist()
+        return (self._rows(positions)["job_title"]).tolist()
+
+    def get_job_language_texts(
+        self, positions: Optional[np.ndarray] = None
+    ) -> List[str]:
+        """
+        Retrieves the job descriptions prefixed with their detected language.
+
+        Args:
+        - positions (Optional[np.ndarray]): Row positions to keep, all rows if None.
+
+        Returns:
+        - List[str]: List of language-prefixed job descriptions.
+        """
+        job_texts = self.get_job_descriptions(positions)
+        with tracing.span("matcher.detect_languages") as span:
+            languages = get_language_names(job_texts)
+            span.add_items(len(job_texts))
+        return [
+            f"Language of the text : {language}  Job offer: {job_text}"
+            for language, job_text in zip(languages, job_texts)
+        ]
+
+    def get_job_view_texts(
+        self, view: str, positions: Optional[np.ndarray] = None
+    ) -> List[str]:
+        """
+        Retrieves the job texts of a given view.
+
+        Args:
+        - view (str): One of "description", "language", "title" or "location".
+        - positions (Optional[np.ndarray]): Row positions to keep, all rows if None.
+
+        Returns:
+        - List[str]: List of job texts for the view.
+        """
+        getters = {
+            "description": self.get_job_descriptions,
+            "language": self.get_job_language_texts,
+            "title": self.get_job_title,
+            "location": self.get_job_locations,
+        }
+        return getters[view](positions)
+
+    def get_near_duplicate_representatives(self) -> Optional[np.ndarray]:
+        """
+        Clusters near-identical job descriptions (reposts, multi-location postings).
+
+        Returns:
+        - Optional[np.ndarray]: Row position of each job's cluster representative, None if near-duplicate detection is disabled.
+        """
+        if self.near_duplicate_threshold is None:
+            return None
+        if self._representatives is None:
+            self._representatives = find_near_duplicates(
+                self.get_job_descriptions(), threshold=self.near_duplicate_threshold
+            )
+        return self._representatives
+
+    def get_job_view_embeddings(
+        self, positions: Optional[np.ndarray] = None
+    ) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """
+        Encodes every job view and L2-normalizes the resulting matrices once.
+
+        With near-duplicate detection, the description and language views are
+        encoded once per cluster and a row map sends each job to its cluster's row.
+
+        Args:
+        - positions (Optional[np.ndarray]): Row positions to encode, all rows if None.
+
+        Returns:
+        - Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]: L2-normalized job embeddings per view, and the row map of the deduplicated views.
+        """
+        if self._job_views is not None:
+            if positions is None:
+                return self._job_views
+            job_views, row_maps = self._job_views
+            return (
+                {
+                    view: matrix if view in row_maps else matrix[positions]
+                    for view, matrix in job_views.items()
+                },
+                {view: row_map[positions] for view, row_map in row_maps.items()},
+            )
+
+        representatives = self.get_near_duplicate_representatives()
+        job_views, row_maps = {}, {}
+        with tracing.span("matcher.encode_jobs") as span:
+            for view in JOB_VIEWS:
+                if representatives is not None and view in DEDUPLICATED_VIEWS:
+                    rows = (
+                        representatives
+                        if positions is None
+                        else representatives[positions]
+                    )
+                    view_positions, row_maps[view] = np.unique(
+                        rows, return_inverse=True
+                    )
+                else:
+                    view_positions = positions
+                job_views[view] = l2_normalize(
+                    self.get_embeddings(
+                        self.get_job_view_texts(view, view_positions), kind=view
+                    )
+                )
+            span.add_items(len(self.data) if positions is None else len(positions))
+        if positions is None:
+            # The full corpus is kept resident so later rankings skip encoding.
+            self._job_views = (job_views, row_maps)
+        return job_views, row_maps
+
+    def get_job_description_embeddings(self) -> np.ndarray:
+        """
+        Computes the L2-normalized description embedding of every job, without
+        keeping the other views resident.
 
-    def get_embeddings(self, texts: List[str]) -> np.ndarray:
+        Returns:
+        - np.ndarray: Description embeddings, one row per job.
+        """
+        representatives = self.get_near_duplicate_representatives()
+        if representatives is None:
+            return l2_normalize(
+                self.get_embeddings(self.get_job_descriptions(), kind="description")
+            )
+        unique_positions, row_map = np.unique(representatives, return_inverse=True)
+        embeddings = self.get_embeddings(
+            self.get_job_descriptions(unique_positions), kind="description"
+        )
+        return l2_normalize(embeddings)[row_map]
+
+    def _descriptions_fingerprint(self) -> str:
+        """
+        Identifies the model and job descriptions that derived artifacts are built
+        from, hashed once per job listings so that queries stay sub-linear.
+
+        Returns:
+        - str: Hex digest of the model name, the near-duplicate threshold and every job description.
+        """
+        if self._fingerprint is None:
+            digest = hashlib.sha1(self.encoder_id.encode("utf-8"))
+            # Near-duplicate clustering changes the description embeddings.
+            digest.update(f"|{self.near_duplicate_threshold}|".encode("utf-8"))
+            for job_text in self.get_job_descriptions():
+                digest.update(str(job_text).encode("utf-8") + b"\x00")
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def get_ann_index(self) -> IVFIndex:
+        """
+        Loads the approximate nearest-neighbour index over job descriptions, and
+        rebuilds it when the job listings changed since it was persisted.
+
+        Returns:
+        - IVFIndex: Index over the L2-normalized description embeddings.
+        """
+        fingerprint = self._descriptions_fingerprint()
+        if self._ann_index is None:
+            self._ann_index = IVFIndex.load(self.index_dir)
+        if self._ann_index is None or self._ann_index.fingerprint != fingerprint:
+            self._ann_index = IVFIndex.build(
+                self.get_job_description_embeddings(), fingerprint=fingerprint
+            )
+            self._ann_index.save(self.index_dir)
+        return self._ann_index
+
+    def get_compact_embeddings(self) -> QuantizedEmbeddings:
+        """
+        Loads the compact description embeddings stored alongside the job data, and
+        recomputes them when the job listings changed. In-memory job listings keep
+        their compact embeddings in memory only.
+
+        Returns:
+        - QuantizedEmbeddings: Quantized, L2-normalized description embeddings.
+        """
+        path = None
+        if isinstance(self.path_data, str):
+            suffix = f"-pca{self.pca_components}" if self.pca_components else ""
+            path = f"{os.path.splitext(self.path_data)[0]}.description.{self.storage}{suffix}.npz"
+        fingerprint = self._descriptions_fingerprint()
+        if self._compact_embeddings is None and path is not None:
+            self._compact_embeddings = QuantizedEmbeddings.load(path)
+        if (
+            self._compact_embeddings is None
+            or self._compact_embeddings.fingerprint != fingerprint
+        ):
+            self._compact_embeddings = QuantizedEmbeddings.from_embeddings(
+                self.get_job_description_embeddings(),
+                dtype=self.storage,
+                n_components=self.pca_components,
+                fingerprint=fingerprint,
+            )
+            if path is not None:
+                self._compact_embeddings.save(path)
+        return self._compact_embeddings
+
+    @contextmanager
+    def encoding_session(self):
+        """
+        Keeps a warm multi-process encoding pool for the duration of the block.
+
+        Nested sessions reuse the running pool, so one ranking call spans all job
+        views with a single pool.
+        """
+        if (
+            self.encode_workers <= 1
+            or self.encoder is not None
+            or self._encoding_pool is not None
+        ):
+            yield
+            return
+        self._encoding_pool = EncodingPool(
+            self.model_name,
+            self.encode_workers,
+            chunk_size=self.encode_chunk_size,
+            batch_size=self.encode_batch_size,
+            threads_per_worker=self.encode_threads,
+            backend=self.backend,
+            device=self.device,
+        ).start()
+        try:
+            yield
+        finally:
+            if self.pool_lifetime == "call":
+                self.close()
+
+    def close(self) -> None:
+        """
+        Stops the multi-process encoding pool, if any.
+        """
+        if self._encoding_pool is not None:
+            self._encoding_pool.close()
+            self._encoding_pool = None
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Encodes texts with the encoding pool if one is running, in-process otherwise.
+
+        Both paths encode the same chunks with the same batch size.
+
+        Args:
+        - texts (List[str]): List of text inputs to encode.
+
+        Returns:
+        - np.ndarray: Matrix of embeddings.
+        """
+        if len(texts) == 0:
+            dim = self.model.get_sentence_embedding_dimension()
+            return np.empty((0, dim), dtype=np.float32)
+        with tracing.span("matcher.encode") as span:
+            span.add_items(len(texts))
+            if self._encoding_pool is not None:
+                return self._encoding_pool.encode(texts)
+            # A shared encoder keeps the thread count of its owner.
+            threads = self.encode_threads if self.encoder is None else None
+            with encoder_threads(threads):
+                return encode_in_chunks(
+                    self.model, texts, self.encode_chunk_size, self.encode_batch_size
+                )
+
+    def get_embeddings(self, texts: List[str], kind: str = "text") -> np.ndarray:
         """
         Generates sentence embeddings for a list of texts.
 
+        When the embedding cache is enabled, only texts never seen before for this
+        model and kind are sent to the encoder.
+
         Args:
         - texts (List[str]): List of text inputs to encode.
+        - kind (str): Kind of text, part of the cache key (e.g. "title", "location").
 
         Returns:
         - np.ndarray: Matrix of embeddings.
         """
-        return self.model.encode(texts, convert_to_tensor=True)
+        if self.embedding_cache is None or len(texts) == 0:
+            # An empty cache does not know the dimension yet: _encode asks the model.
+            return self._encode(texts)
+
+        keys = [EmbeddingCache.make_key(self.encoder_id, kind, text) for text in texts]
+        slots = self.embedding_cache.lookup(keys)
+        hits = np.flatnonzero(slots >= 0)
+
+        # Encode each unseen key once, even if it appears several times in texts.
+        missing_positions: Dict[bytes, List[int]] = {}
+        for position in np.flatnonzero(slots < 0):
+            missing_positions.setdefault(keys[position], []).append(position)
+        missing_keys = list(missing_positions)
+        tracing.count("embedding_cache_hits", len(hits))
+        tracing.count("embedding_cache_misses", len(keys) - len(hits))
+        missing_texts = [texts[missing_positions[key][0]] for key in missing_keys]
+        new_embeddings = self._encode(missing_texts) if missing_texts else None
+        if new_embeddings is not None and self.embedding_cache.check_dim(
+            new_embeddings.shape[1]
+        ):
+            # The cache held embeddings of another dimension: its hits are stale.
+            return self.get_embeddings(texts, kind)
+
+        dim = (
+            new_embeddings.shape[1]
+            if new_embeddings is not None
+            else self.embedding_cache.dim
+        )
+        embeddings = np.empty((len(texts), dim), dtype=np.float32)
+        if len(hits):
+            embeddings[hits] = self.embedding_cache.get(slots[hits])
+        if new_embeddings is not None:
+            for key, embedding in zip(missing_keys, new_embeddings):
+                embeddings[missing_positions[key]] = embedding
+            self.embedding_cache.put(missing_keys, new_embeddings)
+            self.embedding_cache.flush()
+        return embeddings
 
     def rank_jobs(
-        self, cv_text: str, preferences: Dict[str, str], top_n: int = 10
-    ) -> pd.DataFrame:
+        self,
+        cv_text: str,
+        preferences: Dict[str, str],
+        top_n: int = 10,
+        lazy: bool = False,
+        n_candidates: Optional[int] = None,
+    ) -> Union[pd.DataFrame, RankedJobs]:
         """
         Ranks job positions based on similarity across different categories.
 
@@ -93,95 +539,116 @@ class JobsMatcherCV:
         - cv_text (str): CV content as a string.
         - preferences (Dict[str, str]): Dictionary of user preferences (skills, location, etc.).
         - top_n (int): Number of top-ranked jobs to return.
+        - lazy (bool): Return a RankedJobs result whose DataFrame is built on demand.
+        - n_candidates (Optional[int]): Number of jobs shortlisted by the ANN index or compact storage and scored exactly (default: max(10 * top_n, 1000)).
 
         Returns:
-        - pd.DataFrame: DataFrame with the top-ranked job positions and category-wise scores.
+        - Union[pd.DataFrame, RankedJobs]: DataFrame with the top-ranked job positions and category-wise scores.
         """
-        job_texts = self.get_job_descriptions()
-        job_embeddings = self.get_embeddings(job_texts)
+        return self.rank_jobs_batch(
+            [(cv_text, preferences)], top_n, lazy=lazy, n_candidates=n_candidates
+        )[0]
 
-        job_language_texts = [
-            f"Language of the text : {get_language_name(job_text)}  Job offer: {job_text}"
-            for job_text in job_texts
-        ]
-        job_language_embeddings = self.get_embeddings(job_language_texts)
-
-        job_title_texts = self.get_job_title()
-        job_title_embeddings = self.get_embeddings(job_title_texts)
-
-        job_location_texts = self.get_job_locations()
-        job_location_embeddings = self.get_embeddings(job_location_texts)
-
-        cv_embedding = self.get_embeddings([cv_text])[0]
-
-        overall_similarity = cosine_similarity(
-            [cv_embedding.cpu().numpy()], job_embeddings.cpu().numpy()
-        ).flatten()
-
-        category_scores = {}
-
-        for category, preference_text in preferences.items():
-            if category == "title":
-                preference_embedding = self.get_embeddings([preference_text])[0]
-                category_similarity = cosine_similarity(
-                    [preference_embedding.cpu().numpy()],
-                    job_title_embeddings.cpu().numpy(),
-                ).flatten()
-            elif category == "location":
-                preference_embedding = self.get_embeddings([preference_text])[0]
-                category_similarity = cosine_similarity(
-                    [preference_embedding.cpu().numpy()],
-                    job_location_embeddings.cpu().numpy(),
-                ).flatten()
-            if category == "title":
-                preference_embedding = self.get_embeddings([preference_text])[0]
-                category_similarity = cosine_similarity(
-                    [preference_embedding.cpu().numpy()],
-                    job_title_embeddings.cpu().numpy(),
-                ).flatten()
-            elif category == "language":
-                preference_embedding = self.get_embeddings([preference_text])[0]
-                category_similarity = cosine_similarity(
-                    [preference_embedding.cpu().numpy()],
-                    job_language_embeddings.cpu().numpy(),
-                ).flatten()
-            else:
-                preference_embedding = self.get_embeddings([preference_text])[0]
-                category_similarity = cosine_similarity(
-                    [preference_embedding.cpu().numpy()], job_embeddings.cpu().numpy()
-                ).flatten()
-
-            category_scores[category] = category_similarity
-
-        self.data["overall_similarity"] = overall_similarity
-        for category, scores in category_scores.items():
-            self.data[f"{category}_similarity"] = scores
-
-        ranked_jobs = self.data.sort_values(
-            by="overall_similarity", ascending=False
-        ).head(top_n)
-
-        return ranked_jobs[
-            [
-                "job_title",
-                "company_name",
-                "job_location",
-                "job_url",
-                "job_description",
-                "overall_similarity",
-            ]
-            + [f"{cat}_similarity" for cat in category_scores.keys()]
-        ]
+    def rank_jobs_batch(
+        self,
+        profiles: List[Tuple[str, Dict[str, str]]],
+        top_n: int = 10,
+        lazy: bool = False,
+        n_candidates: Optional[int] = None,
+    ) -> List[Union[pd.DataFrame, RankedJobs]]:
+        """
+        Ranks job positions for several candidate profiles at once.
+
+        The job corpus is encoded once, all query texts of all profiles are encoded
+        in a single batch and scored with one matrix product per job view.
+
+        Args:
+        - profiles (List[Tuple[str, Dict[str, str]]]): List of (cv_text, preferences) profiles.
+        - top_n (int): Number of top-ranked jobs to return per profile.
+        - lazy (bool): Return RankedJobs results whose DataFrames are built on demand.
+        - n_candidates (Optional[int]): Number of jobs shortlisted per profile by the ANN index or compact storage and scored exactly (default: max(10 * top_n, 1000)).
+
+        Returns:
+        - List[Union[pd.DataFrame, RankedJobs]]: Ranked jobs per profile, in the order of profiles.
+        """
+        with self.encoding_session(), tracing.span("matcher.rank") as span:
+            span.add_items(len(profiles))
+            query_texts, query_views, profile_starts = [], [], []
+            for cv_text, preferences in profiles:
+                profile_starts.append(len(query_texts))
+                query_texts += [cv_text] + list(preferences.values())
+                query_views += ["description"] + [
+                    view_for_category(category) for category in preferences
+                ]
+            with tracing.span("matcher.encode_queries"):
+                query_embeddings = l2_normalize(
+                    self.get_embeddings(query_texts, kind="query")
+                )
+
+            # With an index or compact storage, only a shortlist of approximate
+            # neighbours of the CVs is scored exactly.
+            candidates = None
+            if n_candidates is None:
+                n_candidates = max(10 * top_n, 1000)
+            if self.index_dir is not None:
+                index = self.get_ann_index()
+                candidates = np.unique(
+                    np.concatenate(
+                        [
+                            index.search(
+                                query_embeddings[start],
+                                n_candidates,
+                                n_probe=self.n_probe,
+                            )
+                            for start in profile_starts
+                        ]
+                    )
+                )
+
+            elif self.storage != "float32":
+                first_pass = self.get_compact_embeddings().score(
+                    query_embeddings[profile_starts]
+                )
+                candidates = np.unique(
+                    np.concatenate(
+                        [select_top_k(row, n_candidates) for row in first_pass]
+                    )
+                )
+
+            job_views, row_maps = self.get_job_view_embeddings(candidates)
+            with tracing.span("matcher.score"):
+                scores = score_queries(
+                    query_embeddings, query_views, job_views, row_maps
+                )
+
+            results = []
+            with tracing.span("matcher.select"):
+                for (_, preferences), start in zip(profiles, profile_starts):
+                    profile_scores = scores[start : start + 1 + len(preferences)]
+                    # Only the winning rows are selected and copied into the output.
+                    top = select_top_k(profile_scores[0], top_n)
+                    positions = top if candidates is None else candidates[top]
+                    columns = ["overall_similarity"] + [
+                        f"{category}_similarity" for category in preferences
+                    ]
+                    ranked_jobs = RankedJobs(
+                        self.data, positions, dict(zip(columns, profile_scores[:, top]))
+                    )
+                    results.append(ranked_jobs if lazy else ranked_jobs.to_frame())
+            return results
 
 
 def similarity_jobs_vs_cv(
-    path_data: str, cv_text: str, preferences: Dict[str, str], top_n: int = 10
+    path_data: Union[str, pd.DataFrame],
+    cv_text: str,
+    preferences: Dict[str, str],
+    top_n: int = 10,
 ) -> pd.DataFrame:
     """
     Matches the CV against job descriptions and returns ranked job positions.
 
     Args:
-    - path_data (str): Path to job dataset.
+    - path_data (Union[str, pd.DataFrame]): Path to job dataset, or the job listings themselves.
     - cv_text (str): CV text as a string.
     - preferences (Dict[str, str]): Dictionary containing user preferences for ranking.
     - top_n (int): Number of top jobs to return.
@@ -191,3 +658,23 @@ def similarity_jobs_vs_cv(
     """
     matcher = JobsMatcherCV(path_data)
     return matcher.rank_jobs(cv_text, preferences, top_n)
+
+
+def similarity_jobs_vs_cvs(
+    path_data: Union[str, pd.DataFrame],
+    profiles: List[Tuple[str, Dict[str, str]]],
+    top_n: int = 10,
+) -> List[pd.DataFrame]:
+    """
+    Matches several CVs against job descriptions with a single corpus encoding.
+
+    Args:
+    - path_data (Union[str, pd.DataFrame]): Path to job dataset, or the job listings themselves.
+    - profiles (List[Tuple[str, Dict[str, str]]]): List of (cv_text, preferences) profiles.
+    - top_n (int): Number of top jobs to return per profile.
+
+    Returns:
+    - List[pd.DataFrame]: Ranked DataFrames with category-wise similarity scores, one per profile.
+    """
+    matcher = JobsMatcherCV(path_data)
+    return matcher.rank_jobs_batch(profiles, top_n)
@@ -0,0 +1,109 @@
+import re
+import zlib
+import numpy as np
+from typing import Dict, List, Set
+
+# Mersenne prime used as modulus of the MinHash permutations.
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _shingles(text: str, shingle_size: int) -> np.ndarray:
+    """
+    Hashes the word n-grams of a text.
+
+    Args:
+    - text (str): Input text.
+    - shingle_size (int): Number of words per shingle.
+
+    Returns:
+    - np.ndarray: Unique 32-bit shingle hashes.
+    """
+    words = re.findall(r"\w+", str(text).lower())
+    if len(words) < shingle_size:
+        words = words + [""] * (shingle_size - len(words))
+    shingles = {
+        zlib.crc32(" ".join(words[i : i + shingle_size]).encode("utf-8"))
+        for i in range(len(words) - shingle_size + 1)
+    }
+    return np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+
+
+def minhash_signatures(
+    texts: List[str], num_perm: int = 64, shingle_size: int = 3, seed: int = 0
+) -> np.ndarray:
+    """
+    Computes MinHash signatures of texts over their word shingles.
+
+    Args:
+    - texts (List[str]): Input texts.
+    - num_perm (int): Number of hash permutations (signature length).
+    - shingle_size (int): Number of words per shingle.
+    - seed (int): Random seed of the permutations.
+
+    Returns:
+    - np.ndarray: Signature matrix of shape (n_texts, num_perm).
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _MAX_HASH, size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, _MAX_HASH, size=num_perm, dtype=np.uint64)
+    signatures = np.empty((len(texts), num_perm), dtype=np.uint64)
+    for i, text in enumerate(texts):
+        shingles = _shingles(text, shingle_size)
+        # a, b and shingles are below 2**32, so a * x + b does not overflow uint64.
+        signatures[i] = ((np.outer(shingles, a) + b) % _PRIME).min(axis=0)
+    return signatures
+
+
+def find_near_duplicates(
+    texts: List[str],
+    threshold: float = 0.8,
+    num_perm: int = 64,
+    bands: int = 16,
+    shingle_size: int = 3,
+) -> np.ndarray:
+    """
+    Clusters near-identical texts with MinHash and locality-sensitive hashing.
+
+    Texts are visited in order. A text sharing a band of its signature with
+    members of earlier clusters is compared with the representatives of these
+    clusters, and joins the most similar one if their estimated Jaccard
+    similarity reaches the threshold; otherwise it represents a new cluster.
+    Every member is thus a near-duplicate of its representative, whose
+    description it is scored with: similarity is not chained from member to
+    member.
+
+    Args:
+    - texts (List[str]): Input texts.
+    - threshold (float): Minimum estimated Jaccard similarity of near-duplicates.
+    - num_perm (int): Number of hash permutations, must be a multiple of bands.
+    - bands (int): Number of LSH bands.
+    - shingle_size (int): Number of words per shingle.
+
+    Returns:
+    - np.ndarray: Position of each text's cluster representative (its first member).
+    """
+    signatures = minhash_signatures(texts, num_perm, shingle_size)
+    representatives = np.arange(len(texts))
+    rows = num_perm // bands
+    # Representatives of the clusters with a member in each bucket, per band.
+    buckets: List[Dict[bytes, Set[int]]] = [{} for _ in range(bands)]
+
+    for i in range(len(texts)):
+        keys = [
+            signatures[i, band * rows : (band + 1) * rows].tobytes()
+            for band in range(bands)
+        ]
+        candidates = set()
+        for band, key in enumerate(keys):
+            candidates.update(buckets[band].get(key, ()))
+        if candidates:
+            candidates = sorted(candidates)
+            similarity = np.mean(signatures[candidates] == signatures[i], axis=1)
+            best = int(np.argmax(similarity))
+            if similarity[best] >= threshold:
+                representatives[i] = candidates[best]
+        for band, key in enumerate(keys):
+            buckets[band].setdefault(key, set()).add(representatives[i])
+
+    return representatives.astype(np.int64)
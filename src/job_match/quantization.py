@@ -0,0 +1,148 @@
+import os
+import numpy as np
+from typing import Optional
+
+STORAGE_DTYPES = ("float16", "int8")
+
+
+class QuantizedEmbeddings:
+    def __init__(
+        self,
+        codes: np.ndarray,
+        scales: Optional[np.ndarray] = None,
+        components: Optional[np.ndarray] = None,
+        fingerprint: str = "",
+    ):
+        """
+        Compact, approximate copy of an embedding matrix used for first-pass scoring.
+
+        Vectors are stored as float16, or as int8 with one float32 scale per vector,
+        optionally after a projection on their leading principal directions.
+
+        Args:
+        - codes (np.ndarray): float16 or int8 matrix, one row per vector.
+        - scales (Optional[np.ndarray]): Per-vector scale of the int8 codes.
+        - components (Optional[np.ndarray]): PCA projection of shape (n_components, dim).
+        - fingerprint (str): Identifier of the data the embeddings were computed from.
+        """
+        self.codes = codes
+        self.scales = scales
+        self.components = components
+        self.fingerprint = fingerprint
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            array.nbytes
+            for array in (self.codes, self.scales, self.components)
+            if array is not None
+        )
+
+    @classmethod
+    def from_embeddings(
+        cls,
+        embeddings: np.ndarray,
+        dtype: str = "int8",
+        n_components: Optional[int] = None,
+        sample_size: int = 50_000,
+        fingerprint: str = "",
+        seed: int = 0,
+    ) -> "QuantizedEmbeddings":
+        """
+        Quantizes an embedding matrix.
+
+        Args:
+        - embeddings (np.ndarray): L2-normalized float32 embeddings.
+        - dtype (str): Storage type, "float16" or "int8".
+        - n_components (Optional[int]): Number of PCA directions kept, no projection if None.
+        - sample_size (int): Maximum number of rows used to fit the projection.
+        - fingerprint (str): Identifier of the data the embeddings were computed from.
+        - seed (int): Random seed for the PCA sample.
+
+        Returns:
+        - QuantizedEmbeddings: The compact embeddings.
+        """
+        if dtype not in STORAGE_DTYPES:
+            raise ValueError(f"Unknown storage dtype: {dtype}")
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+
+        components = None
+        if n_components is not None and n_components < embeddings.shape[1]:
+            # Uncentered projection, so dot products are preserved rather than
+            # covariances.
+            rng = np.random.default_rng(seed)
+            size = min(sample_size, len(embeddings))
+            sample = embeddings[rng.choice(len(embeddings), size=size, replace=False)]
+            _, _, vt = np.linalg.svd(sample, full_matrices=False)
+            components = vt[:n_components].astype(np.float32)
+            embeddings = embeddings @ components.T
+
+        if dtype == "float16":
+            return cls(embeddings.astype(np.float16), None, components, fingerprint)
+
+        scales = np.abs(embeddings).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        codes = np.round(embeddings / scales[:, None]).astype(np.int8)
+        return cls(codes, scales.astype(np.float32), components, fingerprint)
+
+    def score(self, queries: np.ndarray, chunk_size: int = 65_536) -> np.ndarray:
+        """
+        Approximates the dot products between queries and the stored vectors.
+
+        Args:
+        - queries (np.ndarray): L2-normalized float32 queries, one row per query.
+        - chunk_size (int): Number of stored vectors decoded at once, bounds memory use.
+
+        Returns:
+        - np.ndarray: Approximate similarity matrix of shape (n_queries, n_vectors).
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        if self.components is not None:
+            queries = queries @ self.components.T
+        scores = np.empty((len(queries), len(self.codes)), dtype=np.float32)
+        for start in range(0, len(self.codes), chunk_size):
+            block = self.codes[start : start + chunk_size].astype(np.float32)
+            scores[:, start : start + chunk_size] = queries @ block.T
+        if self.scales is not None:
+            scores *= self.scales
+        return scores
+
+    def save(self, path: str) -> None:
+        """
+        Persists the compact embeddings to a .npz file.
+
+        Args:
+        - path (str): Destination file.
+        """
+        arrays = {"codes": self.codes, "fingerprint": np.array(self.fingerprint)}
+        if self.scales is not None:
+            arrays["scales"] = self.scales
+        if self.components is not None:
+            arrays["components"] = self.components
+        tmp_path = path + ".tmp.npz"
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["QuantizedEmbeddings"]:
+        """
+        Loads compact embeddings saved with ``save``.
+
+        Args:
+        - path (str): Source file.
+
+        Returns:
+        - Optional[QuantizedEmbeddings]: The compact embeddings, or None if the file is missing.
+        """
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as arrays:
+            return cls(
+                arrays["codes"],
+                arrays["scales"] if "scales" in arrays else None,
+                arrays["components"] if "components" in arrays else None,
+                str(arrays["fingerprint"]),
+            )
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional
+
+# Job columns kept in the ranking output, before the similarity columns.
+OUTPUT_COLUMNS = [
+    "job_title",
+    "company_name",
+    "job_location",
+    "job_url",
+    "job_description",
+]
+
+
+class RankedJobs:
+    def __init__(
+        self, data: pd.DataFrame, positions: np.ndarray, scores: Dict[str, np.ndarray]
+    ):
+        """
+        Ranking result that only builds its DataFrame when it is first needed.
+
+        Args:
+        - data (pd.DataFrame): Full job listings the positions refer to.
+        - positions (np.ndarray): Row positions of the ranked jobs, best first.
+        - scores (Dict[str, np.ndarray]): Similarity columns, aligned with positions.
+        """
+        self.data = data
+        self.positions = positions
+        self.scores = scores
+        self._frame: Optional[pd.DataFrame] = None
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Materializes the ranked jobs with their similarity columns.
+
+        Returns:
+        - pd.DataFrame: DataFrame with the ranked job positions and category-wise scores.
+        """
+        if self._frame is None:
+            frame = self.data.iloc[self.positions][OUTPUT_COLUMNS].copy()
+            for column, values in self.scores.items():
+                frame[column] = values
+            self._frame = frame
+        return self._frame
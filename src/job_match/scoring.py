@@ -0,0 +1,104 @@
+import numpy as np
+from typing import Dict, List, Optional
+
+# Job-side embedding matrices computed for every posting.
+JOB_VIEWS = ("description", "language", "title", "location")
+
+# Views built from the full job description, shared by near-duplicate postings.
+DEDUPLICATED_VIEWS = ("description", "language")
+
+# Preference categories scored against a dedicated job view, all other
+# categories (skills, experience, ...) are scored against the description.
+CATEGORY_VIEWS = {"title": "title", "location": "location", "language": "language"}
+
+# Version of the scores, bumped whenever the same profile and postings score
+# differently, so that stored scores are recomputed rather than mixed with new
+# ones. Version 1: "location" is scored against the job location; it used to be
+# scored against the description.
+SCORING_VERSION = 1
+
+
+def view_for_category(category: str) -> str:
+    """
+    Returns the job view a preference category is compared against.
+
+    Args:
+    - category (str): Preference category (e.g. "skills", "title").
+
+    Returns:
+    - str: Name of the job view.
+    """
+    return CATEGORY_VIEWS.get(category, "description")
+
+
+def l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+    """
+    Scales each row to unit L2 norm so that dot products are cosine similarities.
+
+    Args:
+    - embeddings (np.ndarray): Matrix of embeddings.
+
+    Returns:
+    - np.ndarray: Row-normalized float32 matrix.
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return embeddings / norms
+
+
+def score_queries(
+    query_embeddings: np.ndarray,
+    query_views: List[str],
+    job_views: Dict[str, np.ndarray],
+    row_maps: Optional[Dict[str, np.ndarray]] = None,
+) -> np.ndarray:
+    """
+    Computes the cosine similarity of every query against its job view.
+
+    Queries sharing a view are scored together with a single matrix product. Views
+    with a row map hold one row per near-duplicate cluster; their scores are
+    fanned back out to every job of the cluster.
+
+    Args:
+    - query_embeddings (np.ndarray): L2-normalized query embeddings, one row per query.
+    - query_views (List[str]): Job view each query is compared against.
+    - job_views (Dict[str, np.ndarray]): L2-normalized job embeddings per view.
+    - row_maps (Optional[Dict[str, np.ndarray]]): Row of each job in the deduplicated views.
+
+    Returns:
+    - np.ndarray: Similarity matrix of shape (n_queries, n_jobs).
+    """
+    row_maps = row_maps or {}
+    first_view = next(iter(job_views))
+    n_jobs = len(row_maps.get(first_view, job_views[first_view]))
+    scores = np.empty((len(query_views), n_jobs), dtype=np.float32)
+    views = np.asarray(query_views)
+    for view in dict.fromkeys(query_views):
+        rows = np.flatnonzero(views == view)
+        view_scores = query_embeddings[rows] @ job_views[view].T
+        if view in row_maps:
+            view_scores = view_scores[:, row_maps[view]]
+        scores[rows] = view_scores
+    return scores
+
+
+def select_top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Selects the positions of the k highest scores without sorting the whole vector.
+
+    Args:
+    - scores (np.ndarray): Score vector.
+    - k (int): Number of positions to keep.
+
+    Returns:
+    - np.ndarray: Positions of the k best scores, in descending score order.
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
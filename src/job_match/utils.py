@@ -1,24 +1,166 @@
-from langdetect import detect
+from langdetect import DetectorFactory, detect
+import hashlib
+import multiprocessing
 import pycountry
-from typing import Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
+# Seed langdetect so the same text always gets the same language.
+DetectorFactory.seed = 0
 
-def get_language_name(text: str) -> Optional[str]:
+# Number of leading characters of a text used for language detection.
+MAX_DETECTION_CHARS = 2000
+
+# Languages of the most recently seen texts, least recently used first.
+MAX_MEMO_SIZE = 200_000
+_language_memo: "OrderedDict[bytes, Optional[str]]" = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+def _memo_get(key: bytes) -> Tuple[bool, Optional[str]]:
     """
-    Detects the language of the provided text and returns the corresponding language name.
+    Looks up a memoized language and marks it as recently used.
 
     Args:
-        text (str): The input text for which the language needs to be detected.
+        key (bytes): Key of the text.
 
     Returns:
-        Optional[str]: The name of the detected language or None if the language is not found.
+        Tuple[bool, Optional[str]]: Whether the text is memoized, and its language.
+    """
+    with _memo_lock:
+        if key not in _language_memo:
+            return False, None
+        _language_memo.move_to_end(key)
+        return True, _language_memo[key]
+
+
+def _memo_put(items: Iterable[Tuple[bytes, Optional[str]]]) -> None:
+    """
+    Memoizes languages, evicting the least recently used beyond MAX_MEMO_SIZE.
+
+    Args:
+        items (Iterable[Tuple[bytes, Optional[str]]]): (key, language) pairs.
+    """
+    with _memo_lock:
+        for key, name in items:
+            _language_memo[key] = name
+            _language_memo.move_to_end(key)
+        while len(_language_memo) > MAX_MEMO_SIZE:
+            _language_memo.popitem(last=False)
+
+
+def clear_language_memo() -> None:
+    """
+    Forgets every memoized language.
+    """
+    with _memo_lock:
+        _language_memo.clear()
+
+
+@lru_cache(maxsize=None)
+def get_language_name_from_code(language_code: str) -> Optional[str]:
+    """
+    Converts an ISO 639-1 language code into a language name.
+
+    Args:
+        language_code (str): Two-letter language code (e.g. "fr").
+
+    Returns:
+        Optional[str]: The language name or None if the code is unknown.
+    """
+    language = pycountry.languages.get(alpha_2=language_code)
+    if language:
+        return language.name
+    return None
+
+
+def _detect_language_name(text: str) -> Optional[str]:
+    """
+    Detects the language of a text prefix without memoization.
+
+    Args:
+        text (str): The input text.
+
+    Returns:
+        Optional[str]: The name of the detected language or None if detection fails.
     """
     try:
-        language_code = detect(text)
-        language = pycountry.languages.get(alpha_2=language_code)
-        if language:
-            return language.name
-        return None
+        return get_language_name_from_code(detect(text[:MAX_DETECTION_CHARS]))
     except Exception as e:
         print(f"Error detecting language: {e}")
         return None
+
+
+def _text_key(text: str) -> bytes:
+    return hashlib.sha1(text[:MAX_DETECTION_CHARS].encode("utf-8")).digest()
+
+
+def get_language_name(text: str) -> Optional[str]:
+    """
+    Detects the language of the provided text and returns the corresponding language name.
+
+    Args:
+        text (str): The input text for which the language needs to be detected.
+
+    Returns:
+        Optional[str]: The name of the detected language or None if the language is not found.
+    """
+    text = str(text)
+    key = _text_key(text)
+    found, name = _memo_get(key)
+    if not found:
+        name = _detect_language_name(text)
+        _memo_put([(key, name)])
+    return name
+
+
+def get_language_names(
+    texts: List[str],
+    n_workers: Optional[int] = None,
+    min_parallel_size: int = 2000,
+    chunksize: int = 64,
+) -> List[Optional[str]]:
+    """
+    Detects the languages of many texts, skipping texts already seen and fanning
+    large batches out to a process pool.
+
+    Args:
+        texts (List[str]): The input texts.
+        n_workers (Optional[int]): Number of worker processes (default: number of CPUs).
+        min_parallel_size (int): Minimum number of unseen texts before a pool is used.
+        chunksize (int): Number of texts sent to a worker at once.
+
+    Returns:
+        List[Optional[str]]: The language name per text, None where detection fails.
+    """
+    texts = [str(text) for text in texts]
+    keys = [_text_key(text) for text in texts]
+    known, pending = {}, {}
+    for key, text in zip(keys, texts):
+        if key in known or key in pending:
+            continue
+        found, name = _memo_get(key)
+        if found:
+            known[key] = name
+        else:
+            pending[key] = text[:MAX_DETECTION_CHARS]
+
+    if len(pending) >= min_parallel_size and n_workers != 1:
+        # Spawned workers avoid forking a process that already runs torch threads.
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            names = list(
+                executor.map(
+                    _detect_language_name, pending.values(), chunksize=chunksize
+                )
+            )
+    else:
+        names = [_detect_language_name(text) for text in pending.values()]
+    known.update(zip(pending, names))
+    _memo_put(zip(pending, names))
+
+    return [known[key] for key in keys]
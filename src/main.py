@@ -1,42 +1,37 @@
-from job_match.job_match import similarity_jobs_vs_cv
-from job_match.job_gps_coordinates import GpsFinder
-from selenium import webdriver
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from web_scrapping.web_scrap_lk import LinkedingJobScrapper
-from utils.utils import get_most_recent_file
+from utils.seen_jobs import SeenJobIndex
+from utils import tracing
+from datetime import date, timedelta
+from typing import Callable, List, Optional
+import argparse
 import os
 import logging
+import time
 
 base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+embedding_cache_dir = os.path.join(base_dir, "Data", "cache", "embeddings")
 
-# Set up logging configuration with relative paths
-log_dir = os.path.join(base_dir, "logs")
-if not os.path.exists(log_dir):
-    os.makedirs(log_dir)
-
-logging.basicConfig(
-    level=logging.INFO,  # Set log level to INFO, can be adjusted to DEBUG or ERROR
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),  # Log to console
-        logging.FileHandler(
-            os.path.join(log_dir, "scraping_process.log")
-        ),  # Log to a file in 'logs' folder
-    ],
-)
 
-if __name__ == "__main__":
-    # Relative paths based on the current script's directory
-    path_chrome_profil = "user-data-dir=/home/adrien/.config/google-chrome/"
-    path_save_scrapping_parquet = os.path.join(base_dir, "Data/save_jobs_data")
-    path_config_scrapping = os.path.join(
-        base_dir, "src/web_scrapping", "config_scrapping.yaml"
-    )
-    path_data_save_streamlit = os.path.join(base_dir, "Data", "streamlit_data")
+def build_chrome_driver(path_chrome_profil: str):
+    """
+    Builds the headless Chrome WebDriver used for scraping.
+
+    Selenium and webdriver_manager are imported here so that stages which do not
+    scrape never pay for them.
+
+    Args:
+        path_chrome_profil (str): Chrome argument pointing to the user profile directory.
+
+    Returns:
+        webdriver.Chrome: The Chrome WebDriver.
+    """
+    start = time.perf_counter()
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from web_scrapping.browser_pool import chromedriver_path
+
+    logging.info(f"Imported selenium in {time.perf_counter() - start:.2f}s")
 
-    logging.info("Starting the web scraping process")
     # chromedriver conf
     options = Options()
     options.add_argument(path_chrome_profil)
@@ -49,56 +44,725 @@ if __name__ == "__main__":
     )
     options.add_argument("--headless")
 
-    logging.info("Initializing the Chrome WebDriver")
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()), options=options
+    return webdriver.Chrome(service=Service(chromedriver_path()), options=options)
+
+
+def run_scraping(
+    path_chrome_profil: str,
+    path_config_scrapping: str,
+    path_save_scrapping_parquet: str,
+    n_browsers: int = 1,
+    seen_index=None,
+    checkpoint_dir: Optional[str] = None,
+    page_sink: Optional[Callable[[List[dict]], None]] = None,
+) -> None:
+    """
+    Scrapes LinkedIn job listings and saves them to Parquet.
+
+    Listings are streamed to disk page by page with a checkpoint, so that an
+    interrupted run resumes where it stopped when started again.
+
+    Args:
+        path_chrome_profil (str): Chrome argument pointing to the user profile directory.
+        path_config_scrapping (str): Path to the scraping YAML configuration.
+        path_save_scrapping_parquet (str): Directory where scraped listings are saved.
+        n_browsers (int): Number of concurrent browsers; above 1 the searches are sharded across a browser pool.
+        seen_index (Optional[SeenJobIndex]): Index of the postings scraped in earlier runs, which are skipped.
+        checkpoint_dir (Optional[str]): Directory of the run checkpoint (default: Data/cache/scrape_checkpoint).
+        page_sink (Optional[Callable[[List[dict]], None]]): Receives the listings of every scraped page once saved.
+    """
+    from web_scrapping.web_scrap_lk import LinkedingJobScrapper
+
+    checkpoint_dir = checkpoint_dir or os.path.join(
+        base_dir, "Data", "cache", "scrape_checkpoint"
     )
+    if n_browsers > 1:
+        from web_scrapping.browser_pool import (
+            BrowserPool,
+            chromedriver_path,
+            worker_profile,
+        )
+
+        logging.info(f"Scraping with a pool of {n_browsers} browsers")
+        # Resolved before the workers start, which then share the binary.
+        chromedriver_path()
+        pool = BrowserPool(
+            lambda worker: build_chrome_driver(
+                worker_profile(path_chrome_profil, worker)
+            ),
+            n_workers=n_browsers,
+            config_path=path_config_scrapping,
+            seen_index=seen_index,
+        )
+        n_listings = pool.run_checkpointed(
+            path_save_scrapping_parquet, checkpoint_dir, page_sink=page_sink
+        )
+        logging.info(f"Saved {n_listings} scraped job listings to Parquet")
+        return
+
+    logging.info("Initializing the Chrome WebDriver")
+    driver = build_chrome_driver(path_chrome_profil)
     # web scrapping and saving data
 
     logging.info("Initializing the LinkedIn Job Scraper")
-    web_scrapper = LinkedingJobScrapper(driver, config_path=path_config_scrapping)
-
-    logging.info("Running the web scraper to collect job listings")
-    job_listings_full = web_scrapper.run()
+    web_scrapper = LinkedingJobScrapper(
+        driver, config_path=path_config_scrapping, seen_index=seen_index
+    )
 
-    logging.info("Saving scraped job listings to Parquet")
-    web_scrapper.save_listing_to_parquet(
-        job_listings_full, saving_path=path_save_scrapping_parquet
+    logging.info("Running the web scraper, saving job listings page by page")
+    n_listings = web_scrapper.run_checkpointed(
+        path_save_scrapping_parquet, checkpoint_dir, page_sink=page_sink
     )
+    logging.info(f"Saved {n_listings} scraped job listings to Parquet")
+
 
-    logging.info("Fetching the most recent scraped data file")
-    path_scrapped_parquet = get_most_recent_file(path_save_scrapping_parquet)
+def run_matching(
+    path_scrapped_parquet,
+    cv_text: str,
+    preferences: dict,
+    top_n: int = 1000,
+    matcher_options: Optional[dict] = None,
+):
+    """
+    Ranks the scraped jobs against a CV and preferences.
 
-    logging.info("Running similarity search on job listings")
-    # Vector search based on text and preferences
-    cv_text_example = """
-    Junior with 2-3 years of experience Graduated in Data science and Quantative Finance. Data Scientist with expertise in machine learning, statistical modeling, and finance. Skilled in extracting insights, building predictive models, and developing data-driven solutions. Currently exploring MLOps to enhance model deployment, monitoring, and scalability.
+    Job embeddings are read from the persistent embedding cache, so postings
+    already encoded in an earlier run (or by the pipeline's embedding stage) are
+    not encoded again.
 
-    Key leveraged techniques: Using python, developing Streamlit dashboards, building models for signature and checkbox detection, applying clustering and anomaly detection techniques, and using NLP with BERT for text analysis
+    Args:
+        path_scrapped_parquet (Union[str, pd.DataFrame]): Path to the scraped Parquet file, or the scraped jobs.
+        cv_text (str): CV text.
+        preferences (dict): Preferences by category.
+        top_n (int): Number of top jobs to return.
+        matcher_options (Optional[dict]): JobsMatcherCV options, e.g. model_name and backend (default: its defaults).
 
-    Performing a literature review, collecting accounting and financial data from various sources, applying target balancing techniques, and training models (XGBoost, Random Forest, SVM, and deep learning) to compare their performance with the baseline model
+    Returns:
+        pd.DataFrame: Ranked jobs.
     """
-    preferences_example = {
-        "skills": "Pandas, Numpy, Sql, SciPy, Xgboost, Tensorflow, Dask, Plotly, Streamlit, Keras, NLP,OpenCV, OCR, Hugging Face, MLflow, Google Could Platform, API,Python,Pytorch,PySpark, AWS (EC2/S3) ,VBA, Scikit-learn,Git/Gitlab",
-        "title": "Data Scientist, Machine Learning Engineer",
-        "location": "France, Germany, Switzerland, Italy, Belgium, Luxembourg",
-        "language": "French, Italian, English",
-        "experience": "2-3 years experience, Junior, Graduated, Data scientist",
+    start = time.perf_counter()
+    from job_match.job_match import JobsMatcherCV
+
+    logging.info(f"Imported job_match in {time.perf_counter() - start:.2f}s")
+    matcher = JobsMatcherCV(
+        path_scrapped_parquet, cache_dir=embedding_cache_dir, **(matcher_options or {})
+    )
+    return matcher.rank_jobs(cv_text, preferences, top_n)
+
+
+def geocoding_options() -> dict:
+    """
+    GpsFinder options shared by every geocoding step: the persistent geocoding
+    cache and, when Data/gazetteer/cities.txt (a GeoNames dump, e.g.
+    cities15000.txt) exists, the offline gazetteer.
+
+    Returns:
+        dict: Keyword arguments of GpsFinder.
+    """
+    cache_path = os.path.join(base_dir, "Data", "cache", "geocoding.sqlite")
+    gazetteer_path = os.path.join(base_dir, "Data", "gazetteer", "cities.txt")
+    return {
+        "cache_path": cache_path,
+        "gazetteer": gazetteer_path if os.path.exists(gazetteer_path) else None,
     }
-    ranked_jobs = similarity_jobs_vs_cv(
-        path_scrapped_parquet, cv_text_example, preferences_example, top_n=1000
+
+
+def run_geocoding(ranked_jobs):
+    """
+    Adds GPS coordinates to the ranked jobs, from the offline gazetteer, the
+    persistent geocoding cache and the online geocoder.
+
+    Args:
+        ranked_jobs (pd.DataFrame): Ranked jobs.
+
+    Returns:
+        pd.DataFrame: Ranked jobs with latitude and longitude columns.
+    """
+    from job_match.job_gps_coordinates import GpsFinder
+
+    gps_finder = GpsFinder(ranked_jobs, **geocoding_options())
+    return gps_finder.get_job_with_coordinates()
+
+
+def run_pipeline(
+    path_chrome_profil: str,
+    path_config_scrapping: str,
+    path_save_scrapping_parquet: str,
+    n_browsers: int = 1,
+    seen_index=None,
+    queue_size: int = 8,
+    matcher_options: Optional[dict] = None,
+) -> None:
+    """
+    Scrapes job listings while embedding and geocoding the scraped pages
+    concurrently, so that the encoder and the geocoder work while the browser
+    waits for LinkedIn.
+
+    Pages flow through bounded queues: when a stage falls behind, the scraper
+    blocks until it catches up. The stages fill the embedding and geocoding
+    caches, so the final ranking and geocoding of the accumulated postings only
+    read cached results.
+
+    Args:
+        path_chrome_profil (str): Chrome argument pointing to the user profile directory.
+        path_config_scrapping (str): Path to the scraping YAML configuration.
+        path_save_scrapping_parquet (str): Directory where scraped listings are saved.
+        n_browsers (int): Number of concurrent browsers.
+        seen_index (Optional[SeenJobIndex]): Index of the postings scraped in earlier runs, which are skipped.
+        queue_size (int): Maximum number of pages waiting for each stage.
+        matcher_options (Optional[dict]): JobsMatcherCV options of the final ranking, so that the embedding stage fills the cache under the same model.
+    """
+    import pandas as pd
+    from job_match.job_match import JobsMatcherCV
+    from job_match.job_gps_coordinates import GpsFinder
+    from utils.pipeline import FanOut, QueueWorker
+
+    gps_finder = GpsFinder(pd.DataFrame(), **geocoding_options())
+    resolved_locations = set()
+
+    # One matcher keeps the model and the embedding cache open for every page.
+    matcher = JobsMatcherCV(
+        pd.DataFrame(), cache_dir=embedding_cache_dir, **(matcher_options or {})
+    )
+
+    def embed_page(job_listings: List[dict]) -> None:
+        matcher.with_data(pd.DataFrame(job_listings)).get_job_view_embeddings()
+
+    def geocode_page(job_listings: List[dict]) -> None:
+        locations = GpsFinder.clean_locations(
+            pd.DataFrame(job_listings)["job_location"]
+        )
+        new_locations = [
+            location
+            for location in locations.dropna().unique()
+            if location not in resolved_locations
+        ]
+        resolved_locations.update(new_locations)
+        if new_locations:
+            gps_finder.resolve_locations(new_locations)
+
+    stages = FanOut(
+        [
+            QueueWorker("embed", embed_page, maxsize=queue_size),
+            QueueWorker("geocode", geocode_page, maxsize=queue_size),
+        ]
     )
+    with stages:
+        run_scraping(
+            path_chrome_profil,
+            path_config_scrapping,
+            path_save_scrapping_parquet,
+            n_browsers=n_browsers,
+            seen_index=seen_index,
+            page_sink=stages.put,
+        )
+        logging.info("Scraping done, waiting for the embedding and geocoding stages")
+    for line in stages.report():
+        logging.info(line)
+
 
-    logging.info("Fetching job coordinates for visualization")
-    # Get job gps coordinates for ploting purpose in streamlit
-    ranked_jobs = GpsFinder(ranked_jobs).get_job_with_coordinates()
+def run_incremental_update(
+    dataset,
+    store,
+    cv_text: str,
+    preferences: dict,
+    refreshed_job_ids: Optional[List[str]] = None,
+    matcher_options: Optional[dict] = None,
+):
+    """
+    Matches and geocodes only the postings not seen in earlier runs, and merges
+    them into the versioned dashboard dataset.
+
+    Every dataset file not processed yet and scraped within the expiry window is
+    read, so earlier scrapes are kept; only the files of the window are recorded
+    as processed. A change of CV, preferences or scoring version re-matches
+    the postings currently published, keeping their coordinates and their
+    first_seen/last_seen times; expired postings are not brought back.
 
-    logging.info(f"Saving final data to {path_data_save_streamlit}")
-    # Save final streamlit  data
-    if not os.path.exists(path_data_save_streamlit):
-        os.makedirs(path_data_save_streamlit)
-    ranked_jobs.to_parquet(
-        os.path.join(path_data_save_streamlit, "data_streamlit.parquet")
+    Args:
+        dataset (JobDataset): Dataset of scraped job listings.
+        store (DashboardStore): Versioned dashboard dataset.
+        cv_text (str): CV text.
+        preferences (dict): Preferences by category.
+        refreshed_job_ids (Optional[List[str]]): IDs of postings still online but skipped by the scraper because already seen; they are kept from expiring.
+        matcher_options (Optional[dict]): JobsMatcherCV options, e.g. model_name and backend.
+
+    Returns:
+        pd.DataFrame: Matched postings after the update.
+    """
+    import pandas as pd
+    from job_match.scoring import SCORING_VERSION
+    from utils.dashboard_store import DashboardStore
+    from utils.utils import add_job_ids, posting_contents
+
+    profile = DashboardStore.profile_hash(cv_text, preferences, SCORING_VERSION)
+    state = store.load_state()
+    state.setdefault("processed_files", [])
+    current = store.load()
+    profile_changed = state.get("profile_hash") != profile
+    if profile_changed:
+        state["profile_hash"] = profile
+        if len(current):
+            logging.info(
+                f"CV or preferences changed, matching the {len(current)} published postings again"
+            )
+            current = rematch_postings(current, cv_text, preferences, matcher_options)
+
+    processed_files = set(state["processed_files"])
+    # Postings of older files would expire right away.
+    window_start = date.today() - timedelta(days=store.expiry_days)
+    window_files = dataset.files(since=window_start)
+    new_files = [file for file in window_files if file not in processed_files]
+    # Files that left the window are never read again: they are dropped from the
+    # state, which stays bounded by the files of the window.
+    state["processed_files"] = [
+        file for file in window_files if file in processed_files
+    ]
+    if not new_files:
+        logging.info("No new scrape files to process")
+        if profile_changed:
+            store.publish(current)
+        store.save_state(state)
+        return current
+
+    scraped = add_job_ids(dataset.read(files=new_files))
+    known_ids = set(current["job_id"]) if len(current) else set()
+    delta = scraped[~scraped["job_id"].isin(known_ids)].drop_duplicates("job_id")
+    # Reposts of published postings under a new ID refresh the published copy,
+    # as a full run keeps one posting per title, company and description.
+    reposted_ids = []
+    if len(current) and len(delta):
+        published_contents = posting_contents(current)
+        delta_contents = posting_contents(delta)
+        reposted = delta_contents.isin(published_contents)
+        reposted_ids = current.loc[
+            published_contents.isin(delta_contents[reposted]), "job_id"
+        ].tolist()
+        delta = delta[~reposted]
+    logging.info(f"{len(scraped)} scraped postings, {len(delta)} new postings to match")
+
+    if len(delta):
+        ranked_delta = run_matching(
+            delta,
+            cv_text,
+            preferences,
+            top_n=len(delta),
+            matcher_options=matcher_options,
+        )
+        ranked_delta = run_geocoding(add_job_ids(ranked_delta))
+    else:
+        ranked_delta = pd.DataFrame()
+
+    seen_job_ids = (
+        scraped["job_id"].tolist() + reposted_ids + list(refreshed_job_ids or [])
     )
+    merged = store.merge(current, ranked_delta, seen_job_ids)
+    logging.info(f"Publishing {len(merged)} matched postings")
+    store.publish(merged)
+    state["processed_files"] += new_files
+    store.save_state(state)
+    return merged
+
+
+def rematch_postings(
+    current, cv_text: str, preferences: dict, matcher_options: Optional[dict] = None
+):
+    """
+    Scores published postings against a new CV or new preferences.
+
+    Every published posting is scored, reposts with the same content included,
+    and only its similarity columns are replaced: coordinates, first_seen/last_seen
+    times and every other column are kept, so postings are neither geocoded again
+    nor counted as seen again.
+
+    Args:
+        current (pd.DataFrame): Published postings, with a "job_id" column.
+        cv_text (str): CV text.
+        preferences (dict): Preferences by category.
+        matcher_options (Optional[dict]): JobsMatcherCV options, e.g. model_name and backend.
+
+    Returns:
+        pd.DataFrame: The postings with their new similarity columns.
+    """
+    similarity_columns = [
+        column for column in current.columns if column.endswith("_similarity")
+    ]
+    postings = current.drop(columns=similarity_columns).reset_index(drop=True)
+    rematched = run_matching(
+        postings,
+        cv_text,
+        preferences,
+        top_n=len(postings),
+        matcher_options={**(matcher_options or {}), "drop_duplicate_postings": False},
+    )
+    # The ranking keeps the index of the postings it was given.
+    new_similarity_columns = [
+        column for column in rematched.columns if column.endswith("_similarity")
+    ]
+    return postings.join(rematched[new_similarity_columns])
+
+
+STAGES = ("scrape", "dedupe", "embed", "rank", "geocode", "publish")
+# Stages whose work the incremental publish does itself on the new postings only
+INCREMENTAL_SKIPPED = ("dedupe", "embed", "rank", "geocode")
+
+
+def load_run_config(path: str) -> dict:
+    """
+    Loads the run configuration (see src/config_run-example.yaml).
+
+    Args:
+        path (str): Path to the YAML run configuration.
+
+    Returns:
+        dict: The run configuration.
+    """
+    import yaml
+
+    with open(path, "r", encoding="utf-8") as file:
+        config = yaml.safe_load(file)
+    unknown = set(config.get("stages", STAGES)) - set(STAGES)
+    if unknown:
+        raise ValueError(f"Unknown stages {sorted(unknown)}, expected {STAGES}")
+    return config
+
+
+class StageRunner:
+    def __init__(self, config: dict, force: bool = False):
+        """
+        Runs the named stages of a run configuration, memoizing every stage output
+        by a hash of its inputs and parameters.
+
+        Upstream stages needed by a requested stage are resolved from the memo (or
+        computed when missing); scrape and publish only run when requested.
+
+        Args:
+            config (dict): Run configuration.
+            force (bool): Recompute the requested stages even when memoized.
+        """
+        from utils.job_dataset import JobDataset
+        from utils.stage_cache import StageCache
+
+        self.config = config
+        self.force = force
+        self.paths = {
+            name: path if os.path.isabs(path) else os.path.join(base_dir, path)
+            for name, path in config["paths"].items()
+            if name != "chrome_profile"
+        }
+        self.stage_cache = StageCache(self.paths["stage_cache"])
+        self.dataset = JobDataset(self.paths["dataset"])
+        self.requested = ()
+        self.seen_index = None
+        self.scraping_started = None
+        self._outputs = {}
+
+    def section(self, stage: str) -> dict:
+        """
+        Args:
+            stage (str): Name of the stage.
+
+        Returns:
+            dict: Parameters of the stage, empty if not configured.
+        """
+        return self.config.get(stage) or {}
+
+    def matcher_options(self) -> dict:
+        """
+        Returns:
+            dict: JobsMatcherCV options of the embed section (model_name, backend).
+        """
+        params = self.section("embed")
+        return {
+            name: params[name] for name in ("model_name", "backend") if params.get(name)
+        }
+
+    def run(self, stages) -> None:
+        """
+        Runs stages in pipeline order.
+
+        Args:
+            stages (Iterable[str]): Names of the stages to run.
+        """
+        self.requested = tuple(stage for stage in STAGES if stage in stages)
+        for stage in self.requested:
+            if stage in INCREMENTAL_SKIPPED and self.section("publish").get(
+                "incremental"
+            ):
+                # run_incremental_update matches and geocodes the new postings itself.
+                logging.info(f"Incremental publish, skipping stage {stage}")
+                continue
+            if self.needs_postings(stage) and not len(self.output("dedupe")[1]):
+                logging.info(f"No scraped posting to match, skipping stage {stage}")
+                continue
+            self.output(stage)
+
+    def needs_postings(self, stage: str) -> bool:
+        """
+        Args:
+            stage (str): Name of the stage.
+
+        Returns:
+            bool: Whether the stage works on the deduplicated postings.
+        """
+        if stage == "publish":
+            return not self.section("publish").get("incremental")
+        return stage in ("embed", "rank", "geocode")
+
+    def output(self, stage: str):
+        """
+        Key and output of a stage, computed at most once per run.
+
+        Args:
+            stage (str): Name of the stage.
+
+        Returns:
+            Tuple[str, Optional[pd.DataFrame]]: Key of the stage output, and the output itself.
+        """
+        if stage not in self._outputs:
+            start = time.perf_counter()
+            with tracing.span(f"stage.{stage}"):
+                self._outputs[stage] = getattr(self, f"stage_{stage}")()
+            logging.info(f"Stage {stage} done in {time.perf_counter() - start:.2f}s")
+        return self._outputs[stage]
+
+    def memoized(self, stage: str, key: str, compute):
+        """
+        Loads a memoized stage output, or computes and stores it.
+
+        Args:
+            stage (str): Name of the stage.
+            key (str): Hash of the stage inputs and parameters.
+            compute (Callable[[], pd.DataFrame]): Computes the output.
+
+        Returns:
+            Tuple[str, pd.DataFrame]: Key and output of the stage.
+        """
+        output = None
+        if not (self.force and stage in self.requested):
+            output = self.stage_cache.load(stage, key)
+        if output is not None:
+            logging.info(f"Stage {stage}: reusing memoized output {key}")
+        else:
+            output = compute()
+            self.stage_cache.save(stage, key, output)
+        return key, output
+
+    def stage_scrape(self):
+        """
+        Scrapes new postings into the dataset when requested. Its key identifies
+        the files of the dataset, so downstream stages re-run after every scrape.
+        """
+        if "scrape" in self.requested:
+            params = self.section("scrape")
+            if params.get("skip_seen"):
+                self.seen_index = SeenJobIndex(
+                    os.path.join(base_dir, "Data", "cache", "seen_jobs.sqlite")
+                )
+            self.scraping_started = time.time()
+            options = {}
+            scrape = run_scraping
+            if params.get("pipeline"):
+                scrape = run_pipeline
+                options["matcher_options"] = self.matcher_options()
+            scrape(
+                self.config["paths"]["chrome_profile"],
+                self.paths["scraping_config"],
+                self.paths["dataset"],
+                n_browsers=params.get("browsers", 1),
+                seen_index=self.seen_index,
+                **options,
+            )
+        return self.stage_cache.key(self.dataset.manifest()), None
+
+    def stage_dedupe(self):
+        """
+        Selects the postings to match and removes duplicates (same LinkedIn job
+        found by several searches, or identical title, company and description).
+        """
+        params = self.section("dedupe")
+        since_days = params.get("since_days", 1)
+        locations = params.get("search_locations")
+        files = self.dataset.files(
+            since=date.today() - timedelta(days=since_days - 1), locations=locations
+        )
+        latest = self.dataset.latest_date(locations)
+        if not files and latest is not None:
+            # e.g. re-ranking on a day without scrape: use the last scrape instead.
+            logging.info(
+                f"Nothing scraped during the last {since_days} days, "
+                f"matching the postings scraped on {latest}"
+            )
+            files = self.dataset.files(since=latest, until=latest, locations=locations)
+        self.output("scrape")
+        key = self.stage_cache.key("dedupe", files, params)
+
+        def compute():
+            from utils.utils import add_job_ids
+
+            logging.info(f"Reading {len(files)} scraped files")
+            scraped = add_job_ids(self.dataset.read(files=files))
+            scraped = scraped.drop_duplicates("job_id")
+            return scraped.drop_duplicates(
+                subset=["job_title", "company_name", "job_description"]
+            ).reset_index(drop=True)
+
+        return self.memoized("dedupe", key, compute)
+
+    def stage_embed(self):
+        """
+        Encodes every job view of the deduplicated postings into the persistent
+        embedding cache. The output only records the encoded job IDs.
+        """
+        import pandas as pd
+
+        dedupe_key, postings = self.output("dedupe")
+        options = self.matcher_options()
+        key = self.stage_cache.key("embed", dedupe_key, options)
+
+        def compute():
+            from job_match.job_match import JobsMatcherCV
+
+            matcher = JobsMatcherCV(postings, cache_dir=embedding_cache_dir, **options)
+            matcher.get_job_view_embeddings()
+            return pd.DataFrame({"job_id": postings["job_id"]})
+
+        return self.memoized("embed", key, compute)
+
+    def stage_rank(self):
+        """
+        Ranks the deduplicated postings against the CV and preferences.
+        """
+        from job_match.scoring import SCORING_VERSION
+
+        dedupe_key, postings = self.output("dedupe")
+        self.output("embed")
+        profile = self.config["profile"]
+        options = self.matcher_options()
+        top_n = self.section("rank").get("top_n", 1000)
+        key = self.stage_cache.key(
+            "rank",
+            dedupe_key,
+            options,
+            profile["cv_text"],
+            profile["preferences"],
+            top_n,
+            SCORING_VERSION,
+        )
+        return self.memoized(
+            "rank",
+            key,
+            lambda: run_matching(
+                postings,
+                profile["cv_text"],
+                profile["preferences"],
+                top_n=top_n,
+                matcher_options=options,
+            ),
+        )
+
+    def stage_geocode(self):
+        """
+        Adds GPS coordinates to the ranked postings.
+        """
+        rank_key, ranked_jobs = self.output("rank")
+        key = self.stage_cache.key("geocode", rank_key)
+        return self.memoized("geocode", key, lambda: run_geocoding(ranked_jobs.copy()))
+
+    def stage_publish(self):
+        """
+        Writes the data read by the dashboard, or merges the new postings into the
+        versioned dashboard dataset in incremental mode.
+        """
+        params = self.section("publish")
+        profile = self.config["profile"]
+        if params.get("incremental"):
+            from utils.dashboard_store import DashboardStore
+
+            store = DashboardStore(
+                self.paths["dashboard"], expiry_days=params.get("expiry_days", 14)
+            )
+            refreshed_job_ids = None
+            if self.seen_index is not None:
+                refreshed_job_ids = self.seen_index.seen_since(self.scraping_started)
+            self.output("scrape")
+            run_incremental_update(
+                self.dataset,
+                store,
+                profile["cv_text"],
+                profile["preferences"],
+                refreshed_job_ids=refreshed_job_ids,
+                matcher_options=self.matcher_options(),
+            )
+            return None, None
+
+        _, ranked_jobs = self.output("geocode")
+        logging.info(f"Saving final data to {self.paths['dashboard']}")
+        os.makedirs(self.paths["dashboard"], exist_ok=True)
+        ranked_jobs.to_parquet(
+            os.path.join(self.paths["dashboard"], "data_streamlit.parquet")
+        )
+        return None, None
+
+
+if __name__ == "__main__":
+    # Set up logging configuration with relative paths. Only here: spawned pool
+    # workers import this file again as __mp_main__ and must not redo it.
+    log_dir = os.path.join(base_dir, "logs")
+    if not os.path.exists(log_dir):
+        os.makedirs(log_dir)
+
+    logging.basicConfig(
+        level=logging.INFO,  # Set log level to INFO, can be adjusted to DEBUG or ERROR
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.StreamHandler(),  # Log to console
+            logging.FileHandler(
+                os.path.join(log_dir, "scraping_process.log")
+            ),  # Log to a file in 'logs' folder
+        ],
+    )
+
+    parser = argparse.ArgumentParser(description="Scrape, match and geocode jobs.")
+    parser.add_argument(
+        "--config",
+        default=None,
+        help="Run configuration (default: src/config_run.yaml, else src/config_run-example.yaml)",
+    )
+    parser.add_argument(
+        "--stages",
+        nargs="+",
+        choices=STAGES,
+        default=None,
+        help="Stages to run (default: the stages of the configuration)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompute the requested stages even if their output is memoized",
+    )
+    args = parser.parse_args()
+
+    config_path = args.config
+    if config_path is None:
+        config_path = os.path.join(base_dir, "src", "config_run.yaml")
+        if not os.path.exists(config_path):
+            config_path = os.path.join(base_dir, "src", "config_run-example.yaml")
+    logging.info(f"Loading run configuration {config_path}")
+    config = load_run_config(config_path)
+
+    stages = args.stages or config.get("stages", STAGES)
+    logging.info(f"Running stages: {', '.join(stages)}")
+    trace = config.get("trace") or {}
+    try:
+        StageRunner(config, force=args.force).run(stages)
+    finally:
+        # Failed runs are reported too, to see where they spent their time.
+        if trace.get("report"):
+            report_path = os.path.join(base_dir, trace["report"])
+            tracing.tracer.write_json(report_path)
+            logging.info(f"Run report saved to {report_path}")
+        if trace.get("prometheus"):
+            tracing.tracer.write_prometheus(os.path.join(base_dir, trace["prometheus"]))
 
     logging.info("Web scraping and data processing completed successfully")
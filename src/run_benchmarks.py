@@ -0,0 +1,88 @@
+import argparse
+import json
+import os
+import sys
+
+from benchmarks.checks import run_checks
+from benchmarks.corpus import generate_corpus
+from benchmarks.suite import compare, run_suite
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark ranking, geocoding and dashboard preparation on synthetic job corpora, offline."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000],
+        help="Numbers of job listings of the synthetic corpora (e.g. 1000 100000 1000000)",
+    )
+    parser.add_argument(
+        "--benchmarks",
+        nargs="+",
+        choices=["rank_jobs", "gps_finder", "dashboard"],
+        default=None,
+        help="Benchmarks to run (default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the corpora")
+    parser.add_argument(
+        "--output",
+        default=os.path.join(base_dir, "Data", "benchmarks", "latest.json"),
+        help="JSON file receiving the results",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Results of an earlier run to compare against; exits with status 1 on regressions",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Relative slowdown tolerated before reporting a regression",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="First check the geocoding client's rate limit, concurrency, retries and cache against stub geocoders (in-process and local HTTP); exits with status 1 on failure",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        try:
+            checks = run_checks(generate_corpus(args.sizes[0], seed=args.seed))
+        except AssertionError as e:
+            print(f"Check failed: {e}")
+            sys.exit(1)
+        for name, measurements in checks.items():
+            print(f"Check {name} passed: {measurements}")
+
+    results = run_suite(
+        args.sizes, repeat=args.repeat, seed=args.seed, benchmarks=args.benchmarks
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+
+    for key, stats in results["results"].items():
+        print(f"{key:<40} {stats['median_s'] * 1000:>10.1f} ms")
+    print(f"Results saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        rows = compare(results, baseline, tolerance=args.tolerance)
+        for row in rows:
+            print(
+                f"{row['key']:<40} {row['baseline_s'] * 1000:>10.1f} ms -> "
+                f"{row['current_s'] * 1000:>10.1f} ms  x{row['ratio']:.2f}  {row['status']}"
+            )
+        regressions = [row for row in rows if row["status"] == "regression"]
+        if regressions:
+            print(f"{len(regressions)} regressions against {args.baseline}")
+            sys.exit(1)
@@ -1,9 +1,9 @@
 import streamlit as st
-import pandas as pd
 import folium
 from streamlit_folium import st_folium
 from folium.plugins import MarkerCluster
 from utils.data_loader import get_data
+from utils.page_data import SIMILARITY_COLUMNS, map_markers
 from utils.utils_filter import (
     apply_normalization,
     create_filters,
@@ -15,14 +15,7 @@ data_path = "Data/streamlit_data/data_streamlit.parquet"
 data = get_data(data_path).copy()
 
 
-similarity_columns = [
-    "overall_similarity",
-    "skills_similarity",
-    "title_similarity",
-    "location_similarity",
-    "language_similarity",
-    "experience_similarity",
-]
+similarity_columns = SIMILARITY_COLUMNS
 
 data = apply_normalization(data, similarity_columns)
 
@@ -42,22 +35,8 @@ st.markdown(f"### Showing {len(filtered_data)} jobs")
 m = folium.Map(location=[50.0, 20.0], zoom_start=4)
 marker_cluster = MarkerCluster().add_to(m)
 
-for _, row in filtered_data.iterrows():
-    if pd.notna(row["latitude"]) and pd.notna(row["longitude"]):
-        try:
-            lat, lon = float(row["latitude"]), float(row["longitude"])
-
-            if pd.notna(row["job_url"]):
-                popup_html = (
-                    f'<a href="{row["job_url"]}" target="_blank">{row["job_title"]}</a>'
-                )
-            else:
-                popup_html = row["job_title"]
-
-            popup = folium.Popup(popup_html, max_width=300)
-            folium.Marker([lat, lon], popup=popup).add_to(marker_cluster)
-
-        except ValueError:
-            continue
+for lat, lon, popup_html in map_markers(filtered_data).itertuples(index=False):
+    popup = folium.Popup(popup_html, max_width=300)
+    folium.Marker([lat, lon], popup=popup).add_to(marker_cluster)
 
 st_folium(m, width=1200, height=600)
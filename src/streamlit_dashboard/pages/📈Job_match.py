@@ -1,6 +1,6 @@
 import streamlit as st
-import pandas as pd
 from utils.data_loader import get_data
+from utils.page_data import SIMILARITY_COLUMNS, table_html
 from utils.utils_filter import (
     apply_normalization,
     create_filters,
@@ -11,14 +11,7 @@ from utils.utils_filter import (
 data_path = "Data/streamlit_data/data_streamlit.parquet"
 data = get_data(data_path).copy()
 
-similarity_columns = [
-    "overall_similarity",
-    "skills_similarity",
-    "title_similarity",
-    "location_similarity",
-    "language_similarity",
-    "experience_similarity",
-]
+similarity_columns = SIMILARITY_COLUMNS
 
 data = apply_normalization(data, similarity_columns)
 
@@ -33,32 +26,6 @@ filtered_data = filter_data(
 )
 
 
-def make_clickable(title, url):
-    if pd.notna(url):
-        return f'<a href="{url}" target="_blank">{title}</a>'
-    return title
-
-
-filtered_data["job_title"] = filtered_data.apply(
-    lambda row: make_clickable(row["job_title"], row["job_url"]), axis=1
-)
-
-column_rename_map = {
-    "job_title": "Job Title",
-    "company_name": "Company",
-    "job_location": "Location",
-    "overall_similarity": "Overall Match",
-    "skills_similarity": "Skills Match",
-    "title_similarity": "Title Match",
-    "location_similarity": "Location Match",
-    "language_similarity": "Language Match",
-    "experience_similarity": "Experience Match",
-}
-
-display_data = filtered_data.rename(columns=column_rename_map)
 st.markdown("### 🔍 Explore and rank job matches based on your profile")
-st.markdown(f"### Showing {len(display_data)} jobs")
-st.write(
-    display_data[list(column_rename_map.values())].to_html(escape=False, index=False),
-    unsafe_allow_html=True,
-)
+st.markdown(f"### Showing {len(filtered_data)} jobs")
+st.write(table_html(filtered_data), unsafe_allow_html=True)
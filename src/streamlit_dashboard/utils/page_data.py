@@ -0,0 +1,75 @@
+import pandas as pd
+
+SIMILARITY_COLUMNS = [
+    "overall_similarity",
+    "skills_similarity",
+    "title_similarity",
+    "location_similarity",
+    "language_similarity",
+    "experience_similarity",
+]
+
+COLUMN_RENAME_MAP = {
+    "job_title": "Job Title",
+    "company_name": "Company",
+    "job_location": "Location",
+    "overall_similarity": "Overall Match",
+    "skills_similarity": "Skills Match",
+    "title_similarity": "Title Match",
+    "location_similarity": "Location Match",
+    "language_similarity": "Language Match",
+    "experience_similarity": "Experience Match",
+}
+
+
+def clickable_titles(data: pd.DataFrame) -> pd.Series:
+    """
+    Turn job titles into links to their LinkedIn posting.
+
+    Args:
+        data (pd.DataFrame): Jobs with "job_title" and "job_url" columns.
+
+    Returns:
+        pd.Series: HTML links, or the plain title for jobs without URL.
+    """
+    # A missing title would turn the whole link into NaN.
+    titles = data["job_title"].fillna("").astype(str)
+    links = '<a href="' + data["job_url"] + '" target="_blank">' + titles + "</a>"
+    return links.where(data["job_url"].notna(), titles)
+
+
+def map_markers(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Prepare the markers of the job locations map.
+
+    Args:
+        data (pd.DataFrame): Filtered jobs with coordinates.
+
+    Returns:
+        pd.DataFrame: One row per job with valid coordinates: "latitude", "longitude" and the "popup" HTML.
+    """
+    markers = pd.DataFrame(
+        {
+            "latitude": pd.to_numeric(data["latitude"], errors="coerce"),
+            "longitude": pd.to_numeric(data["longitude"], errors="coerce"),
+            "popup": clickable_titles(data),
+        }
+    )
+    return markers.dropna(subset=["latitude", "longitude"])
+
+
+def table_html(data: pd.DataFrame) -> str:
+    """
+    Render the job match table.
+
+    Args:
+        data (pd.DataFrame): Filtered and sorted jobs.
+
+    Returns:
+        str: HTML table with clickable titles and readable column names.
+    """
+    display_data = data.assign(job_title=clickable_titles(data))
+    display_data = display_data.rename(columns=COLUMN_RENAME_MAP)
+    return display_data[list(COLUMN_RENAME_MAP.values())].to_html(
+        escape=False, index=False
+    )
@@ -1,5 +1,4 @@
 import pandas as pd
-import streamlit as st
 from typing import Optional
 
 
@@ -81,6 +80,9 @@ def sidebar_filters(
             - search_location (str): The location search string.
             - sort_by (str): The column to sort by.
     """
+    # Imported here so that the data helpers of this module run without streamlit.
+    import streamlit as st
+
     filters = {}
     with st.sidebar:
         st.header(f"🔎 Filters")
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import pandas as pd
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+
+class DashboardStore:
+    def __init__(
+        self,
+        directory: str,
+        file_name: str = "data_streamlit.parquet",
+        expiry_days: int = 14,
+        max_rows: Optional[int] = 1000,
+        keep_versions: int = 10,
+    ):
+        """
+        Versioned dataset of matched and geocoded postings behind the dashboard.
+
+        Every update writes a new version with all non-expired postings to
+        ``versions/`` and publishes the best ``max_rows`` of them as the file read
+        by the Streamlit pages.
+
+        Args:
+            directory (str): Directory of the dashboard data.
+            file_name (str): Name of the published file read by the dashboard.
+            expiry_days (int): Postings not scraped again for this many days are dropped.
+            max_rows (Optional[int]): Number of best-ranked postings published, all if None.
+            keep_versions (int): Number of dataset versions kept on disk.
+        """
+        self.directory = directory
+        self.file_name = file_name
+        self.expiry_days = expiry_days
+        self.max_rows = max_rows
+        self.keep_versions = keep_versions
+        self.versions_dir = os.path.join(directory, "versions")
+        self.state_path = os.path.join(directory, "incremental_state.json")
+        os.makedirs(self.versions_dir, exist_ok=True)
+
+    @staticmethod
+    def profile_hash(
+        cv_text: str, preferences: Dict[str, str], scoring_version: int = 0
+    ) -> str:
+        """
+        Identify the CV, preferences and scoring the stored scores were computed with.
+
+        Args:
+            cv_text (str): CV text.
+            preferences (Dict[str, str]): Preferences by category.
+            scoring_version (int): Version of the scoring, see job_match.scoring.SCORING_VERSION.
+
+        Returns:
+            str: Hex digest of the profile.
+        """
+        payload = json.dumps([cv_text, preferences, scoring_version], sort_keys=True)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def load_state(self) -> Dict:
+        """
+        Load the incremental state (profile hash and processed scrape files).
+
+        Returns:
+            Dict: The state, empty if no update ran yet.
+        """
+        if not os.path.exists(self.state_path):
+            return {}
+        with open(self.state_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def save_state(self, state: Dict) -> None:
+        """
+        Atomically persist the incremental state.
+
+        Args:
+            state (Dict): The state to save.
+        """
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(state, file, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def _versions(self) -> List[str]:
+        return sorted(
+            os.path.join(self.versions_dir, file)
+            for file in os.listdir(self.versions_dir)
+            if file.endswith(".parquet")
+        )
+
+    def load(self) -> pd.DataFrame:
+        """
+        Load the latest version of the matched postings.
+
+        Returns:
+            pd.DataFrame: Matched postings, empty if no version exists.
+        """
+        versions = self._versions()
+        if not versions:
+            return pd.DataFrame()
+        return pd.read_parquet(versions[-1])
+
+    def merge(
+        self,
+        current: pd.DataFrame,
+        new_postings: pd.DataFrame,
+        seen_job_ids: List[str],
+        now: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        Merge newly matched postings into the current ones and expire stale postings.
+
+        Args:
+            current (pd.DataFrame): Matched postings of the latest version.
+            new_postings (pd.DataFrame): Newly matched and geocoded postings, with a "job_id" column.
+            seen_job_ids (List[str]): IDs of every posting found in the new scrapes.
+            now (Optional[datetime]): Time of the update (default: now).
+
+        Returns:
+            pd.DataFrame: The merged postings.
+        """
+        now = pd.Timestamp(now or datetime.now())
+        new_postings = new_postings.copy()
+        new_postings["first_seen"] = now
+        new_postings["last_seen"] = now
+        if len(current):
+            current = current.copy()
+            current.loc[current["job_id"].isin(seen_job_ids), "last_seen"] = now
+            merged = pd.concat([current, new_postings], ignore_index=True)
+        else:
+            merged = new_postings.reset_index(drop=True)
+        merged = merged.drop_duplicates(subset="job_id", keep="first")
+        expiry = now - timedelta(days=self.expiry_days)
+        return merged[merged["last_seen"] >= expiry].reset_index(drop=True)
+
+    def publish(self, data: pd.DataFrame) -> str:
+        """
+        Write a new version and publish the best-ranked postings to the dashboard.
+
+        Args:
+            data (pd.DataFrame): Matched postings.
+
+        Returns:
+            str: Path of the published file.
+        """
+        version = datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")
+        data.to_parquet(os.path.join(self.versions_dir, f"matched_{version}.parquet"))
+        for old_version in self._versions()[: -self.keep_versions]:
+            os.remove(old_version)
+
+        published = data
+        # Empty frames (e.g. nothing matched yet) have no similarity column.
+        if "overall_similarity" in data.columns:
+            published = data.sort_values(by="overall_similarity", ascending=False)
+        if self.max_rows is not None:
+            published = published.head(self.max_rows)
+        path = os.path.join(self.directory, self.file_name)
+        tmp_path = path + ".tmp"
+        published.to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+        return path
@@ -0,0 +1,411 @@
+import json
+import os
+import uuid
+import pandas as pd
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import quote
+
+MANIFEST_NAME = "_manifest.jsonl"
+
+# Columns written by the scraper, the schema of a dataset without any file yet.
+LISTING_COLUMNS = [
+    "job_title",
+    "company_name",
+    "job_location",
+    "job_url",
+    "job_description",
+]
+
+
+class JobDataset:
+    def __init__(self, root: str, row_group_size: int = 10_000):
+        """
+        Hive-partitioned Parquet dataset of scraped job listings.
+
+        Files are laid out as ``date=YYYY-MM-DD/search_location=<location>/part-*.parquet``.
+        Every write creates new files and appends their description to a JSON-lines
+        manifest, so concurrent or repeated runs never overwrite each other and
+        readers never walk the directory tree.
+
+        Args:
+            root (str): Root directory of the dataset.
+            row_group_size (int): Maximum number of rows per Parquet row group.
+        """
+        self.root = root
+        self.row_group_size = row_group_size
+        self.manifest_path = os.path.join(root, MANIFEST_NAME)
+        os.makedirs(root, exist_ok=True)
+
+    def _append_manifest(self, entries: List[Dict]) -> None:
+        """
+        Append file entries to the manifest in a single write.
+
+        Args:
+            entries (List[Dict]): Manifest entries.
+        """
+        lines = "".join(json.dumps(entry) + "\n" for entry in entries)
+        with open(self.manifest_path, "a", encoding="utf-8") as file:
+            file.write(lines)
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _new_file(self, location: str, written_at: datetime) -> Tuple[str, str]:
+        """
+        Create the partition directory of a new file.
+
+        Args:
+            location (str): Search location of the file.
+            written_at (datetime): Time of the scrape.
+
+        Returns:
+            Tuple[str, str]: Path of the file relative to the root, and its full path.
+        """
+        partition = os.path.join(
+            f"date={written_at:%Y-%m-%d}",
+            f"search_location={quote(str(location), safe='')}",
+        )
+        os.makedirs(os.path.join(self.root, partition), exist_ok=True)
+        file_name = f"part-{written_at:%H%M%S}-{uuid.uuid4().hex[:8]}.parquet"
+        relative_path = os.path.join(partition, file_name)
+        return relative_path, os.path.join(self.root, relative_path)
+
+    @staticmethod
+    def to_storage_types(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drop the partition column and type text columns explicitly, so that all-null
+        columns keep a string schema.
+
+        Args:
+            data (pd.DataFrame): Job listings of one search location.
+
+        Returns:
+            pd.DataFrame: The listings as stored in a file.
+        """
+        data = data.drop(columns=["search_location"], errors="ignore")
+        text_columns = data.select_dtypes(include="object").columns
+        return data.astype({column: "string" for column in text_columns})
+
+    @staticmethod
+    def _entry(
+        relative_path: str,
+        location: str,
+        rows: int,
+        written_at: datetime,
+        source: Optional[str] = None,
+    ) -> Dict:
+        """
+        Manifest entry of a written file.
+
+        Args:
+            relative_path (str): Path of the file relative to the root.
+            location (str): Search location of the file.
+            rows (int): Number of rows of the file.
+            written_at (datetime): Time of the scrape.
+            source (Optional[str]): Identifier of the written content, if any.
+
+        Returns:
+            Dict: The manifest entry.
+        """
+        entry = {
+            "path": relative_path,
+            "date": f"{written_at:%Y-%m-%d}",
+            "search_location": str(location),
+            "rows": rows,
+            "written_at": written_at.isoformat(),
+        }
+        if source is not None:
+            entry["source"] = source
+        return entry
+
+    def manifest(self) -> List[Dict]:
+        """
+        Read the manifest entries, oldest first.
+
+        Returns:
+            List[Dict]: One entry per file with its path, partition values and row count.
+        """
+        if not os.path.exists(self.manifest_path):
+            return []
+        with open(self.manifest_path, "r", encoding="utf-8") as file:
+            # A torn last line (crash during append) is ignored.
+            entries = []
+            for line in file:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+            return entries
+
+    def sources(self) -> Set[str]:
+        """
+        Returns:
+            Set[str]: Identifiers of the content already written (see write and write_pages).
+        """
+        return {entry["source"] for entry in self.manifest() if "source" in entry}
+
+    def has_source(self, source: str) -> bool:
+        """
+        Args:
+            source (str): Identifier given to write or write_pages.
+
+        Returns:
+            bool: Whether a file of this content is already in the dataset.
+        """
+        return source in self.sources()
+
+    def write(
+        self,
+        data: pd.DataFrame,
+        search_location: Optional[str] = None,
+        written_at: Optional[datetime] = None,
+        source: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Append job listings to the dataset, one file per search location.
+
+        Args:
+            data (pd.DataFrame): Job listings; a "search_location" column is used when present.
+            search_location (Optional[str]): Search location of every listing, overrides the column.
+            written_at (Optional[datetime]): Time of the scrape (default: now).
+            source (Optional[str]): Identifier of the content, recorded in the manifest (see has_source).
+
+        Returns:
+            List[str]: Paths of the written files.
+        """
+        written_at = written_at or datetime.now()
+        data = data.copy()
+        if search_location is not None or "search_location" not in data:
+            data["search_location"] = search_location or "unknown"
+        data["search_location"] = data["search_location"].fillna("unknown")
+
+        paths, entries = [], []
+        for location, group in data.groupby("search_location", sort=False):
+            # Partition values live in the path, not in the file.
+            relative_path, path = self._new_file(location, written_at)
+            self.to_storage_types(group).to_parquet(
+                path, engine="pyarrow", index=False, row_group_size=self.row_group_size
+            )
+            paths.append(path)
+            entries.append(
+                self._entry(relative_path, location, len(group), written_at, source)
+            )
+        self._append_manifest(entries)
+        return paths
+
+    def write_pages(
+        self,
+        pages: Iterable[pd.DataFrame],
+        search_location: str,
+        written_at: Optional[datetime] = None,
+        source: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Stream pages of job listings of one search location into a single file, one
+        row group per page, holding a single page in memory at a time.
+
+        The file is part of the dataset once its manifest entry is appended; a file
+        left by a crash before that point is never read.
+
+        Args:
+            pages (Iterable[pd.DataFrame]): Pages of job listings.
+            search_location (str): Search location of every listing.
+            written_at (Optional[datetime]): Time of the scrape (default: now).
+            source (Optional[str]): Identifier of the content, recorded in the manifest so that a retried write can be detected with has_source.
+
+        Returns:
+            Optional[str]: Path of the written file, None if every page was empty.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        written_at = written_at or datetime.now()
+        writer, schema, rows = None, None, 0
+        relative_path, path = None, None
+        try:
+            for page in pages:
+                if not len(page):
+                    continue
+                table = pa.Table.from_pandas(
+                    self.to_storage_types(page), preserve_index=False
+                )
+                if writer is None:
+                    relative_path, path = self._new_file(search_location, written_at)
+                    schema = table.schema
+                    writer = pq.ParquetWriter(path, schema)
+                else:
+                    # Columns missing from a page are written as nulls.
+                    table = pa.Table.from_pandas(
+                        self.to_storage_types(page).reindex(columns=schema.names),
+                        schema=schema,
+                        preserve_index=False,
+                    )
+                writer.write_table(table, row_group_size=self.row_group_size)
+                rows += len(page)
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is None:
+            return None
+        self._append_manifest(
+            [self._entry(relative_path, search_location, rows, written_at, source)]
+        )
+        return path
+
+    def files(
+        self,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        locations: Optional[List[str]] = None,
+    ) -> List[str]:
+        """
+        List the dataset files matching date and location filters, from the manifest.
+
+        Args:
+            since (Optional[date]): First scrape date included.
+            until (Optional[date]): Last scrape date included.
+            locations (Optional[List[str]]): Search locations included, all if None.
+
+        Returns:
+            List[str]: Full paths of the matching files, oldest first.
+        """
+        selected = []
+        for entry in self.manifest():
+            entry_date = date.fromisoformat(entry["date"])
+            if since is not None and entry_date < since:
+                continue
+            if until is not None and entry_date > until:
+                continue
+            if locations is not None and entry["search_location"] not in locations:
+                continue
+            selected.append(os.path.join(self.root, entry["path"]))
+        return selected
+
+    def latest_date(self, locations: Optional[List[str]] = None) -> Optional[date]:
+        """
+        Args:
+            locations (Optional[List[str]]): Search locations included, all if None.
+
+        Returns:
+            Optional[date]: Date of the latest scrape, None if nothing was scraped.
+        """
+        dates = [
+            date.fromisoformat(entry["date"])
+            for entry in self.manifest()
+            if locations is None or entry["search_location"] in locations
+        ]
+        return max(dates, default=None)
+
+    def read(
+        self,
+        columns: Optional[List[str]] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        locations: Optional[List[str]] = None,
+        filter=None,
+        files: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Read job listings with partition pruning, column projection and row filters.
+
+        Partitions are pruned from the manifest; the optional ``filter`` is pushed
+        down to the Parquet row groups by pyarrow.
+
+        Args:
+            columns (Optional[List[str]]): Columns to read, all if None. "date" and "search_location" are available as columns.
+            since (Optional[date]): First scrape date included.
+            until (Optional[date]): Last scrape date included.
+            locations (Optional[List[str]]): Search locations included, all if None.
+            filter (Optional[pyarrow.dataset.Expression]): Row filter, e.g. ``ds.field("company_name") == "ACME"``.
+            files (Optional[List[str]]): Explicit files to read instead of the manifest selection.
+
+        Returns:
+            pd.DataFrame: The selected job listings.
+        """
+        import pyarrow.dataset as ds
+
+        if files is None:
+            files = self.files(since=since, until=until, locations=locations)
+        if not files:
+            return self._empty_frame(columns)
+        dataset = ds.dataset(
+            files,
+            format="parquet",
+            partitioning=ds.partitioning(flavor="hive"),
+            partition_base_dir=self.root,
+        )
+        return dataset.to_table(columns=columns, filter=filter).to_pandas()
+
+    def _empty_frame(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Listings frame without rows, with the columns of the latest file of the
+        dataset (the scraped columns if the dataset is empty) and its partition
+        columns, so that callers of an empty selection find the usual columns.
+
+        Args:
+            columns (Optional[List[str]]): Columns to keep, all if None.
+
+        Returns:
+            pd.DataFrame: The empty frame.
+        """
+        import pyarrow.parquet as pq
+
+        entries = self.manifest()
+        if entries:
+            path = os.path.join(self.root, entries[-1]["path"])
+            frame = pq.read_schema(path).empty_table().to_pandas()
+        else:
+            frame = pd.DataFrame(columns=LISTING_COLUMNS, dtype="string")
+        for partition in ("date", "search_location"):
+            if partition not in frame:
+                frame[partition] = pd.Series(dtype="string")
+        return frame if columns is None else frame.reindex(columns=columns)
+
+    def import_legacy(self, legacy_dir: str) -> int:
+        """
+        One-off import of the files written by the scraper before the dataset
+        existed, ``parquet_files/<YYYY-MM-DD_HH>/data_<YYYY-MM-DD_HH>.parquet``.
+
+        Each file is dated from its folder name and filed under the "unknown"
+        search location. Files already imported are skipped, so the import can be
+        run again safely.
+
+        Args:
+            legacy_dir (str): The old "parquet_files" directory.
+
+        Returns:
+            int: Number of imported files.
+        """
+        imported, sources = 0, self.sources()
+        for folder in sorted(os.listdir(legacy_dir)):
+            try:
+                written_at = datetime.strptime(folder, "%Y-%m-%d_%H")
+            except ValueError:
+                continue
+            for name in sorted(os.listdir(os.path.join(legacy_dir, folder))):
+                if not name.endswith(".parquet"):
+                    continue
+                source = f"legacy/{folder}/{name}"
+                if source in sources:
+                    continue
+                data = pd.read_parquet(os.path.join(legacy_dir, folder, name))
+                self.write(data, written_at=written_at, source=source)
+                imported += 1
+        return imported
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Import the Parquet files of the old layout into the job dataset."
+    )
+    parser.add_argument(
+        "legacy_dir", help="Old directory, e.g. Data/save_jobs_data/parquet_files"
+    )
+    parser.add_argument(
+        "--dataset", default="Data/save_jobs_data", help="Root of the job dataset"
+    )
+    args = parser.parse_args()
+    n_files = JobDataset(args.dataset).import_legacy(args.legacy_dir)
+    print(f"Imported {n_files} files into {args.dataset}")
@@ -0,0 +1,128 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, List
+
+# Marks the end of a worker's input.
+_DONE = object()
+
+
+class QueueWorker:
+    def __init__(self, name: str, handle: Callable[[Any], None], maxsize: int = 8):
+        """
+        Background thread consuming items from a bounded queue.
+
+        Producers block when the queue is full, which slows them down to the pace
+        of the worker (backpressure) and bounds the memory held between stages.
+
+        Args:
+            name (str): Name of the stage, for logs.
+            handle (Callable[[Any], None]): Function processing one item.
+            maxsize (int): Maximum number of items waiting in the queue.
+        """
+        self.name = name
+        self.handle = handle
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.error = None
+        self.items = 0
+        self.busy_time = 0.0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self) -> "QueueWorker":
+        """
+        Start the worker thread.
+
+        Returns:
+            QueueWorker: The started worker.
+        """
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        """
+        Process items until the end marker. After a failure, items are drained
+        without processing so that producers never block forever.
+        """
+        while True:
+            item = self.queue.get()
+            if item is _DONE:
+                return
+            if self.error is not None:
+                continue
+            start = time.perf_counter()
+            try:
+                self.handle(item)
+            except Exception as e:
+                self.error = e
+                print(f"Stage {self.name} failed: {e}")
+            self.busy_time += time.perf_counter() - start
+            self.items += 1
+
+    def put(self, item: Any) -> None:
+        """
+        Queue an item, blocking while the queue is full.
+
+        Args:
+            item (Any): Item to process.
+        """
+        self.queue.put(item)
+
+    def close(self) -> None:
+        """
+        Wait for the queued items to be processed and stop the worker.
+
+        Raises:
+            Exception: The error of the worker, if processing an item failed.
+        """
+        self.queue.put(_DONE)
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+
+
+class FanOut:
+    def __init__(self, workers: List[QueueWorker]):
+        """
+        Sends every produced item to several stages running concurrently.
+
+        Args:
+            workers (List[QueueWorker]): Stages receiving every item.
+        """
+        self.workers = workers
+
+    def __enter__(self) -> "FanOut":
+        for worker in self.workers:
+            worker.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        errors = []
+        for worker in self.workers:
+            try:
+                worker.close()
+            except Exception as e:
+                errors.append(e)
+        if errors and exc_info[0] is None:
+            raise errors[0]
+
+    def put(self, item: Any) -> None:
+        """
+        Queue an item for every stage.
+
+        Args:
+            item (Any): Item to process.
+        """
+        for worker in self.workers:
+            worker.put(item)
+
+    def report(self) -> List[str]:
+        """
+        Describe the work done by each stage.
+
+        Returns:
+            List[str]: One line per stage with its item count and busy time.
+        """
+        return [
+            f"Stage {worker.name}: {worker.items} items, {worker.busy_time:.1f}s busy"
+            for worker in self.workers
+        ]
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import pandas as pd
+from typing import Dict, List, Optional
+
+from utils.job_dataset import JobDataset
+
+
+class ScrapeCheckpoint:
+    def __init__(
+        self, directory: str, config: Dict, max_age_hours: float = 24.0
+    ) -> None:
+        """
+        Page-level checkpoint of a scraping run.
+
+        Every scraped page is spooled to its own small Parquet file and recorded as
+        completed in ``checkpoint.json``. When a (keyword, location) search is
+        complete, its pages are compacted into the job dataset, one row group per
+        page. A restarted run with the same search configuration skips completed
+        searches and resumes unfinished ones after their last completed page.
+
+        Args:
+            directory (str): Directory of the checkpoint and its spooled pages.
+            config (Dict): Search configuration of the run ("job_search" section); another configuration starts a new run.
+            max_age_hours (float): Checkpoints older than this start a new run too.
+        """
+        self.directory = directory
+        self.spool_dir = os.path.join(directory, "spool")
+        self.state_path = os.path.join(directory, "checkpoint.json")
+        self.max_age = max_age_hours * 3600
+        payload = json.dumps(config, sort_keys=True, default=str)
+        self.run_key = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+        self._lock = threading.Lock()
+        os.makedirs(self.spool_dir, exist_ok=True)
+        self._abandoned: Dict[str, Dict] = {}
+        self._abandoned_run_key: Optional[str] = None
+        self.state = self._load_state()
+
+    @staticmethod
+    def unit_key(keyword: str, location: str) -> str:
+        """
+        Identify a (keyword, location) search.
+
+        Args:
+            keyword (str): The job title searched for.
+            location (str): The searched location.
+
+        Returns:
+            str: Hex digest of the search, usable as a directory name.
+        """
+        payload = json.dumps([keyword, location])
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+    def _load_state(self) -> Dict:
+        """
+        Load the checkpoint of the current run, or start a new one.
+
+        Returns:
+            Dict: The run key, start time and completed pages per search.
+        """
+        if os.path.exists(self.state_path):
+            with open(self.state_path, "r", encoding="utf-8") as file:
+                state = json.load(file)
+            fresh = time.time() - state["started_at"] <= self.max_age
+            if state["run_key"] == self.run_key and fresh:
+                done = sum(unit["done"] for unit in state["units"].values())
+                print(f"Resuming scraping run, {done} searches already complete.")
+                return state
+            self._abandoned = state["units"]
+            self._abandoned_run_key = state["run_key"]
+        return {"run_key": self.run_key, "started_at": time.time(), "units": {}}
+
+    def _save_state(self) -> None:
+        """
+        Atomically persist the checkpoint.
+        """
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(self.state, file, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def _unit(self, keyword: str, location: str) -> Dict:
+        """
+        Checkpoint entry of a search, created if missing.
+        """
+        return self.state["units"].setdefault(
+            self.unit_key(keyword, location),
+            {"keyword": keyword, "location": location, "pages": 0, "done": False},
+        )
+
+    def completed_pages(self, keyword: str, location: str) -> int:
+        """
+        Args:
+            keyword (str): The job title searched for.
+            location (str): The searched location.
+
+        Returns:
+            int: Number of pages of the search already spooled.
+        """
+        with self._lock:
+            return self._unit(keyword, location)["pages"]
+
+    def is_done(self, keyword: str, location: str) -> bool:
+        """
+        Args:
+            keyword (str): The job title searched for.
+            location (str): The searched location.
+
+        Returns:
+            bool: Whether the search was already compacted into the dataset.
+        """
+        with self._lock:
+            return self._unit(keyword, location)["done"]
+
+    def write_page(
+        self,
+        keyword: str,
+        location: str,
+        page: int,
+        job_listings: List[Dict[str, Optional[str]]],
+    ) -> None:
+        """
+        Spool one scraped page and record it as completed.
+
+        Args:
+            keyword (str): The job title searched for.
+            location (str): The searched location.
+            page (int): Index of the page, from 0.
+            job_listings (List[Dict]): Listings of the page.
+        """
+        unit_dir = os.path.join(self.spool_dir, self.unit_key(keyword, location))
+        os.makedirs(unit_dir, exist_ok=True)
+        if job_listings:
+            path = os.path.join(unit_dir, f"page-{page:04d}.parquet")
+            JobDataset.to_storage_types(pd.DataFrame(job_listings)).to_parquet(
+                path + ".tmp", engine="pyarrow", index=False
+            )
+            os.replace(path + ".tmp", path)
+        with self._lock:
+            self._unit(keyword, location)["pages"] = page + 1
+            self._save_state()
+
+    def _compact(
+        self, run_key: str, unit_key: str, location: str, dataset: JobDataset
+    ) -> None:
+        """
+        Move the spooled pages of a search into the dataset and delete them.
+
+        The dataset file is tagged with the run and search in the manifest, so a
+        compaction interrupted after that point is not written a second time.
+        """
+        unit_dir = os.path.join(self.spool_dir, unit_key)
+        if not os.path.isdir(unit_dir):
+            return
+        source = f"scrape-checkpoint/{run_key}/{unit_key}"
+        if not dataset.has_source(source):
+            pages = sorted(
+                os.path.join(unit_dir, name)
+                for name in os.listdir(unit_dir)
+                if name.endswith(".parquet")
+            )
+            dataset.write_pages(
+                (pd.read_parquet(path) for path in pages), location, source=source
+            )
+        shutil.rmtree(unit_dir)
+
+    def finish_search(self, keyword: str, location: str, dataset: JobDataset) -> None:
+        """
+        Compact the pages of a complete search into the dataset.
+
+        Args:
+            keyword (str): The job title searched for.
+            location (str): The searched location.
+            dataset (JobDataset): Dataset of scraped job listings.
+        """
+        unit_key = self.unit_key(keyword, location)
+        self._compact(self.run_key, unit_key, location, dataset)
+        with self._lock:
+            self._unit(keyword, location)["done"] = True
+            self._save_state()
+
+    def recover(self, dataset: JobDataset) -> None:
+        """
+        Save the spooled pages of an abandoned run (another configuration, or too
+        old to resume) into the dataset, so that no scraped listing is lost.
+
+        Args:
+            dataset (JobDataset): Dataset of scraped job listings.
+        """
+        for unit_key, unit in self._abandoned.items():
+            self._compact(self._abandoned_run_key, unit_key, unit["location"], dataset)
+        self._abandoned = {}
+        self._save_state()
+
+    def complete(self) -> None:
+        """
+        Delete the checkpoint once every search of the run is complete.
+        """
+        with self._lock:
+            shutil.rmtree(self.directory, ignore_errors=True)
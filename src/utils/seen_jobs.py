@@ -0,0 +1,110 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+
+class SeenJobIndex:
+    def __init__(self, path: str):
+        """
+        Persistent index of the LinkedIn job IDs already scraped, backed by SQLite.
+
+        During a run, IDs are first claimed in memory (so that a posting found by
+        several searches is scraped once) and only persisted with add_many once
+        their listings are saved, so a crashed run does not lose postings.
+
+        Args:
+            path (str): Path of the SQLite database file.
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS seen_jobs ("
+            "job_id TEXT PRIMARY KEY, first_seen REAL NOT NULL, last_seen REAL NOT NULL)"
+        )
+        self._connection.commit()
+        self._claimed = set()
+        self._lock = threading.Lock()
+
+    def claim(self, job_ids: List[Optional[str]]) -> List[bool]:
+        """
+        Flag the job IDs to scrape and reserve them for the current run.
+
+        Already stored IDs get their last_seen time refreshed. Unknown (None) IDs
+        are always scraped.
+
+        Args:
+            job_ids (List[Optional[str]]): Job IDs of the cards of a page.
+
+        Returns:
+            List[bool]: Per ID, True if it was neither stored nor claimed earlier in the run.
+        """
+        known = [job_id for job_id in job_ids if job_id is not None]
+        with self._lock:
+            stored = set()
+            chunk_size = 500  # stays below SQLite's limit of bound parameters
+            for start in range(0, len(known), chunk_size):
+                chunk = known[start : start + chunk_size]
+                rows = self._connection.execute(
+                    "SELECT job_id FROM seen_jobs "
+                    f"WHERE job_id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                stored.update(job_id for (job_id,) in rows)
+            self._connection.executemany(
+                "UPDATE seen_jobs SET last_seen = ? WHERE job_id = ?",
+                [(time.time(), job_id) for job_id in stored],
+            )
+            self._connection.commit()
+
+            flags = []
+            for job_id in job_ids:
+                is_new = job_id is None or (
+                    job_id not in stored and job_id not in self._claimed
+                )
+                if job_id is not None:
+                    self._claimed.add(job_id)
+                flags.append(is_new)
+            return flags
+
+    def add_many(self, job_ids: List[str]) -> None:
+        """
+        Persist scraped job IDs.
+
+        Args:
+            job_ids (List[str]): IDs of saved postings.
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.executemany(
+                "INSERT INTO seen_jobs VALUES (?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET last_seen = excluded.last_seen",
+                [(job_id, now, now) for job_id in job_ids if job_id is not None],
+            )
+            self._connection.commit()
+
+    def seen_since(self, timestamp: float) -> List[str]:
+        """
+        List the stored job IDs seen at or after a time.
+
+        Args:
+            timestamp (float): Unix time.
+
+        Returns:
+            List[str]: Job IDs, e.g. of the postings still online in the last run.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT job_id FROM seen_jobs WHERE last_seen >= ?", (timestamp,)
+            )
+            return [job_id for (job_id,) in rows]
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self._connection.close()
@@ -0,0 +1,92 @@
+import hashlib
+import json
+import os
+import pandas as pd
+from typing import Any, Optional
+
+
+class StageCache:
+    def __init__(self, directory: str, keep: int = 5):
+        """
+        Memoized outputs of pipeline stages, keyed by a hash of their inputs and
+        parameters.
+
+        Outputs are stored as ``<stage>/<key>.parquet``; the ``keep`` most recently
+        used outputs of each stage are kept on disk.
+
+        Args:
+            directory (str): Directory of the stage outputs.
+            keep (int): Number of outputs kept per stage.
+        """
+        self.directory = directory
+        self.keep = keep
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """
+        Hash stage inputs and parameters.
+
+        Args:
+            *parts (Any): JSON-serializable inputs, e.g. upstream keys and stage parameters.
+
+        Returns:
+            str: Hex digest identifying the stage output.
+        """
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:20]
+
+    def path(self, stage: str, key: str) -> str:
+        """
+        Args:
+            stage (str): Name of the stage.
+            key (str): Key of the output.
+
+        Returns:
+            str: Path of the stage output.
+        """
+        return os.path.join(self.directory, stage, f"{key}.parquet")
+
+    def load(self, stage: str, key: str) -> Optional[pd.DataFrame]:
+        """
+        Load a memoized stage output.
+
+        Args:
+            stage (str): Name of the stage.
+            key (str): Key of the output.
+
+        Returns:
+            Optional[pd.DataFrame]: The output, None if it was never computed.
+        """
+        path = self.path(stage, key)
+        if not os.path.exists(path):
+            return None
+        os.utime(path)
+        return pd.read_parquet(path)
+
+    def save(self, stage: str, key: str, data: pd.DataFrame) -> str:
+        """
+        Atomically store a stage output and prune the oldest outputs of the stage.
+
+        Args:
+            stage (str): Name of the stage.
+            key (str): Key of the output.
+            data (pd.DataFrame): The output.
+
+        Returns:
+            str: Path of the stored output.
+        """
+        path = self.path(stage, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data.to_parquet(path + ".tmp", index=False)
+        os.replace(path + ".tmp", path)
+
+        stage_dir = os.path.dirname(path)
+        outputs = sorted(
+            (os.path.join(stage_dir, name) for name in os.listdir(stage_dir)),
+            key=os.path.getmtime,
+            reverse=True,
+        )
+        for old_path in outputs[self.keep :]:
+            os.remove(old_path)
+        return path
@@ -0,0 +1,276 @@
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: no peak RSS
+    resource = None
+
+METRIC_PREFIX = "fast_job_search"
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Peak resident set size of the process so far.
+
+    Returns:
+        Optional[int]: High-water mark of the process memory, in bytes, None where unavailable.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Span:
+    def __init__(self, name: str):
+        """
+        One timed execution of a pipeline step, created by Tracer.span.
+
+        Args:
+            name (str): Name of the step, e.g. "matcher.encode".
+        """
+        self.name = name
+        self.items = 0
+
+    def add_items(self, count: int) -> None:
+        """
+        Count items processed by the step (pages, cards, texts, locations...).
+
+        Args:
+            count (int): Number of items.
+        """
+        self.items += count
+
+
+class Tracer:
+    def __init__(self):
+        """
+        Thread-safe collector of span timings and throughput counters.
+
+        Spans are aggregated per name (calls, wall and CPU time, items, peak RSS)
+        so tracing a long run keeps a constant memory footprint. CPU time is the
+        CPU time of the whole process during the span, concurrent threads included.
+        """
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Drop every span and counter and restart the run clock.
+        """
+        with self._lock:
+            self.started_at = time.time()
+            self._started = time.perf_counter()
+            self.spans: Dict[str, Dict] = {}
+            self.counters: Dict[str, float] = {}
+
+    @contextmanager
+    def span(self, name: str):
+        """
+        Time the block as one call of the named step.
+
+        Args:
+            name (str): Name of the step.
+
+        Yields:
+            Span: The span, to count the items processed in the block.
+        """
+        span = Span(name)
+        rss_before = peak_rss_bytes()
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        try:
+            yield span
+        finally:
+            wall = time.perf_counter() - start
+            cpu = time.process_time() - cpu_start
+            rss_after = peak_rss_bytes()
+            with self._lock:
+                stats = self.spans.setdefault(
+                    name,
+                    {
+                        "calls": 0,
+                        "wall_s": 0.0,
+                        "cpu_s": 0.0,
+                        "max_wall_s": 0.0,
+                        "items": 0,
+                        "peak_rss_bytes": None,
+                        "rss_growth_bytes": None,
+                    },
+                )
+                stats["calls"] += 1
+                stats["wall_s"] += wall
+                stats["cpu_s"] += cpu
+                stats["max_wall_s"] = max(stats["max_wall_s"], wall)
+                stats["items"] += span.items
+                if rss_after is not None:
+                    stats["peak_rss_bytes"] = rss_after
+                    stats["rss_growth_bytes"] = max(
+                        stats["rss_growth_bytes"] or 0, rss_after - rss_before
+                    )
+
+    def count(self, name: str, value: float = 1) -> None:
+        """
+        Increment a counter.
+
+        Counters named "<x>_hits" and "<x>_misses" are reported with their
+        "<x>_hit_rate".
+
+        Args:
+            name (str): Name of the counter, e.g. "geocode_cache_hits".
+            value (float): Increment.
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def report(self) -> Dict:
+        """
+        Summarize the run.
+
+        Returns:
+            Dict: Run duration and peak RSS, per span its totals and throughput ("items_per_s", "calls_per_s"), counters, and hit rates.
+        """
+        with self._lock:
+            duration = time.perf_counter() - self._started
+            spans = {}
+            for name, stats in self.spans.items():
+                wall = stats["wall_s"]
+                spans[name] = {
+                    **stats,
+                    "calls_per_s": stats["calls"] / wall if wall > 0 else None,
+                    "items_per_s": (
+                        stats["items"] / wall if wall > 0 and stats["items"] else None
+                    ),
+                }
+            counters = dict(self.counters)
+
+        hit_rates = {}
+        for name, hits in counters.items():
+            if name.endswith("_hits"):
+                base = name[: -len("_hits")]
+                total = hits + counters.get(f"{base}_misses", 0)
+                hit_rates[f"{base}_hit_rate"] = hits / total if total else None
+        return {
+            "started_at": datetime.fromtimestamp(self.started_at).isoformat(
+                timespec="seconds"
+            ),
+            "duration_s": duration,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "spans": spans,
+            "counters": counters,
+            "hit_rates": hit_rates,
+        }
+
+    def write_json(self, path: str) -> None:
+        """
+        Write the run report as JSON.
+
+        Args:
+            path (str): Path of the report.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.report(), file, indent=2)
+
+    def prometheus_text(self) -> str:
+        """
+        Render the run report in the Prometheus text exposition format.
+
+        Returns:
+            str: Metrics prefixed with "fast_job_search_", spans labelled by name.
+        """
+        report = self.report()
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} {kind}")
+            for labels, value in samples:
+                if value is not None:
+                    lines.append(f"{METRIC_PREFIX}_{name}{labels} {value}")
+
+        def span_samples(field):
+            return [
+                (f'{{span="{_escape_label(name)}"}}', stats[field])
+                for name, stats in sorted(report["spans"].items())
+            ]
+
+        metric(
+            "run_duration_seconds",
+            "gauge",
+            "Duration of the run.",
+            [("", report["duration_s"])],
+        )
+        metric(
+            "peak_rss_bytes",
+            "gauge",
+            "Peak resident memory of the run.",
+            [("", report["peak_rss_bytes"])],
+        )
+        metric(
+            "span_calls_total", "counter", "Calls of each step.", span_samples("calls")
+        )
+        metric(
+            "span_wall_seconds_total",
+            "counter",
+            "Wall time spent in each step.",
+            span_samples("wall_s"),
+        )
+        metric(
+            "span_cpu_seconds_total",
+            "counter",
+            "Process CPU time during each step.",
+            span_samples("cpu_s"),
+        )
+        metric(
+            "span_items_total",
+            "counter",
+            "Items processed by each step.",
+            span_samples("items"),
+        )
+        metric(
+            "span_items_per_second",
+            "gauge",
+            "Throughput of each step.",
+            span_samples("items_per_s"),
+        )
+        for name, value in sorted(report["counters"].items()):
+            metric(f"{name}_total", "counter", f"Counter {name}.", [("", value)])
+        for name, value in sorted(report["hit_rates"].items()):
+            metric(name, "gauge", f"Hit rate {name}.", [("", value)])
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """
+        Atomically write the metrics to a textfile read by node_exporter's
+        textfile collector.
+
+        Args:
+            path (str): Path of the ".prom" file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as file:
+            file.write(self.prometheus_text())
+        os.replace(path + ".tmp", path)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Tracer shared by the scraper, the matcher and the geocoder of the process.
+tracer = Tracer()
+span = tracer.span
+count = tracer.count
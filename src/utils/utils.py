@@ -1,29 +1,83 @@
-import os
+import hashlib
+import re
+import pandas as pd
 from typing import Optional
 
+# Columns identifying the content of a posting, reposted under new IDs or found
+# by several searches.
+POSTING_CONTENT_COLUMNS = ["job_title", "company_name", "job_description"]
 
-def get_most_recent_file(base_path: str) -> Optional[str]:
+# LinkedIn job ID in a posting URL (".../jobs/view/<id>" or "currentJobId=<id>").
+JOB_ID_PATTERN = r"(?:/jobs/view/|currentJobId=)(\d+)"
+
+
+def parse_job_id(job_url: Optional[str]) -> Optional[str]:
+    """
+    Parse the LinkedIn job ID from a posting URL.
+
+    Args:
+        job_url (Optional[str]): URL of the posting.
+
+    Returns:
+        Optional[str]: The job ID, or None if the URL does not contain one.
+    """
+    match = re.search(JOB_ID_PATTERN, job_url or "")
+    return match.group(1) if match else None
+
+
+def add_job_ids(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add a stable "job_id" column identifying each posting.
+
+    The LinkedIn job ID is parsed from "job_url" (".../jobs/view/<id>" or
+    "currentJobId=<id>"); postings without one get a hash of their title, company
+    and description.
+
+    Args:
+        data (pd.DataFrame): Job listings with "job_url", "job_title", "company_name" and "job_description" columns.
+
+    Returns:
+        pd.DataFrame: The job listings with a "job_id" column.
+    """
+    job_ids = data["job_url"].astype("string").str.extract(JOB_ID_PATTERN, expand=False)
+    missing = job_ids.isna()
+    if missing.any():
+        job_ids[missing] = [
+            "h" + hashlib.sha1(f"{title}|{company}|{description}".encode()).hexdigest()
+            for title, company, description in zip(
+                data.loc[missing, "job_title"],
+                data.loc[missing, "company_name"],
+                data.loc[missing, "job_description"],
+            )
+        ]
+    data["job_id"] = job_ids.astype(str)
+    return data
+
+
+def clean_job_titles(titles: pd.Series) -> pd.Series:
     """
-    Get the most recent file from a specified directory and its subdirectories based on the last modification time.
+    Remove the " with verification" suffix LinkedIn adds to some job titles.
 
     Args:
-        base_path (str): The directory path to search for the files.
+        titles (pd.Series): Scraped job titles.
 
     Returns:
-        Optional[str]: The full path to the most recent file, or None if no files are found.
+        pd.Series: Job titles as published.
     """
-    most_recent_file = None
-    most_recent_time = 0
+    return titles.str.replace(r"\swith verification", "", regex=True)
+
 
-    # Walk through the directory and all its subdirectories
-    for root, dirs, files in os.walk(base_path):
-        for file in files:
-            file_path = os.path.join(root, file)
-            file_mod_time = os.path.getmtime(file_path)
+def posting_contents(data: pd.DataFrame) -> pd.MultiIndex:
+    """
+    Content key of each posting: its cleaned title, company and description, so
+    that scraped and published copies of a posting have the same key.
 
-            # If the current file is more recent, update the most recent file
-            if file_mod_time > most_recent_time:
-                most_recent_time = file_mod_time
-                most_recent_file = file_path
+    Args:
+        data (pd.DataFrame): Job listings with the POSTING_CONTENT_COLUMNS columns.
 
-    return most_recent_file
+    Returns:
+        pd.MultiIndex: One (title, company, description) key per row.
+    """
+    contents = data[POSTING_CONTENT_COLUMNS].astype("string").fillna("")
+    contents["job_title"] = clean_job_titles(contents["job_title"])
+    return pd.MultiIndex.from_frame(contents)
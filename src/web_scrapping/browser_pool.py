@@ -0,0 +1,311 @@
+import atexit
+import itertools
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from web_scrapping.waits import WaitMetrics
+from web_scrapping.web_scrap_lk import LinkedingJobScrapper, load_scraping_config
+
+# Serializes the first resolution, so that concurrently starting workers do not
+# download and unpack chromedriver at the same time.
+_chromedriver_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _install_chromedriver() -> str:
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    return ChromeDriverManager().install()
+
+
+def chromedriver_path() -> str:
+    """
+    Resolves (and downloads if needed) the chromedriver binary once per process.
+
+    Returns:
+    - str: Path of the chromedriver executable.
+    """
+    with _chromedriver_lock:
+        return _install_chromedriver()
+
+
+# Files of the profile holding the LinkedIn session: the cookies (under Network/
+# since Chrome 96), their encryption key in Local State, and saved logins. The
+# rest of the profile (caches, service workers) can weigh gigabytes.
+_SESSION_FILES = (
+    "Local State",
+    os.path.join("Default", "Preferences"),
+    os.path.join("Default", "Cookies"),
+    os.path.join("Default", "Network", "Cookies"),
+    os.path.join("Default", "Login Data"),
+)
+
+
+def worker_profile(path_chrome_profil: str, worker: int) -> str:
+    """
+    Chrome profile argument of a pool worker. Chrome locks its profile directory,
+    so every worker after the first gets a copy of the session files of the
+    profile (cookies and LinkedIn login) in a temporary directory, deleted at exit.
+
+    Args:
+    - path_chrome_profil (str): Chrome argument pointing to the user profile directory.
+    - worker (int): Index of the worker.
+
+    Returns:
+    - str: Chrome argument pointing to the worker's profile directory.
+    """
+    if worker == 0:
+        return path_chrome_profil
+    option, _, profile_dir = path_chrome_profil.partition("=")
+    copy_dir = tempfile.mkdtemp(prefix=f"fast_job_search-chrome-worker{worker}-")
+    atexit.register(shutil.rmtree, copy_dir, ignore_errors=True)
+    for file in _SESSION_FILES:
+        source = os.path.join(profile_dir, file)
+        if os.path.isfile(source):
+            target = os.path.join(copy_dir, file)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(source, target)
+    return f"{option}={copy_dir}"
+
+
+class PolitenessLimiter:
+    def __init__(self, min_interval: float = 2.0, jitter: float = 1.0):
+        """
+        Spaces out page navigations across all the drivers of a pool.
+
+        Args:
+        - min_interval (float): Minimum delay between two navigations, in seconds.
+        - jitter (float): Maximum random delay added to the interval, in seconds.
+        """
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """
+        Blocks until the calling driver may navigate.
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self.min_interval + random.uniform(0, self.jitter)
+        time.sleep(start - now)
+
+
+class BrowserPool:
+    def __init__(
+        self,
+        driver_factory: Callable[[int], object],
+        n_workers: int = 3,
+        config_path: str = "config.yaml",
+        limiter: Optional[PolitenessLimiter] = None,
+        timeout: int = 4,
+        seen_index=None,
+    ) -> None:
+        """
+        Shards the (keyword, location) searches of a configuration across a pool of
+        WebDrivers, one browser session per worker.
+
+        Args:
+        - driver_factory (Callable[[int], WebDriver]): Builds the driver of a worker from its index.
+        - n_workers (int): Number of concurrent drivers.
+        - config_path (str): Path to the scraping YAML configuration.
+        - limiter (Optional[PolitenessLimiter]): Navigation limiter shared by all workers.
+        - timeout (int): WebDriverWait timeout of the scrapers.
+        - seen_index (Optional[SeenJobIndex]): Index of seen postings shared by all workers, which also deduplicates postings across searches.
+        """
+        self.driver_factory = driver_factory
+        self.n_workers = n_workers
+        self.config_path = config_path
+        self.limiter = limiter or PolitenessLimiter()
+        self.timeout = timeout
+        self.seen_index = seen_index
+        self._local = threading.local()
+        self._worker_ids = itertools.count()
+        self._scrapers: List[LinkedingJobScrapper] = []
+        self._lock = threading.Lock()
+        self.wait_metrics = WaitMetrics()
+
+    def _scraper(self) -> LinkedingJobScrapper:
+        """
+        Scraper of the calling worker thread, created with its driver on first use.
+
+        Returns:
+        - LinkedingJobScrapper: The worker's scraper.
+        """
+        scraper = getattr(self._local, "scraper", None)
+        if scraper is None:
+            with self._lock:
+                worker = next(self._worker_ids)
+            scraper = LinkedingJobScrapper(
+                self.driver_factory(worker),
+                config_path=self.config_path,
+                timeout=self.timeout,
+                limiter=self.limiter,
+                wait_metrics=self.wait_metrics,
+                seen_index=self.seen_index,
+            )
+            self._local.logged_in = False
+            with self._lock:
+                self._scrapers.append(scraper)
+            self._local.scraper = scraper
+        return scraper
+
+    def _scrape_unit(
+        self, keyword: str, location: str, config: Dict
+    ) -> List[Dict[str, Optional[str]]]:
+        """
+        Scrapes one search on the calling worker's driver, logging in on its first search.
+
+        Args:
+        - keyword (str): The job title to search for.
+        - location (str): The location (country/city) to filter jobs.
+        - config (Dict): Parsed configuration data.
+
+        Returns:
+        - List[Dict]: List of job details dictionaries.
+        """
+        scraper = self._scraper()
+        return scraper.scrape_search(
+            keyword,
+            location,
+            config["job_search"]["num_pages"],
+            credentials=self._credentials(config),
+        )
+
+    def _credentials(self, config: Dict) -> Optional[Tuple[str, str]]:
+        """
+        Credentials to log in with, only on the first search of the calling worker.
+
+        Args:
+        - config (Dict): Parsed configuration data.
+
+        Returns:
+        - Optional[Tuple[str, str]]: LinkedIn email and password, or None if the worker already logged in.
+        """
+        if self._local.logged_in:
+            return None
+        self._local.logged_in = True
+        return config["linkedin_email"], config["linkedin_password"]
+
+    def run(self) -> Iterator[Dict[str, Optional[str]]]:
+        """
+        Scrapes every search of the configuration and merges the results into one
+        stream, yielding the listings of each search as soon as it completes.
+
+        Yields:
+        - Dict: Job details dictionary.
+        """
+        config = load_scraping_config(self.config_path)
+        if not config:
+            return
+        units = LinkedingJobScrapper.search_units(config)
+        try:
+            with ThreadPoolExecutor(max_workers=self.n_workers) as executor:
+                futures = {
+                    executor.submit(self._scrape_unit, keyword, location, config): (
+                        keyword,
+                        location,
+                    )
+                    for keyword, location in units
+                }
+                for future in as_completed(futures):
+                    keyword, location = futures[future]
+                    try:
+                        listings = future.result()
+                    except Exception as e:
+                        print(f"Search failed for {keyword} in {location}: {e}")
+                        continue
+                    print(f"{len(listings)} listings for {keyword} in {location}.")
+                    yield from listings
+        finally:
+            self.close()
+            self.wait_metrics.report()
+
+    def run_checkpointed(
+        self,
+        saving_path: str,
+        checkpoint_dir: str,
+        page_sink: Optional[Callable[[List[Dict[str, Optional[str]]]], None]] = None,
+    ) -> int:
+        """
+        Scrapes every search of the configuration across the pool, streaming each page
+        to a shared checkpoint and compacting each search into the dataset once
+        complete. A restarted run resumes where the previous one stopped.
+
+        Args:
+        - saving_path (str): Root directory of the job dataset.
+        - checkpoint_dir (str): Directory of the run checkpoint.
+        - page_sink (Optional[Callable[[List[Dict]], None]]): Receives the listings of every non-empty page once saved; called from the worker threads.
+
+        Returns:
+        - int: Number of listings scraped by this call.
+        """
+        from utils.job_dataset import JobDataset
+        from utils.scrape_checkpoint import ScrapeCheckpoint
+
+        config = load_scraping_config(self.config_path)
+        if not config:
+            return 0
+        dataset = JobDataset(saving_path)
+        checkpoint = ScrapeCheckpoint(checkpoint_dir, config["job_search"])
+        checkpoint.recover(dataset)
+        units = [
+            (keyword, location)
+            for keyword, location in LinkedingJobScrapper.search_units(config)
+            if not checkpoint.is_done(keyword, location)
+        ]
+
+        def scrape_unit(keyword: str, location: str) -> int:
+            scraper = self._scraper()
+            return scraper.scrape_search_checkpointed(
+                keyword,
+                location,
+                config["job_search"]["num_pages"],
+                checkpoint,
+                dataset,
+                credentials=self._credentials(config),
+                page_sink=page_sink,
+            )
+
+        n_listings, failed = 0, 0
+        try:
+            with ThreadPoolExecutor(max_workers=self.n_workers) as executor:
+                futures = {
+                    executor.submit(scrape_unit, keyword, location): (keyword, location)
+                    for keyword, location in units
+                }
+                for future in as_completed(futures):
+                    keyword, location = futures[future]
+                    try:
+                        n_listings += future.result()
+                    except Exception as e:
+                        failed += 1
+                        print(f"Search failed for {keyword} in {location}: {e}")
+        finally:
+            self.close()
+            self.wait_metrics.report()
+        # Failed searches keep their checkpoint, to be resumed by the next run.
+        if not failed:
+            checkpoint.complete()
+        return n_listings
+
+    def close(self) -> None:
+        """
+        Quits every driver of the pool.
+        """
+        with self._lock:
+            scrapers, self._scrapers = self._scrapers, []
+        for scraper in scrapers:
+            try:
+                scraper.driver.quit()
+            except Exception as e:
+                print(f"Error closing driver: {e}")
@@ -0,0 +1,183 @@
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Number of job cards whose content is rendered (LinkedIn fills the list lazily).
+RENDERED_CARDS_SCRIPT = """
+return document.querySelectorAll(
+    "li.occludable-update div.job-card-container--clickable"
+).length;
+"""
+
+# Job ID shown by the description panel.
+CURRENT_JOB_ID_SCRIPT = """
+return new URLSearchParams(window.location.search).get("currentJobId");
+"""
+
+
+class WaitMetrics:
+    def __init__(self) -> None:
+        """
+        Time spent in each kind of wait, to see where a scrape spends its time.
+        """
+        self._stats: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0}
+        )
+        self._lock = threading.Lock()
+
+    def record(self, name: str, duration: float, timed_out: bool = False) -> None:
+        """
+        Records one wait.
+
+        Args:
+        - name (str): Kind of wait (e.g. "scroll", "description").
+        - duration (float): Time spent waiting, in seconds.
+        - timed_out (bool): Whether the condition was never met.
+        """
+        with self._lock:
+            stats = self._stats[name]
+            stats["count"] += 1
+            stats["total"] += duration
+            stats["max"] = max(stats["max"], duration)
+            stats["timeouts"] += int(timed_out)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns:
+        - Dict: Per kind of wait, its count, total, mean and max duration and number of timeouts.
+        """
+        with self._lock:
+            return {
+                name: {**stats, "mean": stats["total"] / stats["count"]}
+                for name, stats in self._stats.items()
+            }
+
+    def report(self) -> None:
+        """
+        Prints the wait summary, longest total first.
+        """
+        summary = sorted(self.summary().items(), key=lambda item: -item[1]["total"])
+        for name, stats in summary:
+            print(
+                f"Wait {name}: {stats['count']} waits, {stats['total']:.1f}s total, "
+                f"{stats['mean']:.2f}s mean, {stats['max']:.2f}s max, "
+                f"{stats['timeouts']} timeouts"
+            )
+
+
+class AdaptiveWaiter:
+    def __init__(
+        self,
+        driver,
+        timeout: float = 4.0,
+        poll_frequency: float = 0.1,
+        jitter: Tuple[float, float] = (0.1, 0.5),
+        metrics: Optional[WaitMetrics] = None,
+    ) -> None:
+        """
+        Waits driven by DOM conditions instead of fixed sleeps, with a small random
+        jitter so that the browsing pattern stays irregular.
+
+        Args:
+        - driver (WebDriver): The WebDriver.
+        - timeout (float): Default maximum wait, in seconds.
+        - poll_frequency (float): Delay between two condition checks, in seconds.
+        - jitter (Tuple[float, float]): Bounds of the random pause added by jitter_sleep, in seconds.
+        - metrics (Optional[WaitMetrics]): Where wait durations are recorded.
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.jitter = jitter
+        self.metrics = metrics or WaitMetrics()
+
+    def until(
+        self,
+        name: str,
+        condition: Callable[[Any], Any],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Polls a condition until it returns a truthy value or the timeout expires.
+
+        Args:
+        - name (str): Kind of wait, for the metrics.
+        - condition (Callable[[WebDriver], Any]): Condition evaluated on the driver; exceptions count as not met.
+        - timeout (Optional[float]): Maximum wait, the default timeout if None.
+
+        Returns:
+        - Any: The condition's value, or None on timeout.
+        """
+        start = time.monotonic()
+        deadline = start + (self.timeout if timeout is None else timeout)
+        while True:
+            try:
+                value = condition(self.driver)
+            except Exception:
+                value = None
+            now = time.monotonic()
+            if value:
+                self.metrics.record(name, now - start)
+                return value
+            if now >= deadline:
+                self.metrics.record(name, now - start, timed_out=True)
+                return None
+            time.sleep(min(self.poll_frequency, deadline - now))
+
+    def jitter_sleep(self, name: str = "jitter") -> None:
+        """
+        Sleeps a random duration within the jitter bounds.
+
+        Args:
+        - name (str): Kind of wait, for the metrics.
+        """
+        duration = random.uniform(*self.jitter)
+        time.sleep(duration)
+        self.metrics.record(name, duration)
+
+    def card_count_stable(
+        self, min_count: int = 1, stable_polls: int = 2, timeout: Optional[float] = None
+    ) -> Optional[int]:
+        """
+        Waits until the number of rendered job cards stops changing.
+
+        Args:
+        - min_count (int): Minimum number of cards before the count may be considered stable.
+        - stable_polls (int): Number of consecutive polls with the same count.
+        - timeout (Optional[float]): Maximum wait, the default timeout if None.
+
+        Returns:
+        - Optional[int]: The stable card count, or None on timeout.
+        """
+        history = []
+
+        def stable(driver):
+            history.append(driver.execute_script(RENDERED_CARDS_SCRIPT))
+            recent = history[-stable_polls - 1 :]
+            if len(recent) <= stable_polls or recent[-1] < min_count:
+                return False
+            return recent[-1] if len(set(recent)) == 1 else False
+
+        return self.until("cards", stable, timeout)
+
+    def job_id_changed(
+        self, previous_job_id: Optional[str], timeout: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Waits until the description panel shows another job than the given one.
+
+        Args:
+        - previous_job_id (Optional[str]): Job ID shown before the action.
+        - timeout (Optional[float]): Maximum wait, the default timeout if None.
+
+        Returns:
+        - Optional[str]: The new job ID, or None on timeout.
+        """
+
+        def changed(driver):
+            job_id = driver.execute_script(CURRENT_JOB_ID_SCRIPT)
+            return job_id if job_id != previous_job_id else False
+
+        return self.until("job_id", changed, timeout)
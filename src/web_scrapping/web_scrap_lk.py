@@ -1,5 +1,5 @@
 import yaml
-from typing import List, Dict, Optional
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
@@ -8,23 +8,106 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.webdriver import WebDriver
-import os
 import pandas as pd
-from datetime import datetime
-import time
 from selenium.webdriver.common.action_chains import ActionChains
-import random
+from utils.job_dataset import JobDataset
+from utils import tracing
+from utils.utils import parse_job_id
+from web_scrapping.waits import AdaptiveWaiter, WaitMetrics, CURRENT_JOB_ID_SCRIPT
+
+# Number of results per search page, LinkedIn's step of the "start" URL parameter.
+JOBS_PER_PAGE = 25
+
+# Collects the fields of every visible job card in a single WebDriver round trip.
+CARD_FIELDS_SCRIPT = r"""
+const cards = Array.from(
+    document.querySelectorAll("div.job-card-container--clickable")
+).filter((card) => !card.closest("div.continuous-discovery-modules"));
+const text = (card, selector) => {
+    const element = card.querySelector(selector);
+    return element ? element.innerText.trim() : null;
+};
+return cards.map((card) => {
+    const link = card.querySelector(".job-card-container__link");
+    const holder = card.closest("[data-job-id]") || card.querySelector("[data-job-id]");
+    const url = link ? link.href : null;
+    const match = url ? url.match(/\/jobs\/view\/(\d+)/) : null;
+    return {
+        element: card,
+        job_id: holder ? holder.getAttribute("data-job-id") : match ? match[1] : null,
+        job_title: text(card, ".job-card-container__link .visually-hidden"),
+        company_name: text(card, ".artdeco-entity-lockup__subtitle"),
+        job_location: text(card, ".artdeco-entity-lockup__caption"),
+        job_url: url,
+    };
+});
+"""
+
+# Reads the description panel and the job ID it currently shows.
+DESCRIPTION_SCRIPT = """
+const panel = document.querySelector(".jobs-description__container .mt4");
+return {
+    job_id: new URLSearchParams(window.location.search).get("currentJobId"),
+    text: panel ? panel.innerText : null,
+};
+"""
+
+
+def load_scraping_config(config_path: str) -> Optional[Dict]:
+    """
+    Loads the YAML scraping configuration file.
+
+    Args:
+    - config_path (str): Path to the configuration file.
+
+    Returns:
+    - dict: Parsed configuration data, or None if loading fails.
+    """
+    try:
+        with open(config_path, "r", encoding="utf-8") as file:
+            config = yaml.safe_load(file)
+        return config.get("config")
+    except FileNotFoundError:
+        print("Error: Configuration file not found.")
+    except yaml.YAMLError as e:
+        print(f"Error parsing YAML file: {e}")
+    return None
 
 
 class LinkedingJobScrapper:
     def __init__(
-        self, driver: WebDriver, config_path: str = "config.yaml", timeout: int = 4
+        self,
+        driver: WebDriver,
+        config_path: str = "config.yaml",
+        timeout: int = 4,
+        limiter=None,
+        bulk_extraction: bool = True,
+        jitter: Tuple[float, float] = (0.1, 0.5),
+        wait_metrics: Optional[WaitMetrics] = None,
+        seen_index=None,
     ) -> None:
         if not isinstance(driver, webdriver.Chrome):
             raise TypeError("Expected driver to be an instance of webdriver.Chrome")
         self.driver = driver
         self.config_path = config_path
         self.timeout = timeout
+        # Optional limiter shared by several scrapers (see browser_pool.PolitenessLimiter)
+        self.limiter = limiter
+        self.bulk_extraction = bulk_extraction
+        # Condition-based waits, with a small random pause between interactions
+        self.waiter = AdaptiveWaiter(
+            driver, timeout=timeout, jitter=jitter, metrics=wait_metrics
+        )
+        # Optional utils.seen_jobs.SeenJobIndex: seen postings are not scraped again
+        self.seen_index = seen_index
+        self.last_page_card_count = 0
+
+    def throttle(self) -> None:
+        """
+        Waits for the shared politeness limiter, if any, before a page navigation.
+        """
+        if self.limiter is not None:
+            self.limiter.wait()
 
     def load_config(self) -> Optional[Dict]:
         """
@@ -33,15 +116,7 @@ class LinkedingJobScrapper:
         Returns:
         - dict: Parsed configuration data, or None if loading fails.
         """
-        try:
-            with open(self.config_path, "r", encoding="utf-8") as file:
-                config = yaml.safe_load(file)
-            return config.get("config")
-        except FileNotFoundError:
-            print("Error: Configuration file not found.")
-        except yaml.YAMLError as e:
-            print(f"Error parsing YAML file: {e}")
-        return None
+        return load_scraping_config(self.config_path)
 
     def search_url(self, url) -> None:
         """
@@ -51,6 +126,7 @@ class LinkedingJobScrapper:
         - url (str): The target URL to visit.
         """
         try:
+            self.throttle()
             self.driver.get(url)
             WebDriverWait(self.driver, self.timeout).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
@@ -116,7 +192,7 @@ class LinkedingJobScrapper:
             print(f"Error clicking login button")
 
     def generate_linkedin_job_url(
-        self, job_title: str, location: str, time_range: str = "r86400"
+        self, job_title: str, location: str, time_range: str = "r86400", start: int = 0
     ) -> str:
         """
         Generates a LinkedIn job search URL.
@@ -125,6 +201,7 @@ class LinkedingJobScrapper:
         - job_title (str): The job title to search for.
         - location (str): The location (country/city) to filter jobs.
         - time_range (str): Time range for job postings (default is last 2self.timeout hours).
+        - start (int): Index of the first result, to open a later page directly.
 
         Returns:
         - str: LinkedIn job search URL.
@@ -133,14 +210,20 @@ class LinkedingJobScrapper:
         job_title_encoded = job_title.replace(" ", "%20")
         location_encoded = location.replace(" ", "%20")
 
-        return f"{base_url}?f_TPR={time_range}&keywords={job_title_encoded}&location={location_encoded}&origin=JOB_SEARCH_PAGE_JOB_FILTER"
+        url = f"{base_url}?f_TPR={time_range}&keywords={job_title_encoded}&location={location_encoded}&origin=JOB_SEARCH_PAGE_JOB_FILTER"
+        if start:
+            url += f"&start={start}"
+        return url
 
     def scroll_job_cards(self, num_scrolls: int = 5) -> None:
         """
         Scrolls through job card elements inside the job search list.
 
+        After each scroll, waits for the number of rendered cards to stabilize
+        instead of sleeping, and stops early once every card is rendered.
+
         Args:
-        - num_scrolls (int): Number of scroll iterations (default is 5).
+        - num_scrolls (int): Maximum number of scroll iterations (default is 5).
         """
         for i in range(num_scrolls):
             try:
@@ -153,14 +236,16 @@ class LinkedingJobScrapper:
                         index = -1
                     else:
                         index = int(n_item / (num_scrolls - i))
-                    time.sleep(random.uniform(0.5, 2))
+                    self.waiter.jitter_sleep("scroll_jitter")
                     self.driver.execute_script(
                         "arguments[0].scrollIntoView();", job_cards[index]
                     )
+                    rendered = self.waiter.card_count_stable(timeout=2)
+                    if rendered is not None and rendered >= n_item:
+                        break
             except Exception as e:
                 print(f"Scrolling error")
                 break
-        time.sleep(2)
         print("Scrolling completed.")
 
     def click_next_page(self) -> None:
@@ -169,7 +254,7 @@ class LinkedingJobScrapper:
 
         """
         try:
-            time.sleep(random.uniform(0.5, 2))
+            self.waiter.jitter_sleep("next_page_jitter")
             current_page = self.driver.find_element(
                 By.XPATH, '//li[contains(@class, "selected")]/button'
             )
@@ -180,6 +265,7 @@ class LinkedingJobScrapper:
                 EC.element_to_be_clickable((By.XPATH, next_page_xpath))
             )
 
+            self.throttle()
             next_page_button.click()
             print(f"Navigated to page {current_page_number + 1}")
 
@@ -245,9 +331,10 @@ class LinkedingJobScrapper:
             )
             for i, job_card in enumerate(job_cards):
                 if i > 0:
+                    previous_job_id = self.driver.execute_script(CURRENT_JOB_ID_SCRIPT)
                     ActionChains(self.driver).move_to_element(job_card).perform()
                     job_card.click()
-                    time.sleep(random.uniform(0.5, 2))
+                    self.waiter.job_id_changed(previous_job_id)
                 try:
                     job_title_element = job_card.find_element(
                         By.CLASS_NAME, "job-card-container__link"
@@ -307,48 +394,335 @@ class LinkedingJobScrapper:
 
         return job_listings
 
+    def read_description_panel(self) -> Dict[str, Optional[str]]:
+        """
+        Reads the job description panel in one round trip.
+
+        Returns:
+        - Dict: The job ID shown by the panel ("job_id") and its text ("text").
+        """
+        return self.driver.execute_script(DESCRIPTION_SCRIPT) or {}
+
+    def wait_for_description(
+        self, job_id: Optional[str], previous_text: Optional[str]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Waits until the description panel shows the given job.
+
+        Args:
+        - job_id (Optional[str]): ID of the clicked job, None if unknown.
+        - previous_text (Optional[str]): Text of the panel before the click, which the panel must no longer show.
+
+        Returns:
+        - Dict: The panel state, possibly stale if the wait timed out.
+        """
+
+        def panel_updated(driver):
+            panel = self.read_description_panel()
+            if not panel.get("text") or panel["text"] == previous_text:
+                return False
+            # The URL changes on click, before the panel re-renders: a matching job
+            # ID alone could still come with the previous card's text.
+            if job_id is not None:
+                return panel if panel.get("job_id") == job_id else False
+            return panel
+
+        panel = self.waiter.until("description", panel_updated)
+        if not panel:
+            print(f"Description panel did not update for job {job_id}")
+            return self.read_description_panel()
+        return panel
+
+    def scrape_job_listings_bulk(self) -> List[Dict[str, Optional[str]]]:
+        """
+        Scrapes job listings with one script call for all the card fields, then one
+        click per card, waiting for the description panel only when the clicked job
+        is not the one already displayed. Cards already in the seen-job index, or
+        already scraped by another search of the run, are skipped without a click.
+
+        Returns:
+        - List[Dict]: List of job details dictionaries.
+        """
+        job_listings = []
+        try:
+            cards = self.driver.execute_script(CARD_FIELDS_SCRIPT) or []
+            self.last_page_card_count = len(cards)
+            job_ids = [
+                parse_job_id(card["job_url"]) or card["job_id"] for card in cards
+            ]
+            is_new = [True] * len(cards)
+            if self.seen_index is not None:
+                is_new = self.seen_index.claim(job_ids)
+            panel = self.read_description_panel()
+            for card, job_id, new in zip(cards, job_ids, is_new):
+                element = card.pop("element")
+                card.pop("job_id")
+                if not new:
+                    continue
+                if job_id is None or job_id != panel.get("job_id"):
+                    self.driver.execute_script("arguments[0].click();", element)
+                    panel = self.wait_for_description(job_id, panel.get("text"))
+                job_description = panel.get("text")
+                if job_description is not None:
+                    job_description = job_description.replace("\n", " ")
+                job_listings.append({**card, "job_description": job_description})
+
+            print(
+                f"Scraped {len(job_listings)} job listings, "
+                f"skipped {len(cards) - len(job_listings)} seen ones."
+            )
+        except Exception as e:
+            print(f"Scraping error: {e}")
+
+        return job_listings
+
+    @staticmethod
+    def search_units(config: Dict) -> List[Tuple[str, str]]:
+        """
+        Lists the independent (keyword, location) searches of a configuration.
+
+        Args:
+        - config (Dict): Parsed configuration data.
+
+        Returns:
+        - List[Tuple[str, str]]: Searches, in configuration order.
+        """
+        keywords = config["job_search"]["keyword"]
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        return [
+            (keyword, location)
+            for keyword in keywords
+            for location in config["job_search"]["locations"]
+        ]
+
+    def iter_search_pages(
+        self,
+        keyword: str,
+        location: str,
+        num_pages: int,
+        credentials: Optional[Tuple[str, str]] = None,
+        start_page: int = 0,
+    ) -> Iterator[Tuple[int, List[Dict[str, Optional[str]]]]]:
+        """
+        Scrapes the result pages of one (keyword, location) search, page by page.
+
+        With a seen-job index, pagination stops at the first page made up only of
+        postings already seen.
+
+        Args:
+        - keyword (str): The job title to search for.
+        - location (str): The location (country/city) to filter jobs.
+        - num_pages (int): Maximum number of result pages.
+        - credentials (Optional[Tuple[str, str]]): LinkedIn email and password, to log in after loading the search.
+        - start_page (int): Index of the first page to scrape, to resume an interrupted search.
+
+        Yields:
+        - Tuple[int, List[Dict]]: Index of the page and its job details dictionaries.
+        """
+        url = self.generate_linkedin_job_url(
+            keyword, location, start=start_page * JOBS_PER_PAGE
+        )
+        self.search_url(url)
+        if credentials is not None:
+            self.login_linkendin(*credentials)
+        last_page = min(num_pages, self.get_max_page_number())
+        for i in range(start_page, last_page):
+            with tracing.span("scraper.page") as span:
+                self.scroll_job_cards(num_scrolls=15)
+                if self.bulk_extraction:
+                    job_listings = self.scrape_job_listings_bulk()
+                    card_count = self.last_page_card_count
+                else:
+                    job_listings = self.scrape_all_job_listings_with_selenium()
+                    card_count = len(job_listings)
+                    if self.seen_index is not None:
+                        is_new = self.seen_index.claim(
+                            [
+                                parse_job_id(job_data["job_url"])
+                                for job_data in job_listings
+                            ]
+                        )
+                        job_listings = [
+                            job_data
+                            for job_data, new in zip(job_listings, is_new)
+                            if new
+                        ]
+                span.add_items(len(job_listings))
+            tracing.count("scraper_pages")
+            tracing.count("scraper_cards", card_count)
+            tracing.count("scraper_cards_seen", card_count - len(job_listings))
+            if self.seen_index is not None and card_count and not job_listings:
+                print(f"Page {i + 1} of {keyword} in {location} was already seen.")
+                break
+            for job_data in job_listings:
+                job_data["search_location"] = location
+            yield i, job_listings
+            if i < last_page - 1:
+                self.click_next_page()
+
+    def scrape_search(
+        self,
+        keyword: str,
+        location: str,
+        num_pages: int,
+        credentials: Optional[Tuple[str, str]] = None,
+    ) -> List[Dict[str, Optional[str]]]:
+        """
+        Scrapes the result pages of one (keyword, location) search.
+
+        Args:
+        - keyword (str): The job title to search for.
+        - location (str): The location (country/city) to filter jobs.
+        - num_pages (int): Maximum number of result pages.
+        - credentials (Optional[Tuple[str, str]]): LinkedIn email and password, to log in after loading the search.
+
+        Returns:
+        - List[Dict]: List of job details dictionaries.
+        """
+        job_listings_full = []
+        for _, job_listings in self.iter_search_pages(
+            keyword, location, num_pages, credentials=credentials
+        ):
+            job_listings_full.extend(job_listings)
+        return job_listings_full
+
+    def scrape_search_checkpointed(
+        self,
+        keyword: str,
+        location: str,
+        num_pages: int,
+        checkpoint,
+        dataset: JobDataset,
+        credentials: Optional[Tuple[str, str]] = None,
+        page_sink: Optional[Callable[[List[Dict[str, Optional[str]]]], None]] = None,
+    ) -> int:
+        """
+        Scrapes one search page by page into the checkpoint spool, resuming after its
+        last completed page, and compacts it into the dataset once complete.
+
+        Args:
+        - keyword (str): The job title to search for.
+        - location (str): The location (country/city) to filter jobs.
+        - num_pages (int): Maximum number of result pages.
+        - checkpoint (ScrapeCheckpoint): Checkpoint of the run.
+        - dataset (JobDataset): Dataset of scraped job listings.
+        - credentials (Optional[Tuple[str, str]]): LinkedIn email and password, to log in after loading the search.
+        - page_sink (Optional[Callable[[List[Dict]], None]]): Receives the listings of every non-empty page once saved, e.g. to feed downstream stages.
+
+        Returns:
+        - int: Number of listings scraped by this call.
+        """
+        if checkpoint.is_done(keyword, location):
+            print(f"Search {keyword} in {location} already complete, skipped.")
+            return 0
+        start_page = checkpoint.completed_pages(keyword, location)
+        n_listings = 0
+        if start_page < num_pages:
+            for i, job_listings in self.iter_search_pages(
+                keyword,
+                location,
+                num_pages,
+                credentials=credentials,
+                start_page=start_page,
+            ):
+                checkpoint.write_page(keyword, location, i, job_listings)
+                if self.seen_index is not None:
+                    self.seen_index.add_many(
+                        [parse_job_id(job_data["job_url"]) for job_data in job_listings]
+                    )
+                if page_sink is not None and job_listings:
+                    page_sink(job_listings)
+                n_listings += len(job_listings)
+        checkpoint.finish_search(keyword, location, dataset)
+        return n_listings
+
     def run(self) -> None:
         job_listings_full = []
         config = self.load_config()
         if not config:
             return
 
-        for search_i, location in enumerate(config["job_search"]["locations"]):
-            url = self.generate_linkedin_job_url(
-                config["job_search"]["keyword"], location
-            )
-            self.search_url(url)
-            if search_i == 0:
-                self.login_linkendin(
-                    config["linkedin_email"], config["linkedin_password"]
+        credentials = (config["linkedin_email"], config["linkedin_password"])
+        for search_i, (keyword, location) in enumerate(self.search_units(config)):
+            job_listings_full.extend(
+                self.scrape_search(
+                    keyword,
+                    location,
+                    config["job_search"]["num_pages"],
+                    credentials=credentials if search_i == 0 else None,
                 )
-            max_page = self.get_max_page_number()
-            for i in range(min(config["job_search"]["num_pages"], max_page)):
-                self.scroll_job_cards(num_scrolls=15)
-                job_listings = self.scrape_all_job_listings_with_selenium()
-                if i < min(config["job_search"]["num_pages"], max_page) - 1:
-                    self.click_next_page()
-                job_listings_full.extend(job_listings)
+            )
+        self.waiter.metrics.report()
         return job_listings_full
 
+    def run_checkpointed(
+        self,
+        saving_path: str,
+        checkpoint_dir: str,
+        page_sink: Optional[Callable[[List[Dict[str, Optional[str]]]], None]] = None,
+    ) -> int:
+        """
+        Scrapes every search of the configuration, streaming each page to disk with a
+        checkpoint, so that memory does not grow with the run and a restarted run
+        resumes where the previous one stopped.
+
+        Args:
+        - saving_path (str): Root directory of the job dataset.
+        - checkpoint_dir (str): Directory of the run checkpoint.
+        - page_sink (Optional[Callable[[List[Dict]], None]]): Receives the listings of every non-empty page once saved.
+
+        Returns:
+        - int: Number of listings scraped by this call.
+        """
+        from utils.scrape_checkpoint import ScrapeCheckpoint
+
+        config = self.load_config()
+        if not config:
+            return 0
+
+        dataset = JobDataset(saving_path)
+        checkpoint = ScrapeCheckpoint(checkpoint_dir, config["job_search"])
+        checkpoint.recover(dataset)
+        credentials = (config["linkedin_email"], config["linkedin_password"])
+        n_listings, logged_in = 0, False
+        for keyword, location in self.search_units(config):
+            if checkpoint.is_done(keyword, location):
+                continue
+            n_listings += self.scrape_search_checkpointed(
+                keyword,
+                location,
+                config["job_search"]["num_pages"],
+                checkpoint,
+                dataset,
+                credentials=None if logged_in else credentials,
+                page_sink=page_sink,
+            )
+            logged_in = True
+        checkpoint.complete()
+        self.waiter.metrics.report()
+        return n_listings
+
     def save_listing_to_parquet(
         self, job_listings_full: List[Dict[str, str]], saving_path: str
-    ) -> None:
+    ) -> List[str]:
         """
-        Saves job listings to a Parquet file, organizing by the current hour.
+        Appends job listings to the partitioned job dataset (by scrape date and search location),
+        then records them in the seen-job index, if any.
 
         Args:
         - job_listings_full (List[Dict[str, str]]): List of job listings where each listing is a dictionary with job details.
-        - saving_path (str): Directory where the Parquet file will be saved.
+        - saving_path (str): Root directory of the job dataset.
+
+        Returns:
+        - List[str]: Paths of the written Parquet files.
         """
         df = pd.DataFrame(job_listings_full)
-        current_datetime = datetime.now()
-        formatted_date_hour = current_datetime.strftime("%Y-%m-%d_%H")
-        directory = os.path.join(saving_path, f"parquet_files/{formatted_date_hour}")
-        os.makedirs(directory, exist_ok=True)
-
-        file_path = os.path.join(directory, f"data_{formatted_date_hour}.parquet")
-
-        df.to_parquet(file_path, engine="pyarrow")
+        file_paths = JobDataset(saving_path).write(df)
+        if self.seen_index is not None:
+            self.seen_index.add_many(
+                [parse_job_id(job_data["job_url"]) for job_data in job_listings_full]
+            )
 
-        print(f"Parquet file saved successfully at: {file_path}")
+        print(f"Parquet files saved successfully at: {file_paths}")
+        return file_paths